@@ -0,0 +1,100 @@
+# ------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# ------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# ------------------------------------------------------------------------------
+
+""" Benchmark of the WCS 2.0 GetCoverage KVP decoding: the single pass
+    scanner of the :class:`KVPGetCoverageDecoder` against the previous per
+    item regular expression parsing.
+
+    Run from the repository root with ``python -m benchmarks.bench_wcs_kvp``.
+"""
+
+from timeit import repeat
+
+from ows import kvp
+from ows.decoder import typelist
+from ows.wcs.v20.decoders import (
+    KVPGetCoverageDecoder, parse_subset_kvp, parse_scaleaxis_kvp,
+    parse_scalesize_kvp, parse_scaleextent_kvp
+)
+
+
+class LegacyKVPGetCoverageDecoder(KVPGetCoverageDecoder):
+    subsets = kvp.Parameter("subset", type=parse_subset_kvp, num="*")
+    scaleaxes = kvp.Parameter("scaleaxes", type=typelist(parse_scaleaxis_kvp, ","), default_factory=list, num="?")  # noqa
+    scalesize = kvp.Parameter("scalesize", type=typelist(parse_scalesize_kvp, ","), default_factory=list, num="?")  # noqa
+    scaleextent = kvp.Parameter("scaleextent", type=typelist(parse_scaleextent_kvp, ","), default_factory=list, num="?")  # noqa
+
+    def collect_params(self):
+        params = super(KVPGetCoverageDecoder, self).collect_params()
+        params.setdefault('axis_interpolations', [])
+        return params
+
+
+def make_request(num_subsets):
+    return '&'.join([
+        'service=WCS&version=2.0.1&request=GetCoverage&coverageid=a',
+        'scaleaxes=x(0.5),y(0.5)&scalesize=time(100)',
+        'scaleextent=x(0:100),y(0:200)',
+    ] + [
+        f'subset=axis{i}({i}.5,{i + 1}.5)'
+        for i in range(num_subsets)
+    ])
+
+
+def bench(decoder_class, params, number):
+    return min(repeat(
+        lambda: decoder_class(params).decode(), number=number, repeat=5
+    )) / number
+
+
+def main():
+    for num_subsets in (1, 10, 50):
+        params = [
+            tuple(item.split('=', 1))
+            for item in make_request(num_subsets).split('&')
+        ]
+        # pre-group the values, as a web framework would do
+        grouped = {}
+        for key, value in params:
+            grouped.setdefault(key, []).append(value)
+        params = list(grouped.items())
+
+        assert LegacyKVPGetCoverageDecoder(params).decode() == \
+            KVPGetCoverageDecoder(params).decode()
+
+        legacy = bench(LegacyKVPGetCoverageDecoder, params, 2000)
+        scanner = bench(KVPGetCoverageDecoder, params, 2000)
+        print(
+            f'{num_subsets:3d} subsets: '
+            f'regex {legacy * 1e6:8.1f} us, '
+            f'scanner {scanner * 1e6:8.1f} us, '
+            f'speedup {legacy / scanner:.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# ------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# ------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# ------------------------------------------------------------------------------
+
+
+""" Benchmark of the WMS capabilities encoding of a large layer tree: the
+    element tree based encoder against the streaming one.
+
+    Run from the repository root with
+    ``python -m benchmarks.bench_wms_capabilities``.
+"""
+
+from timeit import repeat
+
+from ows.wms.types import ServiceCapabilities, Layer, Style, Dimension
+from ows.wms.v11 import encoders as v11
+from ows.wms.v13 import encoders as v13
+
+
+def make_capabilities(groups=200, layers_per_group=100):
+    styles = [Style(name=f'style{i}', title=f'Style {i}') for i in range(5)]
+    dimension = Dimension(
+        name='time', units='ISO8601', default='current',
+        values='2000-01-01/2020-01-01/P1D',
+    )
+    root = Layer(title='root', crss=['EPSG:4326', 'EPSG:3857'], layers=[
+        Layer(title=f'group {i}', layers=[
+            Layer(
+                name=f'layer{i}_{j}', title=f'Layer {i} {j}',
+                abstract='A layer', keywords=['a', 'b'],
+                styles=styles, dimensions=[dimension],
+            )
+            for j in range(layers_per_group)
+        ])
+        for i in range(groups)
+    ])
+    return ServiceCapabilities.with_defaults(
+        'http://provider.org', ['image/png'], ['text/xml'], layer=root
+    )
+
+
+def bench(func, number=3):
+    return min(repeat(func, number=number, repeat=3)) / number
+
+
+def main():
+    capabilities = make_capabilities()
+    for name, module in (('1.1.1', v11), ('1.3.0', v13)):
+        def encode():
+            return module.xml_encode_capabilities(
+                capabilities, encoding='utf-8'
+            ).value
+
+        def stream():
+            return b''.join(
+                module.xml_stream_capabilities(capabilities).value
+            )
+
+        assert encode() == stream()
+        time_tree = bench(encode)
+        time_stream = bench(stream)
+        print(
+            f'{name}: tree {time_tree * 1e3:8.1f} ms, '
+            f'stream {time_stream * 1e3:8.1f} ms, '
+            f'ratio {time_tree / time_stream:.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# ------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# ------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# ------------------------------------------------------------------------------
+
+
+""" Benchmark of the WMS KVP decoding: the WMS 1.1.1 decoders, which are
+    derived from the WMS 1.3 ones, against the WMS 1.3 decoders.
+
+    Run from the repository root with ``python -m benchmarks.bench_wms_kvp``.
+"""
+
+from timeit import repeat
+
+from ows.wms.v11 import decoders as v11
+from ows.wms.v13 import decoders as v13
+
+
+COMMON = (
+    'service=WMS&layers=a,b,c&styles=s1,s2,&width=256&height=256'
+    '&format=image/png&transparent=TRUE&time=2012-01-01T00:00:00Z'
+    '&elevation=100&dim_band=1,2'
+)
+
+REQUESTS = {
+    'GetMap': (
+        v11.KVPGetMapDecoder,
+        f'{COMMON}&version=1.1.1&request=GetMap&srs=EPSG:4326'
+        '&bbox=-180,-90,0,90',
+        v13.KVPGetMapDecoder,
+        f'{COMMON}&version=1.3.0&request=GetMap&crs=EPSG:4326'
+        '&bbox=-90,-180,90,0',
+    ),
+    'GetFeatureInfo': (
+        v11.KVPGetFeatureInfoDecoder,
+        f'{COMMON}&version=1.1.1&request=GetFeatureInfo&srs=EPSG:4326'
+        '&bbox=-180,-90,0,90&query_layers=a&info_format=text/html&x=1&y=2',
+        v13.KVPGetFeatureInfoDecoder,
+        f'{COMMON}&version=1.3.0&request=GetFeatureInfo&crs=EPSG:4326'
+        '&bbox=-90,-180,90,0&query_layers=a&info_format=text/html&i=1&j=2',
+    ),
+}
+
+
+def bench(decoder_class, params, number):
+    return min(repeat(
+        lambda: decoder_class(params).decode(), number=number, repeat=5
+    )) / number
+
+
+def main():
+    for name, (decoder11, params11, decoder13, params13) in REQUESTS.items():
+        decoded11 = decoder11(params11).decode()
+        decoded13 = decoder13(params13).decode()
+        assert decoded11.bounding_box == decoded13.bounding_box
+
+        time11 = bench(decoder11, params11, 5000)
+        time13 = bench(decoder13, params13, 5000)
+        print(
+            f'{name:>14}: '
+            f'1.1.1 {time11 * 1e6:8.1f} us, '
+            f'1.3.0 {time13 * 1e6:8.1f} us, '
+            f'ratio {time11 / time13:.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+# ------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# ------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# ------------------------------------------------------------------------------
+
+
+""" Benchmark of the decoding of WPS 2.0 Execute requests with many inputs:
+    the direct element walk of ``parse_data_input`` against the previous
+    decoder instance per wps:Input, wps:Data and wps:Reference element.
+
+    Run from the repository root with ``python -m benchmarks.bench_wps_execute``.
+"""
+
+from timeit import repeat
+
+from ows import xml
+from ows.common.types import BoundingBox
+from ows.wps.v20.namespaces import nsmap, ns_wps
+from ows.wps.v20.decoders import (
+    XMLExecuteDecoder, XMLInputDecoder, XMLReferenceDecoder,
+    RE_BBOX_VALUE, RE_LITERAL_VALUE, xml_decode_execute
+)
+from ows.wps.v20.types import Data, Input, LiteralValue
+
+
+class XMLDataDecoder(xml.Decoder):
+    mime_type = xml.Parameter('@mimeType', num='?')
+    encoding = xml.Parameter('@encoding', num='?')
+    schema = xml.Parameter('@schema', num='?')
+
+
+def legacy_parse_data(data_elem):
+    decoder = XMLDataDecoder(data_elem)
+    if len(data_elem) == 0:
+        text = data_elem.text
+        bbox_match = RE_BBOX_VALUE.match(text)
+        literal_match = RE_LITERAL_VALUE.match(text)
+        if bbox_match:
+            groups = bbox_match.groups()
+            value = BoundingBox(
+                groups[4], [float(v) for v in groups[:4] if v is not None]
+            )
+        elif literal_match:
+            raw_value, data_type, uom = literal_match.groups()
+            value = LiteralValue(
+                raw_value.strip(),
+                data_type.strip() if data_type else None,
+                uom.strip() if uom else None
+            )
+        else:
+            value = text
+    elif len(data_elem) == 1 and data_elem[0].tag == ns_wps('LiteralValue'):
+        child = data_elem[0]
+        value = LiteralValue(
+            child.text, child.attrib.get('dataType'), child.attrib.get('uom')
+        )
+    elif len(data_elem) == 1:
+        child = data_elem[0]
+        lower = child.xpath('ows:LowerCorner', namespaces=nsmap)[0].text
+        upper = child.xpath('ows:UpperCorner', namespaces=nsmap)[0].text
+        value = BoundingBox(child.attrib.get('crs'), [
+            float(v) for v in lower.split() + upper.split()
+        ])
+    else:
+        value = list(data_elem)
+    return Data(
+        value=value, mime_type=decoder.mime_type, encoding=decoder.encoding,
+        schema=decoder.schema,
+    )
+
+
+def legacy_parse_data_input(input_elem):
+    decoder = LegacyXMLInputDecoder(input_elem)
+    return Input(
+        identifier=decoder.identifier,
+        data=decoder.data or decoder.reference,
+        inputs=list(decoder.inputs) if decoder.inputs else None,
+    )
+
+
+class LegacyXMLInputDecoder(XMLInputDecoder):
+    data = xml.Parameter('wps:Data', type=legacy_parse_data, num='?')
+    reference = xml.Parameter(
+        'wps:Reference',
+        type=lambda elem: XMLReferenceDecoder(elem).decode(), num='?'
+    )
+    inputs = xml.Parameter('wps:Input', type=legacy_parse_data_input, num='*')
+
+
+class LegacyXMLExecuteDecoder(XMLExecuteDecoder):
+    inputs = xml.Parameter('wps:Input', type=legacy_parse_data_input, num='*')
+
+
+INPUTS = [
+    '<wps:Input id="LITERAL_{i}"><wps:Data>{i}.5@uom=meter</wps:Data></wps:Input>',
+    '<wps:Input id="BBOX_{i}"><wps:Data>{i},0,{i}.5,1,EPSG:4326</wps:Data></wps:Input>',
+    '<wps:Input id="XML_{i}"><wps:Data><wps:LiteralValue dataType="xs:double">'
+    '{i}</wps:LiteralValue></wps:Data></wps:Input>',
+    '<wps:Input id="XML_BBOX_{i}"><wps:Data><ows:BoundingBox crs="EPSG:4326">'
+    '<ows:LowerCorner>0 {i}</ows:LowerCorner><ows:UpperCorner>1 {i}.5'
+    '</ows:UpperCorner></ows:BoundingBox></wps:Data></wps:Input>',
+    '<wps:Input id="REFERENCE_{i}"><wps:Reference mimeType="text/csv" '
+    'xlink:href="http://example.com/{i}.csv"/></wps:Input>',
+]
+
+
+def make_request(num_inputs):
+    return ''.join([
+        '<wps:Execute xmlns:wps="http://www.opengis.net/wps/2.0" '
+        'xmlns:ows="http://www.opengis.net/ows/2.0" '
+        'xmlns:xlink="http://www.w3.org/1999/xlink" service="WPS" '
+        'version="2.0.0" response="document" mode="sync">',
+        '<ows:Identifier>test</ows:Identifier>',
+    ] + [
+        INPUTS[i % len(INPUTS)].format(i=i) for i in range(num_inputs)
+    ] + [
+        '<wps:Output id="OUTPUT" transmission="value"/>',
+        '</wps:Execute>',
+    ]).encode('utf-8')
+
+
+def bench(function, number):
+    return min(repeat(function, number=number, repeat=5)) / number
+
+
+def main():
+    for num_inputs in (10, 100, 1000):
+        request = make_request(num_inputs)
+        assert LegacyXMLExecuteDecoder(request).decode() == \
+            xml_decode_execute(request)
+
+        number = max(10000 // num_inputs, 5)
+        legacy = bench(
+            lambda: LegacyXMLExecuteDecoder(request).decode(), number
+        )
+        fast = bench(lambda: xml_decode_execute(request), number)
+        print(
+            f'{num_inputs:5d} inputs: '
+            f'decoders {legacy * 1e3:8.2f} ms, '
+            f'element walk {fast * 1e3:8.2f} ms, '
+            f'speedup {legacy / fast:.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,309 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" Canonical cache keys for map, feature info and coverage requests and a
+    size bounded in-process cache for their results.
+
+    Equivalent requests, differing only in float formatting, parameter
+    case, implicit defaults or the order of dimensions, subsets and scales,
+    share the same key.
+"""
+
+from collections import OrderedDict
+from dataclasses import astuple, fields
+from datetime import date, datetime
+from hashlib import blake2b
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable, List
+
+from .crs import normalize_crs
+from .util import UTC, month, year, isoformat, duration
+from .wms.types import GetMapRequest, GetFeatureInfoRequest, Range
+from .wcs.v20.types import GetCoverageRequest, RangeInterval
+
+
+# number of decimal places coordinates and other floats are quantized to
+DEFAULT_PRECISION = 7
+
+KEY_SIZE = 16
+SEPARATOR = '\x1f'
+
+
+def quantize_number(value, precision: int) -> str:
+    """ A number rounded to ``precision`` decimal places, as an integer
+        string, or an empty string for ``None``.
+    """
+    if value is None:
+        return ''
+    return str(round(float(value) * 10 ** precision))
+
+
+def canonical_crs(crs: str) -> str:
+    """ The normalized form of a CRS identifier, or an empty string.
+    """
+    return normalize_crs(crs) or ''
+
+
+def _value(value, precision: int) -> str:
+    if value is None:
+        return ''
+    elif isinstance(value, Range):
+        return '/'.join([
+            _value(value.start, precision),
+            _value(value.stop, precision),
+            _value(value.resolution, precision),
+        ])
+    elif isinstance(value, datetime):
+        if value.utcoffset() is not None:
+            value = value.astimezone(UTC)
+        return isoformat(value.replace(tzinfo=None))
+    elif isinstance(value, (date, month, year)):
+        return value.isoformat()
+    elif isinstance(value, (int, float)):
+        return quantize_number(value, precision)
+    elif hasattr(value, 'total_seconds'):
+        return duration(value)
+    return str(value)
+
+
+def _dimension(value, precision: int) -> str:
+    if isinstance(value, list):
+        return ','.join(_value(item, precision) for item in value)
+    return _value(value, precision)
+
+
+def _fields(obj, precision: int) -> str:
+    """ Serialize the fields of a subset or scale dataclass, except the
+        first one, which is the axis.
+    """
+    return ','.join(
+        _value(getattr(obj, field.name), precision)
+        for field in fields(obj)[1:]
+    )
+
+
+def _get_map_parts(request: GetMapRequest, precision: int) -> List[str]:
+    styles = request.styles or ()
+    styles = [style or '' for style in styles]
+    styles += [''] * (len(request.layers) - len(styles))
+
+    return [
+        'GetMap',
+        str(request.version),
+        ','.join(request.layers),
+        ','.join(styles),
+        canonical_crs(request.crs),
+        ','.join(quantize_number(v, precision) for v in request.bbox),
+        str(request.width),
+        str(request.height),
+        request.format.lower(),
+        'T' if request.transparent else 'F',
+        (request.background_color or '0xFFFFFF').upper().replace('#', '0X'),
+        _dimension(request.time, precision),
+        _dimension(request.elevation, precision),
+        ';'.join(
+            f'{name.lower()}={_dimension(value, precision)}'
+            for name, value in sorted(
+                request.dimensions.items(), key=lambda i: i[0].lower()
+            )
+        ),
+    ]
+
+
+def _get_feature_info_parts(request: GetFeatureInfoRequest,
+                            precision: int) -> List[str]:
+    parts = _get_map_parts(request, precision)
+    parts[0] = 'GetFeatureInfo'
+    return parts + [
+        ','.join(request.query_layers),
+        request.info_format.lower(),
+        str(request.i),
+        str(request.j),
+        str(request.feature_count or 1),
+    ]
+
+
+def _get_coverage_parts(request: GetCoverageRequest,
+                        precision: int) -> List[str]:
+    subsets = sorted(
+        (subset.dimension, type(subset).__name__, _fields(subset, precision))
+        for subset in request.subsets
+    )
+    scales = sorted(
+        (scale.axis, type(scale).__name__, _fields(scale, precision))
+        for scale in request.scales
+    )
+    range_subset = request.range_subset
+    if range_subset is not None:
+        range_subset = ','.join(
+            f'{item.start}:{item.end}' if isinstance(item, RangeInterval)
+            else item
+            for item in range_subset
+        )
+    geotiff = request.geotiff_encoding_parameters
+
+    return [
+        'GetCoverage',
+        str(request.version),
+        request.coverage_id,
+        (request.format or '').lower(),
+        (request.mediatype or '').lower(),
+        canonical_crs(request.subsetting_crs),
+        canonical_crs(request.output_crs),
+        ';'.join(':'.join(subset) for subset in subsets),
+        quantize_number(request.scalefactor, precision),
+        ';'.join(':'.join(scale) for scale in scales),
+        request.interpolation or '',
+        ';'.join(sorted(
+            f'{item.axis}:{item.method}'
+            for item in request.axis_interpolations
+        )),
+        '' if range_subset is None else f'[{range_subset}]',
+        ','.join(_value(v, precision) for v in astuple(geotiff)),
+    ]
+
+
+CANONICALIZERS = {
+    GetMapRequest: _get_map_parts,
+    GetFeatureInfoRequest: _get_feature_info_parts,
+    GetCoverageRequest: _get_coverage_parts,
+}
+
+
+def canonical_form(request, precision: int = DEFAULT_PRECISION) -> bytes:
+    """ The canonical, human readable serialization of a request. Floats
+        are quantized to ``precision`` decimal places. Parameters that only
+        affect error reporting, like ``exceptions``, are not included.
+    """
+    try:
+        canonicalize = CANONICALIZERS[type(request)]
+    except KeyError:
+        raise TypeError(
+            f'Cannot canonicalize {type(request).__name__} objects'
+        ) from None
+    return SEPARATOR.join(canonicalize(request, precision)).encode('utf-8')
+
+
+def cache_key(request, precision: int = DEFAULT_PRECISION) -> bytes:
+    """ A compact, stable key for a request: a digest of its
+        :func:`canonical_form`.
+    """
+    return blake2b(
+        canonical_form(request, precision), digest_size=KEY_SIZE
+    ).digest()
+
+
+def map_key(request, precision: int = DEFAULT_PRECISION) -> bytes:
+    """ The key of the map a GetMap or GetFeatureInfo request refers to.
+        GetFeatureInfo requests on the same map share it, and it is equal
+        to the :func:`cache_key` of the GetMap request of that map.
+    """
+    return blake2b(
+        SEPARATOR.join(_get_map_parts(request, precision)).encode('utf-8'),
+        digest_size=KEY_SIZE
+    ).digest()
+
+
+class ResultCache:
+    """ An in-process, thread safe LRU cache, bounded by the total size of
+        the cached values as calculated by ``sizeof``. Values larger than
+        the whole cache are not stored. With a ``ttl`` (in seconds), values
+        also expire after that time.
+    """
+
+    def __init__(self, max_size: int, sizeof: Callable[[Any], int] = len,
+                 ttl: float = None):
+        self.max_size = max_size
+        self.sizeof = sizeof
+        self.ttl = ttl
+        self.size = 0
+        self._items = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            try:
+                value, _, expires = self._items[key]
+            except KeyError:
+                return default
+            if expires is not None and expires <= monotonic():
+                self._discard(key)
+                return default
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value) -> bool:
+        """ Store a value, evicting the least recently used ones as
+            necessary. Returns whether the value was stored.
+        """
+        size = self.sizeof(value)
+        with self._lock:
+            self._discard(key)
+            if size > self.max_size:
+                return False
+
+            expires = monotonic() + self.ttl if self.ttl is not None else None
+            self._items[key] = (value, size, expires)
+            self.size += size
+            while self.size > self.max_size:
+                _, (_, evicted_size, _) = self._items.popitem(last=False)
+                self.size -= evicted_size
+            return True
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]):
+        """ Return the cached value for the key or create and store it.
+            Concurrent misses for the same key may call the factory more
+            than once.
+        """
+        marker = object()
+        value = self.get(key, marker)
+        if value is marker:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def _discard(self, key: Hashable):
+        item = self._items.pop(key, None)
+        if item is not None:
+            self.size -= item[1]
+
+    def discard(self, key: Hashable):
+        with self._lock:
+            self._discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,152 @@
+# ------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# ------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# ------------------------------------------------------------------------------
+
+from datetime import datetime, date
+
+import pytest
+from lxml import etree
+
+from ows.test import assert_xml_equal
+from ows.gml.types import Grid, RegularAxis, IrregularAxis
+from ows.swe.types import Field
+from .v11 import (
+    encode_axis, encode_envelope, encode_range_set, iter_encode_range_set
+)
+
+np = pytest.importorskip('numpy')
+
+
+def test_irregular_axis_array():
+    positions = [
+        datetime(2019, 7, 18),
+        datetime(2019, 7, 19, 12),
+        datetime(2019, 7, 21),
+    ]
+    list_axis = IrregularAxis('time', 'k', positions, uom='ISO8601')
+    array_axis = IrregularAxis(
+        'time', 'k', np.array(positions, dtype='datetime64[us]'),
+        uom='ISO8601'
+    )
+
+    assert array_axis.size == 3
+    assert array_axis.limits == list_axis.limits
+    for value in positions + [datetime(2019, 7, 20), datetime(2020, 1, 1)]:
+        assert array_axis.search(value) == list_axis.search(value)
+        assert array_axis.search(value, 'right') == \
+            list_axis.search(value, 'right')
+
+
+def test_encode_irregular_axis_array():
+    positions = [
+        datetime(2019, 7, 18),
+        datetime(2019, 7, 19, 12),
+        datetime(2019, 7, 21),
+    ]
+    for array in [
+        np.array(positions, dtype='datetime64[us]'),
+        np.array(positions, dtype='datetime64[s]'),
+        np.array(positions, dtype='datetime64[h]'),
+    ]:
+        assert_xml_equal(
+            etree.tostring(
+                encode_axis(IrregularAxis('time', 'k', array, 'ISO8601'))
+            ),
+            etree.tostring(
+                encode_axis(IrregularAxis('time', 'k', positions, 'ISO8601'))
+            ),
+        )
+        grid = Grid([IrregularAxis('time', 'k', array, 'ISO8601')], 'Index')
+        assert_xml_equal(
+            etree.tostring(encode_envelope(grid)),
+            etree.tostring(encode_envelope(
+                Grid([IrregularAxis('time', 'k', positions, 'ISO8601')], 'Index')
+            )),
+        )
+
+    # sub-second precision
+    positions = [datetime(2019, 7, 18), datetime(2019, 7, 18, 0, 0, 0, 500)]
+    elem = encode_axis(IrregularAxis(
+        'time', 'k', np.array(positions, dtype='datetime64[us]'), 'ISO8601'
+    ))
+    assert [c.text for c in elem] == [
+        '2019-07-18T00:00:00.000000Z', '2019-07-18T00:00:00.000500Z'
+    ]
+
+    # dates
+    positions = [date(2019, 7, 18), date(2019, 7, 19)]
+    elem = encode_axis(IrregularAxis(
+        'time', 'k', np.array(positions, dtype='datetime64[D]'), 'ISO8601'
+    ))
+    assert [c.text for c in elem] == ['2019-07-18', '2019-07-19']
+
+    # numbers
+    positions = [0.1, 2.5, 1e20]
+    elem = encode_axis(
+        IrregularAxis('height', 'k', np.array(positions), 'm')
+    )
+    assert [c.text for c in elem] == [str(v) for v in positions]
+
+
+def test_encode_range_set():
+    grid = Grid([
+        RegularAxis('x', 'i', 0.0, 3.0, 1.0, 'm', 3),
+        RegularAxis('y', 'j', 0.0, 2.0, 1.0, 'm', 2),
+    ], 'EPSG:4326')
+    range_type = [
+        Field('B01', '', 'W.m-2.sr-1.nm-1'),
+        Field('B02', '', 'W.m-2.sr-1.nm-1', significant_figures=2),
+    ]
+    values = np.arange(12, dtype='float64').reshape(3, 2, 2) / 4
+
+    assert_xml_equal(etree.tostring(encode_range_set(values, grid, range_type)), '''
+        <cis:RangeSet xmlns:cis="http://www.opengis.net/cis/1.1/gml">
+            <cis:DataBlock>
+                <cis:V>0.0 0.25</cis:V>
+                <cis:V>0.5 0.75</cis:V>
+                <cis:V>1.0 1.2</cis:V>
+                <cis:V>1.5 1.8</cis:V>
+                <cis:V>2.0 2.2</cis:V>
+                <cis:V>2.5 2.8</cis:V>
+            </cis:DataBlock>
+        </cis:RangeSet>
+    ''')
+
+    # streamed output is the same, regardless of the chunk size
+    assert b''.join(iter_encode_range_set(values, grid, range_type, 4)) == \
+        etree.tostring(encode_range_set(values, grid, range_type))
+
+    # single field range types do not require the component dimension
+    single = encode_range_set(
+        np.arange(6, dtype='uint16').reshape(3, 2), grid, range_type[:1]
+    )
+    assert [v.text for v in single[0]] == ['0', '1', '2', '3', '4', '5']
+
+    with pytest.raises(ValueError):
+        iter_encode_range_set(values[:2], grid, range_type)
+
+    with pytest.raises(ValueError):
+        iter_encode_range_set(values[..., 0], grid, range_type)
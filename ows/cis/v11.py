@@ -26,12 +26,22 @@
 # -------------------------------------------------------------------------------
 
 from datetime import datetime, date, timedelta
-from typing import List, Union
+from typing import List, Union, Iterator
 from dataclasses import dataclass
 
-from ows.xml import ElementMaker, NameSpace, NameSpaceMap
-from ows.util import isoformat
-from ows.swe.v20 import Field, encode_data_record
+from lxml import etree
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ows.xml import (
+    ElementMaker, NameSpace, NameSpaceMap, Element, stream_element
+)
+from ows.util import isoformat, is_ndarray
+from ows.swe.v20 import (
+    Field, encode_data_record, iter_encode_tuples, DEFAULT_CHUNK_SIZE
+)
 from ows.gml.types import (
     PositionType, AxisType,
     Grid, IndexAxis, RegularAxis, IrregularAxis
@@ -53,20 +63,36 @@ def encode_position_value(value: PositionType):
     return str(value)
 
 
+def encode_position_values(positions) -> List[str]:
+    """ Encode all positions of an axis to strings. NumPy arrays of numbers
+        or ``datetime64`` values are formatted in bulk, all other sequences
+        value by value.
+    """
+    if is_ndarray(positions) and positions.dtype.kind in 'iufM':
+        if positions.dtype.kind == 'M':
+            unit, _ = np.datetime_data(positions.dtype)
+            if unit in ('Y', 'M', 'W', 'D'):
+                return np.datetime_as_string(positions).tolist()
+
+            # only use sub-second precision when actually required, as
+            # `isoformat` would do
+            if not (positions != positions.astype('datetime64[s]')).any():
+                unit = 's'
+            return np.datetime_as_string(
+                positions, unit=unit, timezone='UTC'
+            ).tolist()
+        return positions.astype(str).tolist()
+
+    return [encode_position_value(position) for position in positions]
+
+
 def encode_axis_extent(axis: AxisType):
+    lower_bound, upper_bound = axis.limits
     return CIS('AxisExtent',
         axisLabel=axis.label,
         uomLabel=axis.uom,
-        lowerBound=encode_position_value(
-            axis.lower_bound
-            if isinstance(axis, RegularAxis) else
-            axis.positions[0]
-        ),
-        upperBound=encode_position_value(
-            axis.upper_bound
-            if isinstance(axis, RegularAxis) else
-            axis.positions[-1]
-        ),
+        lowerBound=encode_position_value(lower_bound),
+        upperBound=encode_position_value(upper_bound),
     )
 
 
@@ -91,14 +117,35 @@ def encode_axis(axis: AxisType):
             upperBound=encode_position_value(axis.upper_bound),
         )
     else:
-        return CIS('IrregularAxis',
-            *[
-                CIS('C', encode_position_value(position))
-                for position in axis.positions
-            ],
+        elem = CIS('IrregularAxis',
             axisLabel=axis.label,
             uomLabel=axis.uom,
         )
+        elem.extend(encode_coefficients(axis.positions))
+        return elem
+
+
+def encode_coefficients(positions) -> List[Element]:
+    """ Encode the ``cis:C`` elements of an irregular axis. For NumPy
+        arrays the values are joined to a single fragment and parsed in one
+        go, which is considerably faster than creating each element
+        individually for large axes.
+    """
+    if is_ndarray(positions) and positions.dtype.kind in 'iufM':
+        values = encode_position_values(positions)
+        if not values:
+            return []
+        fragment = etree.fromstring(''.join([
+            f'<cis:IrregularAxis xmlns:cis="{ns_cis.uri}"><cis:C>',
+            '</cis:C><cis:C>'.join(values),
+            '</cis:C></cis:IrregularAxis>',
+        ]))
+        return list(fragment)
+
+    return [
+        CIS('C', encode_position_value(position))
+        for position in positions
+    ]
 
 
 def encode_domain_set(grid: Grid):
@@ -135,3 +182,38 @@ def encode_range_type(range_type: List[Field]):
     return CIS('RangeType',
         encode_data_record(range_type)
     )
+
+
+def iter_encode_range_set(values: 'np.ndarray', grid: Grid,
+                          range_type: List[Field],
+                          chunk_size: int = DEFAULT_CHUNK_SIZE,
+                          **kwargs) -> Iterator[bytes]:
+    """ Encode the values of a coverage as a ``cis:RangeSet`` with a
+        ``cis:DataBlock``. Each grid point is encoded as a ``cis:V`` element,
+        with its components separated by spaces. The values array must have
+        the shape of the grid with an additional trailing dimension for the
+        range components (which can be omitted for single field range types).
+        The values are written in the order of the array.
+
+        The range set is encoded lazily in chunks of ``chunk_size`` values.
+    """
+    chunks = iter_encode_tuples(
+        values, range_type, ' ', grid.shape, chunk_size
+    )
+    data_block = CIS('DataBlock')
+    return stream_element(CIS('RangeSet', data_block), data_block, (
+        ''.join([
+            '<cis:V>', '</cis:V><cis:V>'.join(tuples), '</cis:V>'
+        ]).encode('utf-8')
+        for tuples in chunks
+    ), **kwargs)
+
+
+def encode_range_set(values: 'np.ndarray', grid: Grid,
+                     range_type: List[Field]) -> Element:
+    """ Encode the values of a coverage as a ``cis:RangeSet`` element. See
+        :func:`iter_encode_range_set` for details.
+    """
+    return etree.fromstring(
+        b''.join(iter_encode_range_set(values, grid, range_type))
+    )
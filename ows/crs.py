@@ -0,0 +1,190 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" Parsing and normalization of CRS identifiers. The identifier forms used
+    throughout the OGC services, like ``EPSG:4326``,
+    ``urn:ogc:def:crs:EPSG::4326`` or
+    ``http://www.opengis.net/def/crs/EPSG/0/4326``, are all parsed to the same
+    (interned) :class:`CRS` object. Parsing is memoized, so that every
+    distinct identifier string is only parsed once.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+import re
+from typing import Dict, Optional, Tuple
+
+
+CRS_RES = [
+    # EPSG:4326, CRS:84
+    re.compile(r'(?P<authority>EPSG|CRS|OGC):(?P<code>[0-9A-Z]+)$', re.I),
+    # urn:ogc:def:crs:EPSG::4326, urn:ogc:def:crs:EPSG:6.6:4326,
+    # urn:x-ogc:def:crs:EPSG:4326, urn:ogc:def:crs:OGC:1.3:CRS84
+    re.compile(
+        r'urn:(?:x-)?ogc:def:crs:(?P<authority>[A-Z]+):'
+        r'(?:[0-9.]*:)?(?P<code>[0-9A-Z]+)$', re.I
+    ),
+    # http://www.opengis.net/def/crs/EPSG/0/4326
+    re.compile(
+        r'https?://www\.opengis\.net/def/crs/(?P<authority>[A-Z]+)/'
+        r'[0-9.]+/(?P<code>[0-9A-Z]+)$', re.I
+    ),
+    # http://www.opengis.net/gml/srs/epsg.xml#4326
+    re.compile(
+        r'https?://www\.opengis\.net/gml/srs/(?P<authority>epsg)\.xml#'
+        r'(?P<code>[0-9]+)$', re.I
+    ),
+]
+
+# ranges of EPSG codes of CRSs with northing/latitude first axis order
+SWAPPED_AXIS_ORDER_RANGES = (
+    (2036, 2036), (2044, 2045), (2081, 2083), (2085, 2086), (2093, 2093),
+    (2096, 2098), (2105, 2132), (2169, 2170), (2176, 2180), (2193, 2193),
+    (2200, 2200), (2206, 2212), (2319, 2462), (2523, 2549), (2551, 2735),
+    (2738, 2758), (2935, 2941), (2953, 2953), (3006, 3030), (3034, 3035),
+    (3058, 3059), (3068, 3068), (3114, 3118), (3126, 3138), (3300, 3301),
+    (3328, 3335), (3346, 3346), (3350, 3352), (3366, 3366), (3416, 3416),
+    (4001, 4999), (20004, 20032), (20064, 20092), (21413, 21423),
+    (21473, 21483), (21896, 21899), (22171, 22171), (22181, 22187),
+    (22191, 22197), (25884, 25884), (27205, 27232), (27391, 27398),
+    (27492, 27492), (28402, 28432), (28462, 28492), (30161, 30179),
+    (30800, 30800), (31251, 31259), (31275, 31279), (31281, 31290),
+    (31466, 31700),
+)
+_RANGE_STARTS = [start for start, _ in SWAPPED_AXIS_ORDER_RANGES]
+
+
+@dataclass(frozen=True)
+class CRS:
+    """ A parsed CRS identifier. Use :func:`parse_crs` to obtain instances,
+        which are shared among all identifiers of the same CRS.
+    """
+    authority: str
+    code: str
+
+    @property
+    def identifier(self) -> str:
+        """ The short ``AUTHORITY:CODE`` form, e.g ``EPSG:4326`` or
+            ``CRS:84``.
+        """
+        if self.authority == 'OGC' and self.code.startswith('CRS'):
+            return f'CRS:{self.code[3:]}'
+        return f'{self.authority}:{self.code}'
+
+    @property
+    def urn(self) -> str:
+        version = '1.3' if self.authority == 'OGC' else ''
+        return f'urn:ogc:def:crs:{self.authority}:{version}:{self.code}'
+
+    @property
+    def url(self) -> str:
+        version = '1.3' if self.authority == 'OGC' else '0'
+        return (
+            f'http://www.opengis.net/def/crs/{self.authority}/{version}/'
+            f'{self.code}'
+        )
+
+    @property
+    def epsg_code(self) -> Optional[int]:
+        return int(self.code) if self.authority == 'EPSG' else None
+
+    @property
+    def axis_order_swapped(self) -> bool:
+        """ Whether the axis order of the CRS is northing/latitude first,
+            as opposed to the traditional easting/longitude first order of
+            WMS 1.1 and earlier.
+        """
+        code = self.epsg_code
+        if code is None:
+            return False
+        index = bisect_right(_RANGE_STARTS, code) - 1
+        return index >= 0 and code <= SWAPPED_AXIS_ORDER_RANGES[index][1]
+
+    def __str__(self) -> str:
+        return self.identifier
+
+
+_INTERNED: Dict[Tuple[str, str], CRS] = {}
+
+
+@lru_cache(maxsize=1024)
+def parse_crs(identifier: str) -> Optional[CRS]:
+    """ Parse a CRS identifier in any of the supported forms. Returns
+        ``None`` for unrecognized identifiers.
+    """
+    identifier = identifier.strip()
+    for regex in CRS_RES:
+        match = regex.match(identifier)
+        if match:
+            break
+    else:
+        return None
+
+    authority = match.group('authority').upper()
+    code = match.group('code').upper()
+    if authority == 'CRS':
+        # "CRS:84" is the WMS short form of "OGC:CRS84"
+        authority, code = 'OGC', f'CRS{code}'
+    elif authority == 'EPSG':
+        code = str(int(code)) if code.isdigit() else code
+
+    key = (authority, code)
+    return _INTERNED.setdefault(key, CRS(authority, code))
+
+
+def normalize_crs(identifier: Optional[str]) -> Optional[str]:
+    """ The short ``AUTHORITY:CODE`` form of a CRS identifier. Unrecognized
+        identifiers are returned stripped, but otherwise unchanged.
+    """
+    if identifier is None:
+        return None
+    crs = parse_crs(identifier)
+    return crs.identifier if crs is not None else identifier.strip()
+
+
+def epsg_code(identifier: str) -> Optional[int]:
+    """ The EPSG code of a CRS identifier or ``None``.
+    """
+    crs = parse_crs(identifier)
+    return crs.epsg_code if crs is not None else None
+
+
+def is_axis_order_swapped(identifier: str) -> bool:
+    """ Whether the axis order of the CRS is northing/latitude first. See
+        :attr:`CRS.axis_order_swapped`.
+    """
+    crs = parse_crs(identifier)
+    return crs is not None and crs.axis_order_swapped
+
+
+def swap_axes(bbox):
+    """ Swap the x and y coordinates of a ``[minx, miny, maxx, maxy]``
+        bounding box.
+    """
+    return [bbox[1], bbox[0], bbox[3], bbox[2]]
@@ -387,15 +387,27 @@ class BaseDecoder:
         """
         return params
 
+    @classmethod
+    def parameter_names(cls):
+        """ The names of all parameters of the decoder class, i.e: its
+            properties. These are computed once per class.
+        """
+        names = cls.__dict__.get('_parameter_names')
+        if names is None:
+            names = tuple(
+                name for name in dir(cls)
+                if isinstance(getattr(cls, name, None), property)
+            )
+            cls._parameter_names = names
+        return names
+
     def collect_params(self):
         """ Collect all parameters. This will collect all values
             which are computed using properties.
         """
-        cls = type(self)
         return {
             name: getattr(self, name)
-            for name in dir(self)
-            if isinstance(getattr(cls, name, None), property)
+            for name in self.parameter_names()
         }
 
     def decode(self):
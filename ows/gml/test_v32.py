@@ -0,0 +1,60 @@
+# ------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# ------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# ------------------------------------------------------------------------------
+
+import pytest
+from lxml import etree
+
+from ows.test import assert_xml_equal
+from ows.swe.types import Field
+from .types import Grid, RegularAxis
+from .v32 import encode_range_set, iter_encode_range_set
+
+np = pytest.importorskip('numpy')
+
+
+def test_encode_range_set():
+    grid = Grid([
+        RegularAxis('x', 'i', 0.0, 2.0, 1.0, 'm', 2),
+        RegularAxis('y', 'j', 0.0, 2.0, 1.0, 'm', 2),
+    ], 'EPSG:4326')
+    range_type = [
+        Field('B01', '', 'W.m-2.sr-1.nm-1'),
+        Field('B02', '', 'W.m-2.sr-1.nm-1'),
+    ]
+    values = np.arange(8, dtype='int16').reshape(2, 2, 2)
+
+    assert_xml_equal(etree.tostring(encode_range_set(values, grid, range_type)), '''
+        <gml:rangeSet xmlns:gml="http://www.opengis.net/gml/3.2">
+            <gml:DataBlock>
+                <gml:rangeParameters/>
+                <gml:tupleList ts=" " cs=",">0,1 2,3 4,5 6,7</gml:tupleList>
+            </gml:DataBlock>
+        </gml:rangeSet>
+    ''')
+
+    assert b''.join(iter_encode_range_set(values, grid, range_type, 3)) == \
+        etree.tostring(encode_range_set(values, grid, range_type))
@@ -25,11 +25,14 @@
 # THE SOFTWARE.
 # ------------------------------------------------------------------------------
 
-from typing import Union, List, Tuple
+from bisect import bisect_left, bisect_right
+from typing import Union, List, Tuple, Sequence
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta
 from enum import Enum
 
+from ows.util import is_ndarray, to_datetime64, to_python
+
 
 PositionType = Union[str, int, float, datetime, date]
 ResolutionType = Union[str, int, float, timedelta]
@@ -69,9 +72,13 @@ class RegularAxis:
 
 @dataclass
 class IrregularAxis:
+    """ An axis with explicitly listed, sorted positions. The positions can
+        either be a list of values or a one dimensional NumPy array of
+        numbers or ``datetime64`` values.
+    """
     label: str
     index_label: str
-    positions: List[PositionType]
+    positions: Sequence[PositionType]
     uom: str
     type: SpatioTemporalType = SpatioTemporalType.SPATIAL
 
@@ -81,7 +88,22 @@ class IrregularAxis:
 
     @property
     def limits(self):
-        return self.positions[0], self.positions[-1]
+        return to_python(self.positions[0]), to_python(self.positions[-1])
+
+    def search(self, value: PositionType, side: str = 'left') -> int:
+        """ Find the index at which the given value would be inserted
+            into the positions to keep them sorted. ``side`` behaves as in
+            :func:`numpy.searchsorted`.
+        """
+        if is_ndarray(self.positions):
+            if self.positions.dtype.kind == 'M' and \
+                    isinstance(value, (datetime, date)):
+                value = to_datetime64(value)
+            return int(self.positions.searchsorted(value, side))
+
+        if side == 'right':
+            return bisect_right(self.positions, value)
+        return bisect_left(self.positions, value)
 
 
 AxisType = Union[IndexAxis, RegularAxis, IrregularAxis]
@@ -91,3 +113,7 @@ AxisType = Union[IndexAxis, RegularAxis, IrregularAxis]
 class Grid:
     axes: List[AxisType]
     srs: str
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(axis.size for axis in self.axes)
@@ -26,11 +26,17 @@
 # ------------------------------------------------------------------------------
 
 
-from typing import List
+from typing import List, Iterator
 
-from ows.xml import ElementMaker, NameSpace, NameSpaceMap, Element
+from lxml import etree
+
+from ows.xml import (
+    ElementMaker, NameSpace, NameSpaceMap, Element, stream_element
+)
 from ows.util import isoformat
-from ows.swe.v20 import Field, encode_data_record
+from ows.swe.v20 import (
+    Field, encode_data_record, iter_encode_tuples, DEFAULT_CHUNK_SIZE
+)
 from .types import Grid, RegularAxis, SpatioTemporalType
 
 
@@ -144,3 +150,45 @@ def encode_range_type(range_type: List[Field]) -> Element:
     return GMLCOV('rangeType',
         encode_data_record(range_type)
     )
+
+
+def _iter_tuple_list(chunks):
+    separator = ''
+    for tuples in chunks:
+        yield (separator + ' '.join(tuples)).encode('utf-8')
+        separator = ' '
+
+
+def iter_encode_range_set(values, grid: Grid, range_type: List[Field],
+                          chunk_size: int = DEFAULT_CHUNK_SIZE,
+                          **kwargs) -> Iterator[bytes]:
+    """ Encode the values of a coverage as a ``gml:rangeSet`` with a
+        ``gml:DataBlock``. The values are encoded in a ``gml:tupleList`` with
+        tuples separated by spaces and components separated by commas. The
+        values array must have the shape of the grid with an additional
+        trailing dimension for the range components (which can be omitted for
+        single field range types). The values are written in the order of
+        the array.
+
+        The range set is encoded lazily in chunks of ``chunk_size`` values.
+    """
+    chunks = iter_encode_tuples(
+        values, range_type, ',', grid.shape, chunk_size
+    )
+    tuple_list = GML('tupleList', ts=' ', cs=',')
+    root = GML('rangeSet',
+        GML('DataBlock',
+            GML('rangeParameters'),
+            tuple_list,
+        )
+    )
+    return stream_element(root, tuple_list, _iter_tuple_list(chunks), **kwargs)
+
+
+def encode_range_set(values, grid: Grid, range_type: List[Field]) -> Element:
+    """ Encode the values of a coverage as a ``gml:rangeSet`` element. See
+        :func:`iter_encode_range_set` for details.
+    """
+    return etree.fromstring(
+        b''.join(iter_encode_range_set(values, grid, range_type))
+    )
@@ -0,0 +1,200 @@
+# ------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# ------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# ------------------------------------------------------------------------------
+
+""" This module contains facilities to assemble streaming multipart responses.
+"""
+
+import os
+from io import UnsupportedOperation
+from stat import S_ISREG
+from dataclasses import dataclass, field
+from typing import (
+    BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Union
+)
+from uuid import uuid4
+
+from .util import Result
+
+
+CRLF = b'\r\n'
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# a payload is either a bytes-like object, a file descriptor, a binary file
+# object or an iterable of bytes-like objects
+PayloadType = Union[bytes, bytearray, memoryview, int, BinaryIO, Iterable[bytes]]
+
+
+def iter_payload(payload: PayloadType, chunk_size: int = DEFAULT_CHUNK_SIZE
+                 ) -> Iterator[Union[bytes, memoryview]]:
+    """ Iterate over the given payload in chunks without copying it into
+        intermediary bytes objects where possible:
+
+            - file descriptors are read from their current position until
+              their end
+            - bytes-like objects (including memory maps and NumPy arrays) are
+              yielded as :class:`memoryview` slices
+            - binary file objects are read until their end
+            - any other iterable is passed through
+    """
+    if isinstance(payload, int):
+        yield from iter(lambda: os.read(payload, chunk_size), b'')
+
+    elif _supports_buffer(payload):
+        view = memoryview(payload).cast('B')
+        for offset in range(0, len(view), chunk_size):
+            yield view[offset:offset + chunk_size]
+
+    elif hasattr(payload, 'read'):
+        yield from iter(lambda: payload.read(chunk_size), b'')
+
+    else:
+        yield from payload
+
+
+def _supports_buffer(payload) -> bool:
+    if isinstance(payload, (int, str)):
+        return False
+    try:
+        memoryview(payload)
+    except TypeError:
+        return False
+    return True
+
+
+def _remaining_size(fd: int, tell: Callable[[], int]) -> Optional[int]:
+    stat = os.fstat(fd)
+    if not S_ISREG(stat.st_mode):
+        return None
+    return stat.st_size - tell()
+
+
+def payload_size(payload: PayloadType) -> Optional[int]:
+    """ Determine the size of a payload in bytes without reading it. Returns
+        ``None`` if that is not possible, e.g: for iterators or pipes.
+    """
+    if isinstance(payload, int):
+        return _remaining_size(
+            payload, lambda: os.lseek(payload, 0, os.SEEK_CUR)
+        )
+    elif _supports_buffer(payload):
+        return memoryview(payload).nbytes
+    elif hasattr(payload, 'fileno') and hasattr(payload, 'tell'):
+        try:
+            return _remaining_size(payload.fileno(), payload.tell)
+        except (OSError, ValueError, UnsupportedOperation):
+            return None
+    return None
+
+
+@dataclass
+class Part:
+    """ A single part of a multipart message.
+
+        :param payload: the contents of the part, see :func:`iter_payload`
+        :param content_type: the MIME type of the part
+        :param content_id: the identifier of the part, which can be referenced
+                           using a ``cid:`` URL
+        :param headers: any additional headers of the part
+    """
+    payload: PayloadType
+    content_type: str
+    content_id: str = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def encode_headers(self) -> bytes:
+        headers = [('Content-Type', self.content_type)]
+        if self.content_id is not None:
+            headers.append(('Content-ID', f'<{self.content_id}>'))
+        headers.extend(self.headers.items())
+        return b''.join(
+            f'{name}: {value}'.encode('utf-8') + CRLF
+            for name, value in headers
+        ) + CRLF
+
+
+def generate_boundary() -> str:
+    return f'ows-{uuid4().hex}'
+
+
+def _encode_delimiters(parts: List[Part], boundary: str):
+    delimiter = b'--' + boundary.encode('ascii')
+    heads = [
+        (CRLF if i else b'') + delimiter + CRLF + part.encode_headers()
+        for i, part in enumerate(parts)
+    ]
+    return heads, CRLF + delimiter + b'--' + CRLF
+
+
+def iter_encode_multipart(parts: List[Part], boundary: str,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE
+                          ) -> Iterator[Union[bytes, memoryview]]:
+    """ Encode the given parts as a multipart message body. The delimiters and
+        headers of all parts are prepared before the first payload is read,
+        the payloads themselves are streamed.
+    """
+    heads, tail = _encode_delimiters(parts, boundary)
+
+    def _iter():
+        for head, part in zip(heads, parts):
+            yield head
+            yield from iter_payload(part.payload, chunk_size)
+        yield tail
+
+    return _iter()
+
+
+def content_length(parts: List[Part], boundary: str) -> Optional[int]:
+    """ Calculate the length of the encoded multipart message body, if the
+        sizes of all payloads can be determined in advance. Returns ``None``
+        otherwise.
+    """
+    sizes = [payload_size(part.payload) for part in parts]
+    if None in sizes:
+        return None
+
+    heads, tail = _encode_delimiters(parts, boundary)
+    return sum(sizes) + sum(len(head) for head in heads) + len(tail)
+
+
+def encode_multipart(parts: List[Part], subtype: str = 'mixed',
+                     boundary: str = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     **params: str) -> Result:
+    """ Encode the given parts as a streaming multipart :class:`Result`.
+        Additional keyword arguments are added as parameters of the content
+        type.
+    """
+    boundary = boundary or generate_boundary()
+    content_type = '; '.join(
+        [f'multipart/{subtype}', f'boundary={boundary}'] + [
+            f'{name}="{value}"' for name, value in params.items()
+        ]
+    )
+    return Result.from_chunks(
+        iter_encode_multipart(parts, boundary, chunk_size),
+        content_type=content_type,
+    )
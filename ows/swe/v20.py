@@ -25,6 +25,13 @@
 # THE SOFTWARE.
 # -------------------------------------------------------------------------------
 
+from typing import Iterator, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from ows.xml import ElementMaker, NameSpace, NameSpaceMap, Element
 from .types import Field, DataRecord
 
@@ -71,3 +78,74 @@ def encode_data_record(data_record: DataRecord) -> Element:
         encode_field(field)
         for field in data_record
     ])
+
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def encode_component_values(values: 'np.ndarray', field: Field) -> 'np.ndarray':
+    """ Format the values of a single record component to an array of strings.
+        If the field specifies significant figures, these are used, otherwise
+        the shortest representation is chosen.
+    """
+    if field.significant_figures is not None:
+        return np.char.mod(f'%.{field.significant_figures}g', values)
+    return values.astype(str)
+
+
+def iter_encode_tuples(values: 'np.ndarray', data_record: DataRecord,
+                       token_separator: str = ',',
+                       shape: Tuple[int, ...] = None,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE
+                       ) -> Iterator[List[str]]:
+    """ Format a NumPy array of record values to tuple strings, where the
+        components of each tuple are separated by ``token_separator``. The
+        tuples are produced in chunks of at most ``chunk_size`` tuples, in the
+        (C-) order of the array. The array is validated immediately, the
+        formatting happens lazily.
+
+        :param values: the value array; its last dimension holds the record
+                       components, which may be omitted for single field
+                       records
+        :param data_record: the record describing the components
+        :param token_separator: the separator between components of a tuple
+        :param shape: the expected shape of the array, excluding the
+                      component dimension
+        :param chunk_size: the maximum number of tuples per chunk
+        :returns: an iterator of lists of formatted tuples
+    """
+    num_components = len(data_record)
+    if shape is not None:
+        if values.ndim == len(shape):
+            values = values[..., np.newaxis]
+    elif num_components == 1 and values.shape[-1] != 1:
+        values = values[..., np.newaxis]
+
+    if values.shape[-1] != num_components:
+        raise ValueError(
+            f'Number of components ({values.shape[-1]}) does not match the '
+            f'number of fields ({num_components})'
+        )
+
+    if shape is not None and values.shape[:-1] != tuple(shape):
+        raise ValueError(
+            f'Shape of values {values.shape[:-1]} does not match the '
+            f'expected shape {tuple(shape)}'
+        )
+
+    return _iter_encode_tuples(
+        values.reshape(-1, num_components), data_record, token_separator,
+        chunk_size
+    )
+
+
+def _iter_encode_tuples(values, data_record, token_separator, chunk_size):
+    for offset in range(0, len(values), chunk_size):
+        chunk = values[offset:offset + chunk_size]
+        tuples = encode_component_values(chunk[:, 0], data_record[0])
+        for index, field in enumerate(data_record[1:], start=1):
+            tuples = np.char.add(
+                np.char.add(tuples, token_separator),
+                encode_component_values(chunk[:, index], field)
+            )
+        yield tuples.tolist()
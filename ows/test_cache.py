@@ -0,0 +1,143 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+import pytest
+
+from .cache import cache_key, canonical_form, ResultCache
+from .wms.v13.decoders import kvp_decode_getmap, kvp_decode_getfeatureinfo
+from .wcs.v20.decoders import kvp_decode_get_coverage
+
+
+GET_MAP = (
+    'service=WMS&request=GetMap&version=1.3.0&format=image/png'
+    '&width=256&height=256'
+)
+
+
+@pytest.mark.parametrize('a, b', [
+    (
+        'layers=a,b&styles=,&crs=EPSG:4326&bbox=0,0,10,10',
+        'layers=a,b&styles=,&crs=epsg:4326&bbox=0.0,0.00000000001,10.0,1e1',
+    ),
+    (
+        'layers=a&styles=s&crs=EPSG:4326&bbox=0,0,10,10',
+        'layers=a&styles=s&crs=urn:ogc:def:crs:EPSG::4326&bbox=0,0,10,10',
+    ),
+    (
+        'layers=a&styles=s&crs=EPSG:4326&bbox=0,0,10,10&dim_B=1&dim_a=2',
+        'layers=a&styles=s&crs=EPSG:4326&bbox=0,0,10,10&DIM_A=2&dim_b=1',
+    ),
+    (
+        'layers=a&styles=s&crs=EPSG:4326&bbox=0,0,1,1'
+        '&time=2020-01-01T12:00:00Z',
+        'layers=a&styles=s&crs=EPSG:4326&bbox=0,0,1,1'
+        '&time=2020-01-01T13:00:00%2B01:00',
+    ),
+    (
+        'layers=a&styles=s&crs=EPSG:4326&bbox=0,0,1,1',
+        'layers=a&styles=s&crs=EPSG:4326&bbox=0,0,1,1'
+        '&transparent=FALSE&exceptions=XML',
+    ),
+])
+def test_get_map_equivalent(a, b):
+    assert cache_key(kvp_decode_getmap(f'{GET_MAP}&{a}')) == \
+        cache_key(kvp_decode_getmap(f'{GET_MAP}&{b}'))
+
+
+@pytest.mark.parametrize('a, b', [
+    (
+        'layers=a&styles=s&crs=EPSG:4326&bbox=0,0,10,10',
+        'layers=a&styles=s&crs=EPSG:4326&bbox=0,0,10,10.001',
+    ),
+    (
+        'layers=a,b&styles=s,&crs=EPSG:4326&bbox=0,0,10,10',
+        'layers=b,a&styles=s,&crs=EPSG:4326&bbox=0,0,10,10',
+    ),
+    (
+        'layers=a&styles=s&crs=EPSG:4326&bbox=0,0,10,10&elevation=1',
+        'layers=a&styles=s&crs=EPSG:4326&bbox=0,0,10,10&elevation=2',
+    ),
+])
+def test_get_map_different(a, b):
+    assert cache_key(kvp_decode_getmap(f'{GET_MAP}&{a}')) != \
+        cache_key(kvp_decode_getmap(f'{GET_MAP}&{b}'))
+
+
+def test_get_feature_info_key():
+    params = (
+        'service=WMS&request=GetFeatureInfo&version=1.3.0&layers=a&styles=s'
+        '&crs=EPSG:4326&bbox=0,0,1,1&width=256&height=256&format=image/png'
+        '&query_layers=a&info_format=text/html&i=1&j=2'
+    )
+    request = kvp_decode_getfeatureinfo(params)
+    assert canonical_form(request).startswith(b'GetFeatureInfo')
+    assert cache_key(request) == \
+        cache_key(kvp_decode_getfeatureinfo(params + '&feature_count=1'))
+    assert cache_key(request) != \
+        cache_key(kvp_decode_getfeatureinfo(params.replace('i=1', 'i=3')))
+    assert len(cache_key(request)) == 16
+
+
+def test_get_coverage_key():
+    base = 'service=WCS&version=2.0.1&request=GetCoverage&coverageid=a'
+    assert cache_key(kvp_decode_get_coverage(
+        f'{base}&subset=x(0,10)&subset=y(5)&scalesize=x(10),y(20)'
+    )) == cache_key(kvp_decode_get_coverage(
+        f'{base}&subset=y(5.0)&subset=x(0.0,10.0)&scalesize=y(20),x(10)'
+    ))
+    assert cache_key(kvp_decode_get_coverage(
+        f'{base}&rangesubset=B1,B2'
+    )) != cache_key(kvp_decode_get_coverage(
+        f'{base}&rangesubset=B2,B1'
+    ))
+
+
+def test_result_cache():
+    cache = ResultCache(10)
+    assert cache.put('a', b'12345')
+    assert cache.put('b', b'1234')
+    assert cache.get('a') == b'12345'
+    assert cache.put('c', b'123')
+    # "b" was the least recently used item
+    assert 'b' not in cache
+    assert cache.size == 8
+    assert not cache.put('d', b'12345678901')
+    assert len(cache) == 2
+
+    assert cache.get_or_create('e', lambda: b'12') == b'12'
+    assert cache.get_or_create('e', lambda: b'xx') == b'12'
+    cache.clear()
+    assert cache.size == 0 and len(cache) == 0
+
+
+def test_result_cache_ttl():
+    cache = ResultCache(10, ttl=0)
+    assert cache.put('a', b'123')
+    # expired right away
+    assert cache.get('a') is None
+    assert cache.size == 0 and len(cache) == 0
@@ -0,0 +1,91 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+import pytest
+
+from .crs import (
+    epsg_code, is_axis_order_swapped, swap_axes, parse_crs, normalize_crs
+)
+
+
+@pytest.mark.parametrize('crs, swapped', [
+    ('EPSG:4326', True),
+    ('epsg:4258', True),
+    ('EPSG:3035', True),
+    ('EPSG:31468', True),
+    ('EPSG:3857', False),
+    ('EPSG:32633', False),
+    ('CRS:84', False),
+])
+def test_is_axis_order_swapped(crs, swapped):
+    assert is_axis_order_swapped(crs) == swapped
+
+
+def test_helpers():
+    assert epsg_code(' EPSG:4326') == 4326
+    assert epsg_code('CRS:84') is None
+    assert swap_axes([1, 2, 3, 4]) == [2, 1, 4, 3]
+
+
+@pytest.mark.parametrize('identifier', [
+    'EPSG:4326',
+    'epsg:4326',
+    'urn:ogc:def:crs:EPSG::4326',
+    'urn:ogc:def:crs:EPSG:6.6:4326',
+    'urn:x-ogc:def:crs:EPSG:4326',
+    'http://www.opengis.net/def/crs/EPSG/0/4326',
+    'https://www.opengis.net/def/crs/EPSG/0/4326',
+    'http://www.opengis.net/gml/srs/epsg.xml#4326',
+])
+def test_parse_crs_epsg(identifier):
+    crs = parse_crs(identifier)
+    assert crs is parse_crs('EPSG:4326')
+    assert crs.identifier == 'EPSG:4326'
+    assert crs.axis_order_swapped
+    assert parse_crs(crs.urn) is crs
+    assert parse_crs(crs.url) is crs
+
+
+@pytest.mark.parametrize('identifier', [
+    'CRS:84',
+    'OGC:CRS84',
+    'urn:ogc:def:crs:OGC:1.3:CRS84',
+    'http://www.opengis.net/def/crs/OGC/1.3/CRS84',
+])
+def test_parse_crs_crs84(identifier):
+    crs = parse_crs(identifier)
+    assert crs is parse_crs('CRS:84')
+    assert normalize_crs(identifier) == 'CRS:84'
+    assert not crs.axis_order_swapped
+
+
+def test_parse_crs_unknown():
+    assert parse_crs('not a crs') is None
+    assert normalize_crs(' not a crs ') == 'not a crs'
+    assert normalize_crs(None) is None
+    assert not is_axis_order_swapped('not a crs')
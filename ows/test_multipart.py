@@ -0,0 +1,93 @@
+# ------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# ------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# ------------------------------------------------------------------------------
+
+import email
+import os
+import tempfile
+
+from .multipart import (
+    Part, encode_multipart, iter_payload, content_length, payload_size
+)
+
+
+def test_iter_payload():
+    data = bytes(range(256)) * 10
+
+    chunks = list(iter_payload(data, 1000))
+    assert all(isinstance(chunk, memoryview) for chunk in chunks)
+    assert b''.join(chunks) == data
+
+    assert b''.join(iter_payload(memoryview(data)[10:], 100)) == data[10:]
+    assert b''.join(iter_payload(iter([data[:5], data[5:]]))) == data
+
+    with tempfile.TemporaryFile() as f:
+        f.write(data)
+        f.seek(0)
+        assert payload_size(f.fileno()) == len(data)
+        assert b''.join(iter_payload(f.fileno(), 1000)) == data
+        f.seek(100)
+        assert payload_size(f) == len(data) - 100
+        assert b''.join(iter_payload(f, 1000)) == data[100:]
+
+    read_fd, write_fd = os.pipe()
+    assert payload_size(read_fd) is None
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def test_encode_multipart():
+    parts = [
+        Part(b'<xml/>', 'application/xml', 'a.xml'),
+        Part(
+            bytearray(b'\x00\x01' * 1000), 'image/tiff', 'a',
+            headers={'Content-Transfer-Encoding': 'binary'}
+        ),
+    ]
+    result = encode_multipart(parts, 'related', 'BOUNDARY', 512, type='application/xml')
+    assert result.content_type == (
+        'multipart/related; boundary=BOUNDARY; type="application/xml"'
+    )
+    body = b''.join(result.value)
+    assert content_length(parts, 'BOUNDARY') == len(body)
+    assert body.startswith(
+        b'--BOUNDARY\r\nContent-Type: application/xml\r\n'
+        b'Content-ID: <a.xml>\r\n\r\n<xml/>\r\n--BOUNDARY\r\n'
+    )
+    assert body.endswith(b'\r\n--BOUNDARY--\r\n')
+
+    message = email.message_from_bytes(
+        f'Content-Type: {result.content_type}\r\n\r\n'.encode('ascii') + body
+    )
+    xml_part, tiff_part = message.get_payload()
+    assert xml_part['Content-ID'] == '<a.xml>'
+    assert xml_part.get_payload(decode=True) == b'<xml/>'
+    assert tiff_part.get_content_type() == 'image/tiff'
+    assert tiff_part.get_payload(decode=True) == b'\x00\x01' * 1000
+
+    assert content_length(
+        [Part(iter([b'a']), 'text/plain')], 'BOUNDARY'
+    ) is None
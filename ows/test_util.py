@@ -29,7 +29,9 @@ from datetime import timedelta, timezone, datetime, date
 
 import pytest
 
-from .util import isoformat, temporal_bounds, parse_temporal, month, year
+from .util import (
+    isoformat, temporal_bounds, parse_temporal, parse_duration, month, year
+)
 
 
 M_ONE_HOUR = timezone(-timedelta(seconds=60 * 60))
@@ -134,3 +136,15 @@ def test_parse_temporal():
     assert parse_temporal('2012-1-13T00:00:00+01:00') == datetime(2012, 1, 13, tzinfo=P_ONE_HOUR)
     assert parse_temporal('2012-01-13T00:00:00+01:00') == datetime(2012, 1, 13, tzinfo=P_ONE_HOUR)
     assert parse_temporal('20120113T00:00:00+01:00') == datetime(2012, 1, 13, tzinfo=P_ONE_HOUR)
+
+
+def test_parse_duration():
+    assert parse_duration('P1D') == timedelta(days=1)
+    assert parse_duration('PT1H30M') == timedelta(hours=1, minutes=30)
+    assert parse_duration('P2W') == timedelta(weeks=2)
+    assert parse_duration('P1DT0.5S') == timedelta(days=1, seconds=0.5)
+    assert parse_duration('P0Y0M1D') == timedelta(days=1)
+
+    for value in ('P', 'PT', 'P1DT', 'P1M', 'P1Y', '1D'):
+        with pytest.raises(ValueError):
+            parse_duration(value)
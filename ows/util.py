@@ -27,13 +27,18 @@
 
 from datetime import datetime, date, timedelta, timezone, time, MINYEAR, MAXYEAR
 from dataclasses import dataclass
-from typing import Any, Sequence, Dict, Union, Tuple
+from typing import Any, Sequence, Dict, Union, Tuple, Iterable
 from urllib.parse import urlencode
 import re
 
 from lxml import etree
 import iso8601
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from .xml import ElementTree
 
 
@@ -99,6 +104,17 @@ class Result:
             content_type=content_type,
         )
 
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[Union[bytes, memoryview]],
+                    content_type=None):
+        ''' Create a streaming result. The value is an iterable of bytes-like
+            objects, which shall be sent one after another.
+        '''
+        return cls(
+            value=chunks,
+            content_type=content_type,
+        )
+
 
 @dataclass(eq=True, order=True, frozen=True)
 class month:
@@ -172,6 +188,38 @@ def isoformat(temporal: Temporals, zulu=True) -> str:
     raise ValueError('invalid temporal value passed')
 
 
+def is_ndarray(value: Any) -> bool:
+    ''' Checks whether the passed value is a NumPy array. Always ``False``
+        when NumPy is not installed.
+    '''
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def to_datetime64(temporal: Union[datetime, date]) -> 'np.datetime64':
+    ''' Converts a datetime or date to a :class:`numpy.datetime64`. Timezone
+        aware datetimes are converted to UTC first, as NumPy datetimes are
+        always timezone naive.
+    '''
+    if isinstance(temporal, datetime) and temporal.utcoffset() is not None:
+        temporal = temporal.astimezone(UTC).replace(tzinfo=None)
+    return np.datetime64(temporal)
+
+
+def to_python(value: Any) -> Any:
+    ''' Converts NumPy scalars to their Python counterparts, e.g:
+        :class:`numpy.datetime64` to :class:`datetime.datetime` or
+        :class:`datetime.date` and :class:`numpy.float64` to :class:`float`.
+        All other values are passed through.
+    '''
+    if np is not None and isinstance(value, np.generic):
+        if isinstance(value, np.datetime64):
+            unit, _ = np.datetime_data(value.dtype)
+            if unit not in ('Y', 'M', 'W', 'D'):
+                value = value.astype('datetime64[us]')
+        return value.item()
+    return value
+
+
 def duration(td: timedelta) -> str:
     ''' Encode a timedelta as an ISO 8601 duration string.
     '''
@@ -182,6 +230,47 @@ def duration(td: timedelta) -> str:
     return f'P{days}T{td.seconds}S'
 
 
+DURATION_RE = re.compile(
+    r'''
+    P(?:
+        (?P<weeks>[0-9]+(?:[.,][0-9]+)?)W
+        |
+        (?:(?P<years>[0-9]+)Y)?
+        (?:(?P<months>[0-9]+)M)?
+        (?:(?P<days>[0-9]+(?:[.,][0-9]+)?)D)?
+        (?:T
+            (?:(?P<hours>[0-9]+(?:[.,][0-9]+)?)H)?
+            (?:(?P<minutes>[0-9]+(?:[.,][0-9]+)?)M)?
+            (?:(?P<seconds>[0-9]+(?:[.,][0-9]+)?)S)?
+        )?
+    )$
+    ''',
+    re.VERBOSE
+)
+
+
+def parse_duration(value: str) -> timedelta:
+    ''' Parses an ISO 8601 duration string to a timedelta. As years and
+        months do not have a fixed length, durations using them (other than
+        zero) raise a ``ValueError``.
+    '''
+    match = DURATION_RE.match(value)
+    if not match or value in ('P', 'PT') or value.endswith('T'):
+        raise ValueError(f"Invalid ISO 8601 duration '{value}'")
+
+    groups = {
+        key: float(group.replace(',', '.'))
+        for key, group in match.groupdict().items()
+        if group is not None
+    }
+    if groups.pop('years', 0) or groups.pop('months', 0):
+        raise ValueError(
+            f"Duration '{value}' uses years or months, which have no fixed "
+            "length"
+        )
+    return timedelta(**groups)
+
+
 def temporal_bounds(temporal: Temporals) -> Tuple[datetime, datetime]:
     ''' Calculates the effective temporal bounds of the passed temporal value.
     '''
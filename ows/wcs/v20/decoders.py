@@ -30,7 +30,10 @@
 import re
 
 from ows import kvp, xml
-from ows.decoder import typelist, enum, boolean
+from ows.decoder import (
+    typelist, enum, boolean, InvalidParameterException,
+    WrongMultiplicityException
+)
 from ows.util import Version
 
 from .namespaces import ns_wcs, ns_rsub, ns_scal, nsmap
@@ -113,7 +116,7 @@ SCALEEXTENT_RE = re.compile(r'([a-zA-Z0-9_]+)\(([^:]*):([^)]*)\)')
 def parse_subset_value(string):
     if string == '*':
         return None
-    elif string.startswith('"') and string.endswith('"'):
+    elif len(string) > 1 and string[0] in '"\'' and string[0] == string[-1]:
         return string[1:-1]
     else:
         return float(string)
@@ -201,6 +204,180 @@ def parse_scaleextent_kvp(string):
     return types.ScaleExtent(axis, low, high)
 
 
+# single pass scanner for the axis based KVP parameters: subset, scaleAxes,
+# scaleSize, scaleExtent and interpolationPerAxis. Each parameter value is a
+# (comma separated list of) axis "call(s)" with one or two arguments, e.g:
+# "x(0,10)", "x(0.5),y(2)" or "x(0:100),y(0:200)".
+
+AXIS_CALL_VALUE = r'''"[^"\n]*"|'[^'\n]*'|[^,:()"'\n]*'''
+AXIS_CALL_TEMPLATE = (
+    r'[ \t]*{g}[a-zA-Z0-9_]+)[ \t]*\([ \t]*{g}{v})[ \t]*'
+    r'(?:{g}[,:])[ \t]*{g}{v})[ \t]*)?\)[ \t]*'
+)
+AXIS_CALL = AXIS_CALL_TEMPLATE.format(g='(', v=AXIS_CALL_VALUE)
+AXIS_CALL_RE = re.compile(AXIS_CALL)
+AXIS_CALL_LINE_RE = re.compile(f'^{AXIS_CALL}$', re.MULTILINE)
+AXIS_CALL_LIST_RE = re.compile('{0}(?:,{0})*'.format(
+    AXIS_CALL_TEMPLATE.format(g='(?:', v=AXIS_CALL_VALUE)
+))
+
+
+def scan_axis_calls(values, error):
+    """ Scan a list of values, each holding a single axis call, in one pass.
+        Returns a list of tuples ``(axis, first, separator, second)``, where
+        the last two are empty strings for single argument calls. ``error``
+        is called with a message to create the exception to raise on syntax
+        errors, which reference the first offending value.
+    """
+    if not values:
+        return []
+
+    joined = '\n'.join(values)
+    calls = AXIS_CALL_LINE_RE.findall(joined)
+    if len(calls) == len(values) and joined.count('\n') == len(values) - 1:
+        return calls
+
+    for value in values:
+        if not AXIS_CALL_RE.fullmatch(value):
+            raise error(f"Could not parse '{value}'.")
+
+    raise error(f"Could not parse '{joined}'.")
+
+
+def scan_axis_call_list(value, error):
+    """ Scan a single comma separated list of axis calls. See
+        :func:`scan_axis_calls` for details.
+    """
+    if not AXIS_CALL_LIST_RE.fullmatch(value):
+        raise error(f"Could not parse '{value}'.")
+    return AXIS_CALL_RE.findall(value)
+
+
+def _scan_subsets(values):
+    subsets = []
+    for axis, first, separator, second in scan_axis_calls(
+            values, InvalidSubsettingException):
+        # numeric bounds are by far the most common, so try those first and
+        # only fall back to the generic value parsing if that fails
+        try:
+            try:
+                low = float(first)
+            except ValueError:
+                low = parse_subset_value(first)
+
+            if not separator:
+                subsets.append(types.Slice(axis, low))
+                continue
+            elif separator != ',':
+                raise ValueError(f"Invalid separator '{separator}'.")
+
+            try:
+                high = float(second)
+            except ValueError:
+                high = parse_subset_value(second)
+        except ValueError as exc:
+            raise InvalidSubsettingException(
+                f"Could not parse subset for axis '{axis}': {exc}", axis
+            ) from exc
+
+        subsets.append(types.Trim(axis, low, high))
+
+    return subsets
+
+
+def _scan_scales(values, locator, parse_call):
+    if len(values) > 1:
+        raise WrongMultiplicityException(locator, "at most one", len(values))
+    elif not values:
+        return []
+
+    def error(message):
+        return InvalidParameterException(message, locator)
+
+    return [
+        parse_call(axis, first, separator, second)
+        for axis, first, separator, second
+        in scan_axis_call_list(values[0], error)
+    ]
+
+
+def _parse_scaleaxis_call(axis, first, separator, second):
+    if separator:
+        raise InvalidScaleFactorException(f'{first}{separator}{second}')
+    try:
+        return types.ScaleAxis(axis, float(first))
+    except ValueError:
+        raise InvalidScaleFactorException(first)
+
+
+def _parse_scalesize_call(axis, first, separator, second):
+    if separator:
+        raise InvalidScaleFactorException(f'{first}{separator}{second}')
+    try:
+        return types.ScaleSize(axis, int(first))
+    except ValueError:
+        raise InvalidScaleFactorException(first)
+
+
+def _parse_scaleextent_call(axis, first, separator, second):
+    if separator != ':':
+        raise InvalidScaleFactorException(first)
+    try:
+        low = int(first)
+        high = int(second)
+    except ValueError:
+        raise InvalidScaleFactorException(second)
+
+    if low >= high:
+        raise InvalidScaleExtentException(low, high)
+
+    return types.ScaleExtent(axis, low, high)
+
+
+def _scan_axis_interpolations(values):
+    axis_interpolations = []
+    for value in values:
+        axis, _, method = value.partition(',')
+        if not axis or not method:
+            raise InvalidParameterException(
+                f"Could not parse axis interpolation '{value}'.",
+                'interpolationperaxis'
+            )
+        axis_interpolations.append(types.AxisInterpolation(axis, method))
+    return axis_interpolations
+
+
+def scan_get_coverage_kvp(query_dict):
+    """ Decode the subset, scaling and per-axis interpolation parameters from
+        a (lower-cased) KVP query dictionary. This is the fast path used by
+        the :class:`KVPGetCoverageDecoder`, which creates the resulting
+        objects directly without per-item parameter handling.
+    """
+    def get(key):
+        values = query_dict.get(key)
+        if not values:
+            return []
+        elif '' in values:
+            return [value for value in values if value]
+        return values
+
+    return {
+        'subsets': _scan_subsets(get('subset')),
+        'scaleaxes': _scan_scales(
+            get('scaleaxes'), 'scaleaxes', _parse_scaleaxis_call
+        ),
+        'scalesize': _scan_scales(
+            get('scalesize'), 'scalesize', _parse_scalesize_call
+        ),
+        'scaleextent': _scan_scales(
+            get('scaleextent'), 'scaleextent', _parse_scaleextent_call
+        ),
+        'axis_interpolations': _scan_axis_interpolations(
+            get('interpolationperaxis')
+        ),
+    }
+
+
 compression_enum = enum(
     ("None", "PackBits", "Huffman", "LZW", "JPEG", "Deflate"), True
 )
@@ -219,11 +396,7 @@ def parse_multiple_16(raw):
 class KVPGetCoverageDecoder(GetCoverageBaseDecoder, kvp.Decoder):
     version = kvp.Parameter(type=Version.from_str, num=1)
     coverage_id = kvp.Parameter("coverageid", num=1)
-    subsets = kvp.Parameter("subset", type=parse_subset_kvp, num="*")
     scalefactor = kvp.Parameter("scalefactor", type=float, num="?")
-    scaleaxes = kvp.Parameter("scaleaxes", type=typelist(parse_scaleaxis_kvp, ","), default_factory=list, num="?")
-    scalesize = kvp.Parameter("scalesize", type=typelist(parse_scalesize_kvp, ","), default_factory=list, num="?")
-    scaleextent = kvp.Parameter("scaleextent", type=typelist(parse_scaleextent_kvp, ","), default_factory=list, num="?")
     rangesubset = kvp.Parameter("rangesubset", type=parse_range_subset_kvp, num="?")
     format = kvp.Parameter("format", num="?")
     subsettingcrs = kvp.Parameter("subsettingcrs", num="?")
@@ -239,6 +412,39 @@ class KVPGetCoverageDecoder(GetCoverageBaseDecoder, kvp.Decoder):
     geotiff_tileheight = kvp.Parameter("geotiff:tileheight", num="?", type=parse_multiple_16)
     geotiff_tilewidth = kvp.Parameter("geotiff:tilewidth", num="?", type=parse_multiple_16)
 
+    def _scan(self):
+        # subsets, scales and axis interpolations are scanned in one go
+        try:
+            return self._scanned
+        except AttributeError:
+            self._scanned = scan_get_coverage_kvp(self._query_dict)
+            return self._scanned
+
+    @property
+    def subsets(self):
+        return self._scan()['subsets']
+
+    @property
+    def scaleaxes(self):
+        return self._scan()['scaleaxes']
+
+    @property
+    def scalesize(self):
+        return self._scan()['scalesize']
+
+    @property
+    def scaleextent(self):
+        return self._scan()['scaleextent']
+
+    @property
+    def axis_interpolations(self):
+        return self._scan()['axis_interpolations']
+
+    def collect_params(self):
+        params = super().collect_params()
+        params.update(self._scan())
+        return params
+
 
 # ------------------------------------------------------------------------------
 # GetCoverge - XML
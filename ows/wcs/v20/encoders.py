@@ -27,9 +27,13 @@
 
 # # xflake8: noqa
 
-from typing import List
+from typing import List, Union
+
+from lxml import etree
 
 from ows.util import Result
+from ows.xml import Element
+from ows.multipart import Part, PayloadType, encode_multipart
 from .types import (
     DescribeCoverageRequest, GetCoverageRequest,
     Trim, Slice, ScaleSize, ScaleAxis, ScaleExtent
@@ -516,3 +520,22 @@ def xml_encode_coverage_descriptions(coverage_descriptions: List[CoverageDescrip
     ])
 
     return Result.from_etree(root, **kwargs)
+
+
+def multipart_encode_coverage(coverage: Union[Element, bytes],
+                              payload: PayloadType, mime_type: str,
+                              content_id: str = 'coverage',
+                              boundary: str = None, **kwargs) -> Result:
+    """ Assemble a GetCoverage response as of the GMLCOV multipart
+        conformance class: the first part contains the GML coverage, the
+        second part the coverage data encoded in ``mime_type``, which is
+        streamed from the ``payload``. The GML coverage shall reference the
+        data as ``cid:<content_id>``.
+    """
+    if not isinstance(coverage, bytes):
+        coverage = etree.tostring(coverage, **kwargs)
+
+    return encode_multipart([
+        Part(coverage, 'application/gml+xml', f'{content_id}.xml'),
+        Part(payload, mime_type, content_id),
+    ], 'related', boundary, type='application/gml+xml')
@@ -29,11 +29,17 @@
 class InvalidSubsettingException(Exception):
     """
     This exception indicates an invalid WCS 2.0 subsetting parameter was
-    submitted.
+    submitted. The locator defaults to ``subset``, but can be narrowed down
+    to the offending axis.
     """
     code = "InvalidSubsetting"
     locator = "subset"
 
+    def __init__(self, message=None, locator=None):
+        super().__init__(*([message] if message is not None else []))
+        if locator is not None:
+            self.locator = locator
+
 
 class InvalidSubsettingCrsException(Exception):
     """
@@ -77,6 +83,32 @@ class InvalidScaleExtentException(Exception):
         self.locator = high
 
 
+class NoSuchFieldException(Exception):
+    """ A range subset referenced a field that is not part of the coverages
+        range type.
+    """
+    code = "NoSuchField"
+
+    def __init__(self, field):
+        super().__init__(
+            "No such field '%s'" % field
+        )
+        self.locator = field
+
+
+class IllegalFieldSequenceException(Exception):
+    """ A range subset interval started after its end within the coverages
+        range type.
+    """
+    code = "IllegalFieldSequence"
+
+    def __init__(self, start, end):
+        super().__init__(
+            "Field interval '%s:%s' is not in range type order" % (start, end)
+        )
+        self.locator = "%s:%s" % (start, end)
+
+
 class NoSuchCoverageException(Exception):
     """ This exception indicates that the requested coverage(s) do not
         exist.
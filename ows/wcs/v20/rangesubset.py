@@ -0,0 +1,131 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" Resolution of WCS 2.0 range subsets (as in
+    :attr:`ows.wcs.v20.types.GetCoverageRequest.range_subset`) to the
+    indices of the selected fields of a coverages range type.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ows.swe.types import DataRecord
+from .types import RangeInterval
+from .exceptions import NoSuchFieldException, IllegalFieldSequenceException
+
+
+RangeSubsetType = Optional[List[Union[str, RangeInterval]]]
+
+CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _field_index(names: Tuple[str, ...]) -> Dict[str, int]:
+    index = {}
+    for i, name in enumerate(names):
+        # like a linear scan, the first field with a given name wins
+        index.setdefault(name, i)
+    return index
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _resolve(names: Tuple[str, ...],
+             range_subset: Optional[Tuple[Union[str, Tuple[str, str]], ...]]):
+    if range_subset is None:
+        indices = list(range(len(names)))
+    else:
+        index = _field_index(names)
+
+        def lookup(name):
+            try:
+                return index[name]
+            except KeyError:
+                raise NoSuchFieldException(name) from None
+
+        indices = []
+        for item in range_subset:
+            if isinstance(item, tuple):
+                start, end = item
+                low = lookup(start)
+                high = lookup(end)
+                if low > high:
+                    raise IllegalFieldSequenceException(start, end)
+                indices.extend(range(low, high + 1))
+            else:
+                indices.append(lookup(item))
+
+    if np is None:
+        return tuple(indices)
+
+    indices = np.array(indices, dtype=np.intp)
+    # the array is shared by all callers, so protect it from modification
+    indices.flags.writeable = False
+    return indices
+
+
+def field_index(range_type: DataRecord) -> Dict[str, int]:
+    """ Returns the mapping of field names to their index in the given range
+        type. The mapping is cached and must not be modified.
+    """
+    return _field_index(tuple(field.name for field in range_type))
+
+
+def resolve_range_subset(range_type: DataRecord,
+                         range_subset: RangeSubsetType) -> Sequence[int]:
+    """ Resolves the band names and :class:`RangeInterval` items of a range
+        subset to the indices of the selected fields of the range type, in
+        the requested order. Intervals are inclusive on both ends. When no
+        range subset is given, all fields are selected.
+
+        The result is a read-only NumPy array of indices, or a tuple if
+        NumPy is not installed. Results are cached per distinct range type
+        and range subset.
+
+        Raises :class:`NoSuchFieldException` for unknown field names and
+        :class:`IllegalFieldSequenceException` for intervals whose start
+        field comes after their end field.
+    """
+    if range_subset is not None:
+        range_subset = tuple(
+            (item.start, item.end) if isinstance(item, RangeInterval)
+            else item
+            for item in range_subset
+        )
+    return _resolve(tuple(field.name for field in range_type), range_subset)
+
+
+def select_fields(range_type: DataRecord,
+                  range_subset: RangeSubsetType) -> DataRecord:
+    """ Returns the fields of the range type selected by the range subset.
+    """
+    return [range_type[i] for i in resolve_range_subset(range_type, range_subset)]
@@ -30,14 +30,21 @@
 from textwrap import dedent
 from urllib.parse import unquote
 
+import pytest
 from lxml import etree
 
+from ows.decoder import InvalidParameterException, WrongMultiplicityException
 from .types import (
-    DescribeCoverageRequest, GetCoverageRequest, GeoTIFFEncodingParameters
+    DescribeCoverageRequest, GetCoverageRequest, GeoTIFFEncodingParameters,
+    Trim, Slice, ScaleAxis, ScaleSize, ScaleExtent, AxisInterpolation
 )
 from .decoders import (
     kvp_decode_describe_coverage, xml_decode_describe_coverage,
-    kvp_decode_get_coverage, xml_decode_get_coverage
+    kvp_decode_get_coverage, xml_decode_get_coverage, KVPGetCoverageDecoder
+)
+from .exceptions import (
+    InvalidSubsettingException, InvalidScaleFactorException,
+    InvalidScaleExtentException
 )
 
 # ------------------------------------------------------------------------------
@@ -84,6 +91,68 @@ def test_decode_get_coverage_kvp():
     )
 
 
+def test_decode_get_coverage_kvp_axis_parameters():
+    request = (
+        "service=WCS&version=2.0.1&request=GetCoverage&coverageid=a"
+        "&subset=x(1.5,2)&subset=y(*,-2.5e1)"
+        "&subset=time(\"2018-05-07\",\"2018-05-08\")&subset=t('2018')"
+        "&scaleaxes=x(0.5),y(2)&scalesize=x(100)&scaleextent=x(0:100),y(0:200)"
+        "&interpolationPerAxis=x,linear&interpolationPerAxis=y,nearest"
+    )
+    assert kvp_decode_get_coverage(request) == GetCoverageRequest(
+        coverage_id='a',
+        subsets=[
+            Trim('x', 1.5, 2.0),
+            Trim('y', None, -25.0),
+            Trim('time', '2018-05-07', '2018-05-08'),
+            Slice('t', '2018'),
+        ],
+        scales=[
+            ScaleAxis('x', 0.5),
+            ScaleAxis('y', 2.0),
+            ScaleSize('x', 100),
+            ScaleExtent('x', 0, 100),
+            ScaleExtent('y', 0, 200),
+        ],
+        axis_interpolations=[
+            AxisInterpolation('x', 'linear'),
+            AxisInterpolation('y', 'nearest'),
+        ]
+    )
+
+
+def test_get_coverage_kvp_decoder_attributes():
+    decoder = KVPGetCoverageDecoder(
+        "service=WCS&version=2.0.1&request=GetCoverage&coverageid=a"
+        "&subset=x(1.5,2)&scaleaxes=x(0.5)&scalesize=y(100)"
+    )
+    assert decoder.subsets == [Trim('x', 1.5, 2.0)]
+    assert decoder.scaleaxes == [ScaleAxis('x', 0.5)]
+    assert decoder.scalesize == [ScaleSize('y', 100)]
+    assert decoder.scaleextent == []
+    assert decoder.subsets is decoder.subsets
+
+
+@pytest.mark.parametrize('params, exception, locator', [
+    ('subset=x(1,2', InvalidSubsettingException, 'subset'),
+    ('subset=x(1,2)y', InvalidSubsettingException, 'subset'),
+    ('subset=x(1),y(2)', InvalidSubsettingException, 'subset'),
+    ('subset=x(a,2)', InvalidSubsettingException, 'x'),
+    ('subset=x(1:2)', InvalidSubsettingException, 'x'),
+    ('scaleaxes=x(1),', InvalidParameterException, 'scaleaxes'),
+    ('scaleaxes=x(a)', InvalidScaleFactorException, 'a'),
+    ('scalesize=x(1.5)', InvalidScaleFactorException, '1.5'),
+    ('scalesize=x(1)&scalesize=y(2)', WrongMultiplicityException, 'scalesize'),
+    ('scaleextent=x(5:1)', InvalidScaleExtentException, 1),
+    ('interpolationPerAxis=x', InvalidParameterException, 'interpolationperaxis'),
+])
+def test_decode_get_coverage_kvp_axis_parameters_invalid(params, exception, locator):
+    request = f"service=WCS&version=2.0.1&request=GetCoverage&coverageid=a&{params}"
+    with pytest.raises(exception) as excinfo:
+        kvp_decode_get_coverage(request)
+    assert excinfo.value.locator == locator
+
+
 def test_decode_get_coverage_xml():
     request = b"""<?xml version="1.0" encoding="UTF-8"?>
     <wcs:GetCoverage
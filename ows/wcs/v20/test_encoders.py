@@ -48,7 +48,8 @@ from ..types import (
 from .encoders import (
     kvp_encode_describe_coverage, xml_encode_describe_coverage,
     kvp_encode_get_coverage, xml_encode_get_coverage,
-    xml_encode_capabilities, xml_encode_coverage_descriptions
+    xml_encode_capabilities, xml_encode_coverage_descriptions,
+    multipart_encode_coverage
 )
 from ows.test import assert_xml_equal
 
@@ -436,3 +437,30 @@ def test_encode_coverage_descriptions():
             coverage_subtype='RectifiedDataset'
         )
     ], pretty_print=True).value.decode('utf-8'))
+
+
+# ------------------------------------------------------------------------------
+# GetCoverage response
+# ------------------------------------------------------------------------------
+
+def test_multipart_encode_coverage():
+    coverage = etree.fromstring(
+        b'<gmlcov:RectifiedGridCoverage xmlns:gmlcov="http://www.opengis.net/gmlcov/1.0"/>'
+    )
+    result = multipart_encode_coverage(
+        coverage, memoryview(b'II*\x00'), 'image/tiff', boundary='b'
+    )
+    assert result.content_type == (
+        'multipart/related; boundary=b; type="application/gml+xml"'
+    )
+    assert b''.join(result.value) == (
+        b'--b\r\n'
+        b'Content-Type: application/gml+xml\r\n'
+        b'Content-ID: <coverage.xml>\r\n\r\n'
+        b'<gmlcov:RectifiedGridCoverage xmlns:gmlcov="http://www.opengis.net/gmlcov/1.0"/>'
+        b'\r\n--b\r\n'
+        b'Content-Type: image/tiff\r\n'
+        b'Content-ID: <coverage>\r\n\r\n'
+        b'II*\x00'
+        b'\r\n--b--\r\n'
+    )
@@ -0,0 +1,80 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+import pytest
+
+from ows.swe.types import Field
+from .types import RangeInterval
+from .rangesubset import field_index, resolve_range_subset, select_fields
+from .exceptions import NoSuchFieldException, IllegalFieldSequenceException
+
+np = pytest.importorskip('numpy')
+
+
+RANGE_TYPE = [
+    Field(name=f'B{i:02}', description='', uom='W.m-2.Sr-1')
+    for i in range(1, 13)
+]
+
+
+def test_field_index():
+    index = field_index(RANGE_TYPE)
+    assert index['B01'] == 0
+    assert index['B12'] == 11
+    assert field_index(RANGE_TYPE) is index
+
+
+@pytest.mark.parametrize('range_subset, expected', [
+    (None, list(range(12))),
+    (['B04', 'B03', 'B02'], [3, 2, 1]),
+    ([RangeInterval('B02', 'B04'), 'B08'], [1, 2, 3, 7]),
+    ([RangeInterval('B05', 'B05'), 'B05'], [4, 4]),
+    ([], []),
+])
+def test_resolve_range_subset(range_subset, expected):
+    indices = resolve_range_subset(RANGE_TYPE, range_subset)
+    assert isinstance(indices, np.ndarray)
+    assert indices.tolist() == expected
+    assert not indices.flags.writeable
+    assert resolve_range_subset(RANGE_TYPE, range_subset) is indices
+
+
+def test_select_fields():
+    fields = select_fields(RANGE_TYPE, ['B08', RangeInterval('B01', 'B02')])
+    assert [field.name for field in fields] == ['B08', 'B01', 'B02']
+
+
+@pytest.mark.parametrize('range_subset, exception, locator', [
+    (['B13'], NoSuchFieldException, 'B13'),
+    ([RangeInterval('B01', 'X')], NoSuchFieldException, 'X'),
+    ([RangeInterval('B04', 'B02')], IllegalFieldSequenceException, 'B04:B02'),
+])
+def test_resolve_range_subset_invalid(range_subset, exception, locator):
+    with pytest.raises(exception) as excinfo:
+        resolve_range_subset(RANGE_TYPE, range_subset)
+    assert excinfo.value.locator == locator
@@ -0,0 +1,320 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" A compiled, flat catalog of the named layers of a WMS service. The
+    properties that WMS 1.3 layers inherit from their ancestors (see table 7
+    of the WMS 1.3 standard) are resolved once when the catalog is built, so
+    that looking up a layer and its effective properties is a single
+    dictionary access.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ows.crs import normalize_crs
+from ows.common.types import BoundingBox, WGS84BoundingBox
+from ows.exceptions import InvalidRequestException
+from .types import (
+    Layer, Style, Dimension, FormatOnlineResource, ServiceCapabilities,
+    GetMapRequest,
+)
+from .exceptions import (
+    LayerNotDefinedException, StyleNotDefinedException, InvalidCRSException
+)
+
+
+@dataclass
+class EffectiveLayer:
+    """ A layer with all inherited properties resolved:
+
+        - ``styles``, ``crss`` and ``authority_urls`` accumulate along the
+          path from the root layer
+        - ``bounding_boxes`` (per CRS) and ``dimensions`` (per name) of a
+          layer replace the ones of its ancestors with the same key
+        - all other inherited properties are replaced when set on the layer.
+          The boolean attributes default to ``False`` and are thus inherited
+          when set on any ancestor.
+    """
+    layer: Layer
+    parent: Optional[str] = None
+    crss: Tuple[str, ...] = ()
+    # the normalized identifiers of the CRSs, see ows.crs.normalize_crs
+    crs_set: FrozenSet[str] = frozenset()
+    wgs84_bounding_box: WGS84BoundingBox = None
+    bounding_boxes: Dict[str, BoundingBox] = field(default_factory=dict)
+    dimensions: Dict[str, Dimension] = field(default_factory=dict)
+    styles: Dict[str, Style] = field(default_factory=dict)
+    attribution: str = None
+    authority_urls: Dict[str, FormatOnlineResource] = field(default_factory=dict)
+    min_scale_denominator: float = None
+    max_scale_denominator: float = None
+
+    queryable: bool = False
+    cascaded: int = None
+    opaque: bool = False
+    no_subsets: bool = False
+    fixed_width: int = None
+    fixed_height: int = None
+
+    @property
+    def name(self) -> str:
+        return self.layer.name
+
+    @property
+    def default_style(self) -> Optional[Style]:
+        """ The first style of the layer, if any.
+        """
+        return next(iter(self.styles.values()), None)
+
+
+def _replace(value, inherited):
+    return inherited if value is None else value
+
+
+def _accumulate(inherited: dict, items) -> dict:
+    # share the parents mapping when the layer does not add anything
+    if not items:
+        return inherited
+    merged = dict(inherited)
+    merged.update(items)
+    return merged
+
+
+def _inherit(layer: Layer, parent: EffectiveLayer,
+             parent_name: Optional[str]) -> EffectiveLayer:
+    crss = parent.crss
+    crs_set = parent.crs_set
+    new_crss = [crs for crs in layer.crss if normalize_crs(crs) not in crs_set]
+    if new_crss:
+        crss = crss + tuple(dict.fromkeys(new_crss))
+        crs_set = frozenset(normalize_crs(crs) for crs in crss)
+
+    return EffectiveLayer(
+        layer=layer,
+        parent=parent_name,
+        crss=crss,
+        crs_set=crs_set,
+        wgs84_bounding_box=_replace(
+            layer.wgs84_bounding_box, parent.wgs84_bounding_box
+        ),
+        bounding_boxes=_accumulate(parent.bounding_boxes, [
+            (bbox.crs, bbox) for bbox in layer.bounding_boxes
+        ]),
+        dimensions=_accumulate(parent.dimensions, [
+            (dimension.name, dimension) for dimension in layer.dimensions
+        ]),
+        styles=_accumulate(parent.styles, [
+            (style.name, style) for style in layer.styles
+        ]),
+        attribution=_replace(layer.attribution, parent.attribution),
+        authority_urls=_accumulate(
+            parent.authority_urls, layer.authority_urls
+        ),
+        min_scale_denominator=_replace(
+            layer.min_scale_denominator, parent.min_scale_denominator
+        ),
+        max_scale_denominator=_replace(
+            layer.max_scale_denominator, parent.max_scale_denominator
+        ),
+        queryable=layer.queryable or parent.queryable,
+        cascaded=_replace(layer.cascaded, parent.cascaded),
+        opaque=layer.opaque or parent.opaque,
+        no_subsets=layer.no_subsets or parent.no_subsets,
+        fixed_width=_replace(layer.fixed_width, parent.fixed_width),
+        fixed_height=_replace(layer.fixed_height, parent.fixed_height),
+    )
+
+
+def compile_layers(root: Layer) -> Dict[str, EffectiveLayer]:
+    """ Flattens the layer tree below (and including) ``root`` to a mapping
+        of layer name to :class:`EffectiveLayer`, in document order.
+        Unnamed (category) layers are not included, but their properties are
+        still inherited. Raises a ``ValueError`` for duplicate layer names.
+    """
+    layers = {}
+    # iterate instead of recursing, to support arbitrarily deep trees
+    stack = [(root, EffectiveLayer(layer=None), None)]
+    while stack:
+        layer, parent, parent_name = stack.pop()
+        effective = _inherit(layer, parent, parent_name)
+        if layer.name is not None:
+            if layer.name in layers:
+                raise ValueError(f"Duplicate layer name '{layer.name}'")
+            layers[layer.name] = effective
+            parent_name = layer.name
+
+        stack.extend(
+            (child, effective, parent_name)
+            for child in reversed(layer.layers)
+        )
+
+    return layers
+
+
+def _is_visible(layer: EffectiveLayer, scale_denominator: float) -> bool:
+    low = layer.min_scale_denominator or 0.0
+    high = layer.max_scale_denominator or float('inf')
+    return low <= scale_denominator < high
+
+
+class LayerCatalog:
+    """ An index of the named layers of a WMS service with their effective
+        (inherited) properties. :meth:`rebuild` replaces the whole index at
+        once, so concurrent readers either see the old or the new layers,
+        never a mix of both.
+    """
+
+    def __init__(self, root: Layer = None, layer_limit: int = None):
+        self._layers: Dict[str, EffectiveLayer] = {}
+        self._scale_ranges = None
+        self.layer_limit = layer_limit
+        if root is not None:
+            self.rebuild(root)
+
+    @classmethod
+    def from_capabilities(cls, capabilities: ServiceCapabilities):
+        return cls(capabilities.layer, capabilities.layer_limit)
+
+    def rebuild(self, root: Layer, layer_limit: int = None):
+        """ Compile the layer tree and swap it in. On errors, the previous
+            layers stay in place.
+        """
+        layers = compile_layers(root) if root is not None else {}
+        self._layers = layers
+        if layer_limit is not None:
+            self.layer_limit = layer_limit
+
+    def __getitem__(self, name: str) -> EffectiveLayer:
+        return self._layers[name]
+
+    def get(self, name: str, default=None) -> Optional[EffectiveLayer]:
+        return self._layers.get(name, default)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._layers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layers)
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def _get_scale_ranges(self):
+        # the arrays are derived lazily from the current layers, so they
+        # are always consistent with the mapping they were built from
+        layers = self._layers
+        cached = self._scale_ranges
+        if cached is None or cached[0] is not layers:
+            positions = {name: i for i, name in enumerate(layers)}
+            ranges = np.array([
+                (
+                    layer.min_scale_denominator or 0.0,
+                    layer.max_scale_denominator or np.inf,
+                )
+                for layer in layers.values()
+            ], dtype=float).reshape(-1, 2)
+            cached = self._scale_ranges = (layers, positions, ranges)
+        return cached
+
+    def filter_by_scale(self, names: Sequence[str],
+                        scale_denominator: Optional[float]) -> List[str]:
+        """ Returns the layers of ``names`` which are visible at the given
+            scale denominator, i.e: it lies within the minimum (inclusive)
+            and maximum (exclusive) scale denominator of the layer. When no
+            scale denominator is passed, all layers are considered visible.
+        """
+        if scale_denominator is None:
+            return list(names)
+
+        try:
+            if np is None:
+                layers = [self._layers[name] for name in names]
+                return [
+                    layer.name for layer in layers
+                    if _is_visible(layer, scale_denominator)
+                ]
+
+            _, positions, ranges = self._get_scale_ranges()
+            rows = ranges[[positions[name] for name in names]]
+        except KeyError as exc:
+            raise LayerNotDefinedException(exc.args[0]) from None
+
+        visible = (rows[:, 0] <= scale_denominator) & \
+            (scale_denominator < rows[:, 1])
+        return [name for name, keep in zip(names, visible.tolist()) if keep]
+
+    def validate_get_map(self, request: GetMapRequest) \
+            -> List[Tuple[EffectiveLayer, Optional[Style]]]:
+        """ Checks the layers, styles and CRS of a GetMap (or
+            GetFeatureInfo) request against the catalog. Returns the
+            requested layers along with the requested style, or the default
+            style of the layer where none was requested.
+        """
+        layers = self._layers
+        names = request.layers
+        styles = request.styles or [None] * len(names)
+
+        if self.layer_limit is not None and len(names) > self.layer_limit:
+            raise InvalidRequestException(
+                f"Number of layers exceeds the limit of {self.layer_limit}.",
+                "InvalidParameterValue", "layers"
+            )
+
+        if len(styles) != len(names):
+            raise InvalidRequestException(
+                "Number of styles does not match the number of layers.",
+                "InvalidParameterValue", "styles"
+            )
+
+        crs = normalize_crs(request.crs)
+        result = []
+        for name, style_name in zip(names, styles):
+            try:
+                layer = layers[name]
+            except KeyError:
+                raise LayerNotDefinedException(name) from None
+
+            if crs not in layer.crs_set:
+                raise InvalidCRSException(request.crs, name)
+
+            if style_name:
+                try:
+                    style = layer.styles[style_name]
+                except KeyError:
+                    raise StyleNotDefinedException(style_name, name) from None
+            else:
+                style = layer.default_style
+
+            result.append((layer, style))
+
+        return result
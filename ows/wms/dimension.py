@@ -0,0 +1,414 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+""" Matching of requested WMS dimension values (as decoded by
+    ``parse_dimension``) against the values a :class:`Dimension` offers.
+"""
+
+from datetime import date, datetime
+from typing import Any, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ows.util import (
+    UTC, month, year, parse_temporal, parse_duration, temporal_bounds,
+    to_datetime64, to_python
+)
+from .types import Dimension, Range
+from .exceptions import (
+    MissingDimensionValueException, InvalidDimensionValueException
+)
+
+
+TEMPORAL = 'temporal'
+NUMERIC = 'numeric'
+TEXT = 'text'
+
+
+def _is_temporal(value) -> bool:
+    return isinstance(value, (date, month, year))
+
+
+class DimensionIndex:
+    """ A search structure for the values of a :class:`Dimension`.
+
+        Discrete values are kept in a sorted NumPy array. Intervals
+        (:class:`Range` values) are kept sorted by their start, which forms
+        an implicit balanced search tree (the middle interval of each index
+        range is its root) augmented with the maximum stop of each subtree.
+        Looking up a value thus takes logarithmic time in the number of
+        dimension values, plus the number of matching intervals.
+
+        Temporal dimensions (with units ``ISO8601`` or date/time values)
+        are indexed as ``datetime64[us]`` in UTC, numeric ones as floats.
+        Dimensions with other (string) values only support exact matches.
+    """
+
+    def __init__(self, dimension: Dimension):
+        if np is None:
+            raise ImportError('NumPy is required for the DimensionIndex')
+
+        self.dimension = dimension
+
+        values = dimension.values
+        if values is None:
+            values = []
+        elif isinstance(values, Range):
+            values = [values]
+
+        points = [value for value in values if not isinstance(value, Range)]
+        ranges = [value for value in values if isinstance(value, Range)]
+
+        self.kind = self._detect_kind(points, ranges)
+        self._aware = any(
+            isinstance(value, datetime) and value.utcoffset() is not None
+            for value in points + [r.start for r in ranges]
+        )
+        dtype = self._dtype
+
+        keys = np.array([self._key(value) for value in points], dtype=dtype)
+        order = np.argsort(keys, kind='stable')
+        self._points = keys[order]
+        self._point_values = [points[i] for i in order]
+
+        ranges.sort(key=lambda r: self._key(r.start))
+        self._ranges = ranges
+        self._starts = np.array(
+            [self._key(r.start) for r in ranges], dtype=dtype
+        )
+        self._stops = np.array(
+            [self._key(r.stop) for r in ranges], dtype=dtype
+        )
+        self._resolutions = [self._resolution_key(r) for r in ranges]
+        if ranges:
+            self._subtree_stops = self._build_subtree_stops()
+            self._sorted_stops = np.sort(self._stops)
+
+    @property
+    def name(self) -> str:
+        return self.dimension.name
+
+    @property
+    def _dtype(self):
+        return {
+            TEMPORAL: 'datetime64[us]', NUMERIC: 'float64', TEXT: 'U'
+        }[self.kind]
+
+    def _detect_kind(self, points, ranges):
+        bounds = points + [
+            bound for r in ranges for bound in (r.start, r.stop)
+        ]
+        units = (self.dimension.units or '').upper()
+        if units == 'ISO8601' or any(_is_temporal(v) for v in bounds):
+            return TEMPORAL
+
+        try:
+            for value in bounds:
+                float(value)
+        except (TypeError, ValueError):
+            if ranges:
+                raise ValueError(
+                    f"Dimension '{self.dimension.name}' has intervals with "
+                    "non-numeric bounds"
+                )
+            return TEXT
+        return NUMERIC
+
+    def _key(self, value):
+        """ Convert a (parsed) value to its index representation.
+        """
+        if self.kind == TEMPORAL:
+            if isinstance(value, str):
+                value = parse_temporal(value)
+            if isinstance(value, (month, year)):
+                value = temporal_bounds(value)[0]
+            return to_datetime64(value).astype('datetime64[us]')
+        elif self.kind == NUMERIC:
+            return np.float64(value)
+        return str(value)
+
+    def _resolution_key(self, range_: Range):
+        resolution = range_.resolution
+        if resolution in (None, '', 0, '0'):
+            return None
+        elif self.kind == TEMPORAL:
+            if isinstance(resolution, str):
+                resolution = parse_duration(resolution)
+            if not resolution:
+                return None
+            return np.timedelta64(resolution).astype('timedelta64[us]')
+        return np.float64(resolution)
+
+    def _value(self, key) -> Any:
+        """ Convert an index key back to a Python value.
+        """
+        value = to_python(key)
+        if self._aware and isinstance(value, datetime):
+            value = value.replace(tzinfo=UTC)
+        return value
+
+    @property
+    def default(self) -> Optional[Any]:
+        """ The parsed default value of the dimension. For temporal
+            dimensions, a default of ``current`` refers to the latest
+            available value.
+        """
+        default = self.dimension.default
+        if default is None:
+            return None
+        elif self.kind == TEMPORAL and default.lower() == 'current':
+            return self.latest
+        elif self.kind == TEMPORAL:
+            return parse_temporal(default)
+        elif self.kind == NUMERIC:
+            return float(default)
+        return default
+
+    @property
+    def latest(self) -> Optional[Any]:
+        """ The greatest value of the dimension.
+        """
+        candidates = []
+        if len(self._points):
+            candidates.append((self._points[-1], self._point_values[-1]))
+        if self._ranges:
+            candidates.append((self._stops.max(), None))
+        if not candidates:
+            return None
+        key, value = max(candidates, key=lambda c: c[0])
+        return self._value(key) if value is None else value
+
+    def match(self, value=None) -> List[Any]:
+        """ Match a requested value, as returned by ``parse_dimension``:
+            a single value, a :class:`Range` or a list of those. When no
+            value is requested, the default value is used instead.
+
+            Returns the list of matched values: available discrete values,
+            requested values within intervals and the requested ranges
+            clipped to the available intervals. When the dimension allows
+            nearest values, single values are snapped to the closest
+            available one.
+        """
+        if value is None:
+            value = self.default
+            if value is None:
+                raise MissingDimensionValueException(self.name)
+
+        items = value if isinstance(value, list) else [value]
+        if len(items) > 1 and not self.dimension.multiple_values:
+            raise InvalidDimensionValueException(
+                self.name, value,
+                f"Dimension '{self.name}' does not allow multiple values"
+            )
+
+        matched = []
+        for item in items:
+            matched.extend(self._match_item(item))
+        return matched
+
+    def _match_item(self, item) -> List[Any]:
+        if self.kind == TEMPORAL and isinstance(item, str):
+            item = parse_temporal(item)
+
+        if self.kind == TEMPORAL and _is_temporal(item) \
+                and not isinstance(item, datetime):
+            # dates, months and years cover a whole period
+            item = Range(*temporal_bounds(item))
+
+        try:
+            if isinstance(item, Range):
+                if self.kind == TEXT:
+                    raise ValueError('intervals are not supported')
+                matched = self._match_range(
+                    self._key(item.start), self._key(item.stop)
+                )
+            else:
+                matched = self._match_value(item, self._key(item))
+        except (TypeError, ValueError) as exc:
+            raise InvalidDimensionValueException(self.name, item) from exc
+
+        if not matched:
+            raise InvalidDimensionValueException(self.name, item)
+        return matched
+
+    def _match_range(self, low, high) -> List[Any]:
+        if low > high:
+            raise ValueError('interval start is after its end')
+
+        points = self._points
+        i = np.searchsorted(points, low, 'left')
+        j = np.searchsorted(points, high, 'right')
+        matched = self._point_values[i:j]
+
+        if self._ranges:
+            for index in self._overlapping(low, high):
+                range_ = self._ranges[index]
+                matched.append(Range(
+                    self._value(max(self._starts[index], low)),
+                    self._value(min(self._stops[index], high)),
+                    range_.resolution,
+                ))
+        return matched
+
+    def _build_subtree_stops(self):
+        """ The maximum stop of the subtree rooted at each interval.
+        """
+        stops = self._stops
+        subtree_stops = stops.copy()
+
+        def build(low, high):
+            mid = (low + high) // 2
+            if low < mid:
+                subtree_stops[mid] = max(subtree_stops[mid], build(low, mid))
+            if mid + 1 < high:
+                subtree_stops[mid] = max(
+                    subtree_stops[mid], build(mid + 1, high)
+                )
+            return subtree_stops[mid]
+
+        # the depth is logarithmic in the number of intervals
+        build(0, len(stops))
+        return subtree_stops
+
+    def _overlapping(self, low, high) -> List[int]:
+        """ The indices of the intervals overlapping ``[low, high]``, in
+            ascending order. Subtrees which end before ``low`` or start
+            after ``high`` are skipped.
+        """
+        starts = self._starts
+        stops = self._stops
+        subtree_stops = self._subtree_stops
+        indices = []
+        stack = [(0, len(starts))]
+        while stack:
+            start, end = stack.pop()
+            if start >= end:
+                continue
+            mid = (start + end) // 2
+            if subtree_stops[mid] < low:
+                continue
+            stack.append((start, mid))
+            # the intervals of the right subtree start after this one
+            if starts[mid] <= high:
+                if stops[mid] >= low:
+                    indices.append(mid)
+                stack.append((mid + 1, end))
+        indices.sort()
+        return indices
+
+    def _containing_intervals(self, key) -> List[int]:
+        """ The indices of the intervals containing the key, the latest
+            starting first.
+        """
+        return self._overlapping(key, key)[::-1]
+
+    def _snap(self, index, key):
+        """ Snap a key within an interval to its resolution.
+        """
+        resolution = self._resolutions[index]
+        if resolution is None:
+            return key
+        start = self._starts[index]
+        snapped = start + round((key - start) / resolution) * resolution
+        if snapped > self._stops[index]:
+            snapped -= resolution
+        return snapped
+
+    def _match_value(self, item, key) -> List[Any]:
+        points = self._points
+        i = int(np.searchsorted(points, key, 'left'))
+        if i < len(points) and points[i] == key:
+            return [self._point_values[i]]
+
+        candidates = []
+        if self._ranges:
+            for index in self._containing_intervals(key):
+                snapped = self._snap(index, key)
+                if snapped == key:
+                    return [item]
+                candidates.append((snapped, None))
+
+        if not self.dimension.nearest_value or self.kind == TEXT:
+            return []
+
+        if i > 0:
+            candidates.append((points[i - 1], self._point_values[i - 1]))
+        if i < len(points):
+            candidates.append((points[i], self._point_values[i]))
+
+        if self._ranges:
+            # closest interval ending before and starting after the key
+            j = int(np.searchsorted(self._sorted_stops, key, 'left'))
+            if j > 0:
+                candidates.append((self._sorted_stops[j - 1], None))
+            k = int(np.searchsorted(self._starts, key, 'right'))
+            if k < len(self._starts):
+                candidates.append((self._starts[k], None))
+
+        if not candidates:
+            return []
+
+        nearest, value = min(candidates, key=lambda c: abs(c[0] - key))
+        return [self._value(nearest) if value is None else value]
+
+    def __contains__(self, value) -> bool:
+        try:
+            key = self._key(value)
+        except (TypeError, ValueError):
+            return False
+        i = int(np.searchsorted(self._points, key, 'left'))
+        if i < len(self._points) and self._points[i] == key:
+            return True
+        return bool(self._ranges) and any(
+            self._snap(index, key) == key
+            for index in self._containing_intervals(key)
+        )
+
+
+def index_dimensions(dimensions: List[Dimension]):
+    """ Creates a mapping of dimension name to :class:`DimensionIndex`.
+    """
+    return {
+        dimension.name: DimensionIndex(dimension)
+        for dimension in dimensions
+    }
+
+
+def match_dimensions(indices, requested: dict) -> dict:
+    """ Match requested dimension values (a mapping of lower case dimension
+        name to the value as returned by ``parse_dimension``) against the
+        given dimension indices, using the defaults for the dimensions that
+        were not requested.
+    """
+    requested = {name.lower(): value for name, value in requested.items()}
+    return {
+        name: index.match(requested.get(name.lower()))
+        for name, index in indices.items()
+    }
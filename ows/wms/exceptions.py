@@ -0,0 +1,109 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+class LayerNotDefinedException(Exception):
+    """ A request referenced a layer that is not offered by the server.
+    """
+    code = "LayerNotDefined"
+    locator = "layers"
+
+    def __init__(self, layer):
+        super().__init__("No such layer '%s'" % layer)
+        self.layer = layer
+
+
+class StyleNotDefinedException(Exception):
+    """ A request referenced a style that is not offered for the
+        respective layer.
+    """
+    code = "StyleNotDefined"
+    locator = "styles"
+
+    def __init__(self, style, layer=None):
+        if layer is not None:
+            message = "No such style '%s' for layer '%s'" % (style, layer)
+        else:
+            message = "No such style '%s'" % style
+        super().__init__(message)
+        self.style = style
+        self.layer = layer
+
+
+class InvalidCRSException(Exception):
+    """ A request referenced a CRS that is not offered for the requested
+        layer.
+    """
+    code = "InvalidCRS"
+    locator = "crs"
+
+    def __init__(self, crs, layer=None):
+        if layer is not None:
+            message = "CRS '%s' is not supported by layer '%s'" % (crs, layer)
+        else:
+            message = "CRS '%s' is not supported" % crs
+        super().__init__(message)
+        self.crs = crs
+        self.layer = layer
+
+
+class MissingDimensionValueException(Exception):
+    """ A request did not specify a value for a dimension that has no
+        default value.
+    """
+    code = "MissingDimensionValue"
+
+    def __init__(self, dimension):
+        super().__init__("Missing value for dimension '%s'" % dimension)
+        self.locator = dimension
+
+
+class InvalidDimensionValueException(Exception):
+    """ A request specified an invalid value for a dimension.
+    """
+    code = "InvalidDimensionValue"
+
+    def __init__(self, dimension, value, message=None):
+        super().__init__(
+            message or "Invalid value '%s' for dimension '%s'" % (
+                value, dimension
+            )
+        )
+        self.locator = dimension
+        self.value = value
+
+
+class InvalidPointException(Exception):
+    """ A GetFeatureInfo request specified a pixel outside of the map.
+    """
+    code = "InvalidPoint"
+
+    def __init__(self, i, j, locator='i'):
+        super().__init__("Invalid point (%s, %s)" % (i, j))
+        self.locator = locator
+        self.i = i
+        self.j = j
@@ -0,0 +1,214 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" Conversion of GetFeatureInfo pixel positions to world coordinates,
+    for single requests and for batches of requests on the same maps.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ows.cache import DEFAULT_PRECISION, map_key
+from ows.crs import is_axis_order_swapped
+from .types import GetMapRequest, GetFeatureInfoRequest
+from .exceptions import InvalidPointException
+
+
+@dataclass(frozen=True)
+class PixelGrid:
+    """ The pixel grid of a map: its bounding box, in the axis order of the
+        CRS, and its size in pixels. Pixel ``(0, 0)`` is the upper left
+        pixel of the map, ``i`` increases to the right and ``j`` downwards.
+
+        All methods accept scalars or arrays of pixel positions, which are
+        broadcast against each other. Coordinates are returned in the axis
+        order of the CRS, along the last dimension of the result.
+    """
+    crs: str
+    bbox: Tuple[float, float, float, float]
+    width: int
+    height: int
+
+    def __post_init__(self):
+        if np is None:
+            raise ImportError('NumPy is required for the PixelGrid')
+
+    @classmethod
+    def from_request(cls, request: Union[GetMapRequest,
+                                         GetFeatureInfoRequest]):
+        return cls(
+            request.crs, tuple(request.bbox), request.width, request.height
+        )
+
+    @property
+    def _axes(self) -> Tuple[int, int]:
+        """ The indices of the horizontal and vertical axes of the map in
+            the bounding box.
+        """
+        return (1, 0) if is_axis_order_swapped(self.crs) else (0, 1)
+
+    @property
+    def pixel_size(self) -> Tuple[float, float]:
+        """ The size of a pixel in CRS units, horizontally and vertically.
+        """
+        x_axis, y_axis = self._axes
+        bbox = self.bbox
+        return (
+            (bbox[x_axis + 2] - bbox[x_axis]) / self.width,
+            (bbox[y_axis + 2] - bbox[y_axis]) / self.height,
+        )
+
+    def _edges(self, i, j):
+        # the left and upper edges of the pixels
+        x_axis, y_axis = self._axes
+        size_x, size_y = self.pixel_size
+        left = self.bbox[x_axis] + np.asarray(i, dtype=float) * size_x
+        top = self.bbox[y_axis + 2] - np.asarray(j, dtype=float) * size_y
+        return np.broadcast_arrays(left, top)
+
+    def coordinates(self, i, j) -> 'np.ndarray':
+        """ The coordinates of the centers of the pixels.
+        """
+        left, top = self._edges(i, j)
+        size_x, size_y = self.pixel_size
+        x = left + size_x / 2
+        y = top - size_y / 2
+        if self._axes[0]:
+            return np.stack([y, x], axis=-1)
+        return np.stack([x, y], axis=-1)
+
+    def footprints(self, i, j) -> 'np.ndarray':
+        """ The bounding boxes of the pixels, like the bounding box of the
+            map.
+        """
+        left, top = self._edges(i, j)
+        size_x, size_y = self.pixel_size
+        bottom = top - size_y
+        right = left + size_x
+        if self._axes[0]:
+            return np.stack([bottom, left, top, right], axis=-1)
+        return np.stack([left, bottom, right, top], axis=-1)
+
+    def contains(self, i, j) -> 'np.ndarray':
+        """ Whether the pixel positions are within the map.
+        """
+        i = np.asarray(i)
+        j = np.asarray(j)
+        return (i >= 0) & (i < self.width) & (j >= 0) & (j < self.height)
+
+
+def feature_info_location(request: GetFeatureInfoRequest) \
+        -> Tuple[Tuple[float, float], Tuple[float, float, float, float]]:
+    """ The coordinates of the center and the bounding box of the queried
+        pixel of a GetFeatureInfo request, in the axis order of its CRS.
+        Raises an :class:`InvalidPointException` if the pixel is outside of
+        the map.
+    """
+    grid = PixelGrid.from_request(request)
+    if not 0 <= request.i < grid.width:
+        raise InvalidPointException(request.i, request.j, 'i')
+    elif not 0 <= request.j < grid.height:
+        raise InvalidPointException(request.i, request.j, 'j')
+
+    return (
+        tuple(grid.coordinates(request.i, request.j).tolist()),
+        tuple(grid.footprints(request.i, request.j).tolist()),
+    )
+
+
+@dataclass
+class FeatureInfoQuery:
+    """ The GetFeatureInfo requests on a single map, with their pixel
+        positions converted at once. ``indices`` are the positions of the
+        requests in the sequence passed to :func:`plan_feature_info`, the
+        arrays are aligned with ``requests``. Requests with pixels outside
+        of the map are not ``valid``.
+    """
+    grid: PixelGrid
+    key: bytes
+    requests: List[GetFeatureInfoRequest]
+    indices: 'np.ndarray'
+    pixels: 'np.ndarray'
+    coordinates: 'np.ndarray'
+    footprints: 'np.ndarray'
+    valid: 'np.ndarray'
+
+    @property
+    def query_layers(self) -> List[str]:
+        """ The layers queried by any of the requests, in order.
+        """
+        return list(dict.fromkeys(
+            layer for request in self.requests
+            for layer in request.query_layers
+        ))
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+
+def plan_feature_info(requests: Iterable[GetFeatureInfoRequest],
+                      precision: int = DEFAULT_PRECISION) \
+        -> List[FeatureInfoQuery]:
+    """ Groups GetFeatureInfo requests by the map they refer to (see
+        :func:`ows.cache.map_key`), so that each map only needs to be
+        looked up once, and converts the pixel positions of each group in
+        a single step. The queries are in the order of the first request
+        on each map.
+    """
+    if np is None:
+        raise ImportError('NumPy is required to plan GetFeatureInfo requests')
+
+    requests = list(requests)
+    groups = {}
+    for index, request in enumerate(requests):
+        groups.setdefault(map_key(request, precision), []).append(index)
+
+    plan = []
+    for key, indices in groups.items():
+        members = [requests[index] for index in indices]
+        grid = PixelGrid.from_request(members[0])
+        pixels = np.array(
+            [(request.i, request.j) for request in members], dtype=np.int64
+        )
+        i, j = pixels[:, 0], pixels[:, 1]
+        plan.append(FeatureInfoQuery(
+            grid=grid,
+            key=key,
+            requests=members,
+            indices=np.array(indices, dtype=np.intp),
+            pixels=pixels,
+            coordinates=grid.coordinates(i, j),
+            footprints=grid.footprints(i, j),
+            valid=grid.contains(i, j),
+        ))
+    return plan
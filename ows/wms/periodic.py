@@ -0,0 +1,325 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" Lazy sequences of the values of periodic dimension extents, such as
+    ``2000-01-01/2020-12-31/PT1H``, which are described by
+    :class:`ows.wms.types.Range` objects with a resolution.
+"""
+
+from calendar import monthrange
+from collections.abc import Sequence
+from datetime import date, datetime, time, timedelta, timezone
+from math import floor
+import re
+from typing import Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ows.util import (
+    month, year, parse_temporal, parse_duration, temporal_bounds, to_datetime64
+)
+from .types import Range
+
+
+CALENDAR_DURATION_RE = re.compile(r'P(?:([0-9]+)Y)?(?:([0-9]+)M)?$')
+
+# tolerance for rounding errors when dividing floating point extents
+EPSILON = 1e-9
+
+StepType = Union[float, int, timedelta, str]
+
+
+def _add_months(value: date, months: int) -> date:
+    month_index = value.year * 12 + value.month - 1 + months
+    year, month = divmod(month_index, 12)
+    month += 1
+    day = min(value.day, monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
+
+
+def _is_duration(resolution) -> bool:
+    return isinstance(resolution, timedelta) or (
+        isinstance(resolution, str) and resolution[:1].upper() == 'P'
+    )
+
+
+def _promote_dates(start, stop, step):
+    """ Promote date bounds to datetimes at midnight when the step is not a
+        whole number of days or when the other bound is a datetime. Dates
+        are promoted to UTC, unless the other bound is a naive datetime.
+    """
+    dates = [
+        isinstance(value, date) and not isinstance(value, datetime)
+        for value in (start, stop)
+    ]
+    if not any(dates):
+        return start, stop
+
+    datetimes = [isinstance(value, datetime) for value in (start, stop)]
+    sub_day = isinstance(step, timedelta) and step % timedelta(days=1)
+    if not (any(datetimes) or sub_day):
+        return start, stop
+
+    tzinfo = timezone.utc
+    for value in (start, stop):
+        if isinstance(value, datetime):
+            tzinfo = value.tzinfo
+
+    start, stop = (
+        datetime.combine(value, time(tzinfo=tzinfo)) if is_date else value
+        for value, is_date in zip((start, stop), dates)
+    )
+    return start, stop
+
+
+def _parse_value(value, temporal: bool):
+    if isinstance(value, str):
+        if not temporal:
+            try:
+                return float(value)
+            except ValueError:
+                pass
+        value = parse_temporal(value)
+    if isinstance(value, (month, year)):
+        # years and months start on the first day of the period
+        value = temporal_bounds(value)[0].date()
+    return value
+
+
+class PeriodicRange(Sequence):
+    """ The values ``start + i * step`` up to and including ``stop``.
+        Values are computed on access, so even very long extents take
+        constant space. Supports ``len``, indexing, slicing (returning
+        another :class:`PeriodicRange`), containment and ``bisect`` style
+        lookups in constant time.
+
+        ``start`` and ``stop`` are either numbers, or dates or datetimes.
+        Dates are promoted to datetimes at midnight (UTC) for steps that are
+        not whole days or when the other bound is a datetime.
+        For temporal ranges the step is a :class:`timedelta` or an ISO 8601
+        duration. Durations in full years and/or months step by calendar
+        months, clamping the day to the length of the month.
+    """
+
+    def __init__(self, start, stop, step: StepType):
+        self._months = None
+        if isinstance(step, str):
+            match = CALENDAR_DURATION_RE.match(step)
+            if match and any(match.groups()):
+                years, months = (int(g or 0) for g in match.groups())
+                self._months = years * 12 + months
+            else:
+                step = parse_duration(step)
+
+        if self._months is None and step <= type(step)(0) \
+                or self._months == 0:
+            raise ValueError('step must be positive')
+
+        start, stop = _promote_dates(start, stop, step)
+
+        # the values are base + (offset + index * stride) * step, so that
+        # slices share the base and compute exactly the same values
+        self._base = start
+        self._step = step
+        self._offset = 0
+        self._stride = 1
+        self._length = 0
+        if stop >= start:
+            self._length = self._floor_index(stop) + 1
+
+    @classmethod
+    def from_range(cls, range_: Range) -> 'PeriodicRange':
+        """ Create a :class:`PeriodicRange` from a :class:`Range` with a
+            resolution.
+        """
+        if range_.resolution in (None, ''):
+            raise ValueError('Range has no resolution')
+
+        resolution = range_.resolution
+        # an ISO 8601 duration makes the bounds temporal, even years like
+        # '2000' which would otherwise parse as numbers
+        temporal = _is_duration(resolution)
+        start = _parse_value(range_.start, temporal)
+        stop = _parse_value(range_.stop, temporal)
+        if isinstance(resolution, str) and not temporal:
+            resolution = float(resolution)
+        return cls(start, stop, resolution)
+
+    @property
+    def start(self):
+        """ The first value of the range or ``None`` if it is empty.
+        """
+        return self._value(0) if self._length else None
+
+    @property
+    def stop(self):
+        """ The last value of the range or ``None`` if it is empty.
+        """
+        return self._value(self._length - 1) if self._length else None
+
+    @property
+    def step(self) -> StepType:
+        """ The step between two consecutive values, as passed to the
+            constructor.
+        """
+        if self._months is not None:
+            return f'P{self._months * self._stride}M'
+        return self._step * self._stride
+
+    @property
+    def descending(self) -> bool:
+        return self._stride < 0
+
+    def _value(self, index: int):
+        steps = self._offset + index * self._stride
+        if self._months is not None:
+            return _add_months(self._base, steps * self._months)
+        return self._base + steps * self._step
+
+    def _floor_index(self, value) -> int:
+        """ The greatest index whose value is less or equal to ``value``,
+            ignoring the length. Only for ascending ranges.
+        """
+        base = self._base
+        if self._months is not None:
+            months = (value.year - base.year) * 12 + value.month - base.month
+            steps = months // self._months
+        elif isinstance(self._step, timedelta):
+            steps = (value - base) // self._step
+        else:
+            steps = floor((value - base) / self._step + EPSILON)
+        index = (steps - self._offset) // self._stride
+
+        # correct estimation and rounding errors
+        while self._value(index) > value:
+            index -= 1
+        while self._value(index + 1) <= value:
+            index += 1
+        return index
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(self._length)[index]
+            sliced = PeriodicRange.__new__(PeriodicRange)
+            sliced.__dict__.update(self.__dict__)
+            sliced._offset = self._offset + indices.start * self._stride
+            sliced._stride = self._stride * indices.step
+            sliced._length = len(indices)
+            return sliced
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('PeriodicRange index out of range')
+        return self._value(index)
+
+    def bisect_left(self, value) -> int:
+        """ The index where ``value`` would be inserted before equal values,
+            as :func:`bisect.bisect_left` on the materialized values.
+        """
+        if self.descending:
+            raise ValueError('bisect requires an ascending range')
+        if not self._length or value <= self._value(0):
+            return 0
+        index = self._floor_index(value)
+        if self._value(index) < value:
+            index += 1
+        return min(index, self._length)
+
+    def bisect_right(self, value) -> int:
+        """ The index where ``value`` would be inserted after equal values,
+            as :func:`bisect.bisect_right` on the materialized values.
+        """
+        if self.descending:
+            raise ValueError('bisect requires an ascending range')
+        if not self._length or value < self._value(0):
+            return 0
+        return min(self._floor_index(value) + 1, self._length)
+
+    bisect = bisect_right
+
+    def index(self, value, start=0, stop=None) -> int:
+        if self.descending:
+            return super().index(value, start, stop)
+        index = self.bisect_left(value)
+        if index < self._length and self._value(index) == value \
+                and start <= index and (stop is None or index < stop):
+            return index
+        raise ValueError(f'{value!r} is not in range')
+
+    def __contains__(self, value) -> bool:
+        try:
+            self.index(value)
+        except (TypeError, ValueError):
+            return False
+        return True
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self._value(index)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PeriodicRange):
+            return NotImplemented
+        elif self._length != other._length:
+            return False
+        elif self._length == 0:
+            return True
+        second = min(self._length - 1, 1)
+        return (self.start, self.stop, self._value(second)) == \
+            (other.start, other.stop, other._value(second))
+
+    def __repr__(self) -> str:
+        return f'PeriodicRange({self.start!r}, {self.stop!r}, {self.step!r})'
+
+    def to_numpy(self) -> 'np.ndarray':
+        """ Materialize the values as a NumPy array: ``datetime64[us]`` (in
+            UTC) for temporal ranges, numbers otherwise.
+        """
+        steps = self._offset + np.arange(self._length) * self._stride
+        if not isinstance(self._base, date):
+            return self._base + steps * self._step
+
+        base = to_datetime64(self._base).astype('datetime64[us]')
+        if self._months is None:
+            return base + steps * np.timedelta64(self._step, 'us')
+        elif self._base.day <= 28:
+            # no clamping to the end of the month required
+            months = base.astype('datetime64[M]')
+            return (months + steps * self._months).astype(
+                'datetime64[us]'
+            ) + (base - months)
+        return np.array(
+            [to_datetime64(value) for value in self], dtype='datetime64[us]'
+        )
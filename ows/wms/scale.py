@@ -0,0 +1,94 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" Computation of the OGC standardized scale denominator of map requests.
+"""
+
+from functools import lru_cache
+import re
+from typing import Optional
+
+from ows.crs import normalize_crs, is_axis_order_swapped
+from .types import GetMapRequest
+from .tiling import STANDARDIZED_PIXEL_SIZE, METERS_PER_DEGREE
+
+
+# normalized CRS identifier -> meters per unit. The axis order is taken
+# from ows.crs.
+CRS_UNITS = {
+    'EPSG:4326': METERS_PER_DEGREE,
+    'CRS:84': METERS_PER_DEGREE,
+    'EPSG:3857': 1.0,
+    'EPSG:900913': 1.0,
+    'EPSG:3395': 1.0,
+    'EPSG:3035': 1.0,
+    'EPSG:2056': 1.0,
+    'EPSG:27700': 1.0,
+}
+
+# UTM zones on WGS84 (north and south) and ETRS89 are projected in meters
+METRIC_CRS_RE = re.compile(r'EPSG:(32[67][0-6][0-9]|258[2-6][0-9])$')
+
+
+def register_crs_units(crs: str, meters_per_unit: float):
+    """ Register the units of a CRS not known to this module.
+    """
+    CRS_UNITS[normalize_crs(crs)] = meters_per_unit
+    crs_units.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def crs_units(crs: str) -> Optional[float]:
+    """ The meters per unit of the CRS, or ``None`` if the CRS is unknown.
+    """
+    crs = normalize_crs(crs)
+    units = CRS_UNITS.get(crs)
+    if units is None and METRIC_CRS_RE.match(crs):
+        units = 1.0
+    return units
+
+
+def scale_denominator(request: GetMapRequest) -> Optional[float]:
+    """ The OGC standardized scale denominator of a GetMap request, based on
+        the horizontal resolution and the rendering pixel size of 0.28mm.
+        The bounding box is expected in the axis order of the CRS (see
+        :func:`ows.crs.is_axis_order_swapped`), as decoded for all WMS
+        versions. Returns ``None`` when the units of the CRS are unknown.
+    """
+    meters_per_unit = crs_units(request.crs)
+    if meters_per_unit is None or not request.width:
+        return None
+
+    bbox = request.bbox
+    if is_axis_order_swapped(request.crs):
+        width = bbox[3] - bbox[1]
+    else:
+        width = bbox[2] - bbox[0]
+
+    resolution = abs(width) / request.width
+    return resolution * meters_per_unit / STANDARDIZED_PIXEL_SIZE
@@ -0,0 +1,156 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+import pytest
+
+from ows.util import Version
+from ows.common.types import BoundingBox, WGS84BoundingBox
+from ows.exceptions import InvalidRequestException
+from .types import Layer, Style, Dimension, GetMapRequest
+from .catalog import LayerCatalog
+from .exceptions import (
+    LayerNotDefinedException, StyleNotDefinedException, InvalidCRSException
+)
+
+
+def make_catalog():
+    return LayerCatalog(Layer(
+        title='root',
+        crss=['EPSG:4326'],
+        wgs84_bounding_box=WGS84BoundingBox([-180, -90, 180, 90]),
+        bounding_boxes=[BoundingBox('EPSG:4326', [-90, -180, 90, 180])],
+        styles=[Style('default', 'Default')],
+        max_scale_denominator=1e8,
+        layers=[
+            Layer(
+                title='Group',
+                name='group',
+                crss=['EPSG:3857', 'EPSG:4326'],
+                dimensions=[Dimension('time', 'ISO8601', ['2020-01-01'])],
+                queryable=True,
+                layers=[
+                    Layer(
+                        title='A',
+                        name='a',
+                        bounding_boxes=[
+                            BoundingBox('EPSG:4326', [0, 0, 10, 10]),
+                        ],
+                        dimensions=[
+                            Dimension('time', 'ISO8601', ['2021-01-01']),
+                        ],
+                        styles=[Style('red', 'Red')],
+                        max_scale_denominator=1e6,
+                    ),
+                ]
+            ),
+            Layer(title='B', name='b'),
+        ]
+    ), layer_limit=2)
+
+
+def make_request(layers, styles=None, crs='EPSG:4326'):
+    return GetMapRequest(
+        Version(1, 3, 0), layers, styles,
+        BoundingBox(crs, [0, 0, 1, 1]), 256, 256, 'image/png'
+    )
+
+
+def test_catalog_inheritance():
+    catalog = make_catalog()
+    assert list(catalog) == ['group', 'a', 'b']
+
+    a = catalog['a']
+    assert a.parent == 'group'
+    assert a.crss == ('EPSG:4326', 'EPSG:3857')
+    assert a.wgs84_bounding_box.bbox == [-180, -90, 180, 90]
+    assert a.bounding_boxes['EPSG:4326'].bbox == [0, 0, 10, 10]
+    assert a.dimensions['time'].values == ['2021-01-01']
+    assert list(a.styles) == ['default', 'red']
+    assert a.max_scale_denominator == 1e6
+    assert a.queryable
+
+    b = catalog['b']
+    assert b.parent is None
+    assert b.crss == ('EPSG:4326',)
+    assert b.dimensions == {}
+    assert b.max_scale_denominator == 1e8
+    assert not b.queryable
+
+
+def test_catalog_rebuild():
+    catalog = make_catalog()
+    with pytest.raises(ValueError):
+        catalog.rebuild(Layer('root', layers=[
+            Layer('x', name='x'), Layer('x', name='x'),
+        ]))
+    assert 'a' in catalog
+
+    catalog.rebuild(Layer('root', name='root'))
+    assert list(catalog) == ['root']
+
+
+def test_catalog_validate_get_map():
+    catalog = make_catalog()
+    result = catalog.validate_get_map(
+        make_request(['a', 'b'], ['red', None], 'EPSG:4326')
+    )
+    assert [(layer.name, style.name) for layer, style in result] == [
+        ('a', 'red'), ('b', 'default')
+    ]
+
+    # CRS identifiers are compared in their normalized form
+    assert catalog.validate_get_map(make_request(
+        ['b'], crs='http://www.opengis.net/def/crs/EPSG/0/4326'
+    ))
+
+
+@pytest.mark.parametrize('request_, exception', [
+    (make_request(['c']), LayerNotDefinedException),
+    (make_request(['b'], ['red']), StyleNotDefinedException),
+    (make_request(['b'], crs='EPSG:3857'), InvalidCRSException),
+    (make_request(['a', 'b'], ['red']), InvalidRequestException),
+    (make_request(['a', 'b', 'group']), InvalidRequestException),
+])
+def test_catalog_validate_get_map_invalid(request_, exception):
+    with pytest.raises(exception):
+        make_catalog().validate_get_map(request_)
+
+
+def test_catalog_filter_by_scale():
+    catalog = make_catalog()
+    assert catalog.filter_by_scale(['b', 'a', 'group'], 5e5) == \
+        ['b', 'a', 'group']
+    assert catalog.filter_by_scale(['b', 'a', 'group'], 1e6) == ['b', 'group']
+    assert catalog.filter_by_scale(['a', 'b'], 1e9) == []
+    assert catalog.filter_by_scale(['a'], None) == ['a']
+
+    with pytest.raises(LayerNotDefinedException):
+        catalog.filter_by_scale(['c'], 1e6)
+
+    catalog.rebuild(Layer('root', name='b', min_scale_denominator=1e7))
+    assert catalog.filter_by_scale(['b'], 1e6) == []
@@ -0,0 +1,181 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+from datetime import datetime, date, timedelta, timezone
+
+import pytest
+
+from .types import Dimension, Range
+from .exceptions import (
+    MissingDimensionValueException, InvalidDimensionValueException
+)
+
+np = pytest.importorskip('numpy')
+
+from .dimension import DimensionIndex, match_dimensions  # noqa: E402
+
+
+UTC = timezone.utc
+
+
+def make_time_index(**kwargs):
+    return DimensionIndex(Dimension(
+        'time', 'ISO8601',
+        values=[
+            datetime(2020, 1, 3, tzinfo=UTC),
+            datetime(2020, 1, 1, tzinfo=UTC),
+            datetime(2020, 1, 2, tzinfo=UTC),
+            Range(
+                datetime(2021, 1, 1, tzinfo=UTC),
+                datetime(2021, 1, 31, tzinfo=UTC),
+                'P1D'
+            ),
+        ],
+        **kwargs
+    ))
+
+
+def test_time_exact():
+    index = make_time_index()
+    assert index.match(datetime(2020, 1, 2, tzinfo=UTC)) == [
+        datetime(2020, 1, 2, tzinfo=UTC)
+    ]
+    assert index.match(datetime(2021, 1, 5, tzinfo=UTC)) == [
+        datetime(2021, 1, 5, tzinfo=UTC)
+    ]
+    assert datetime(2021, 1, 5, tzinfo=UTC) in index
+    assert datetime(2021, 1, 5, 12, tzinfo=UTC) not in index
+
+    with pytest.raises(InvalidDimensionValueException):
+        index.match(datetime(2021, 1, 5, 12, tzinfo=UTC))
+    with pytest.raises(InvalidDimensionValueException):
+        index.match(datetime(2019, 1, 1, tzinfo=UTC))
+
+
+def test_time_nearest():
+    index = make_time_index(nearest_value=True)
+    assert index.match(datetime(2020, 1, 2, 11, tzinfo=UTC)) == [
+        datetime(2020, 1, 2, tzinfo=UTC)
+    ]
+    assert index.match(datetime(2021, 1, 5, 13, tzinfo=UTC)) == [
+        datetime(2021, 1, 6, tzinfo=UTC)
+    ]
+    assert index.match(datetime(2030, 1, 1, tzinfo=UTC)) == [
+        datetime(2021, 1, 31, tzinfo=UTC)
+    ]
+    assert index.match(datetime(2019, 1, 1, tzinfo=UTC)) == [
+        datetime(2020, 1, 1, tzinfo=UTC)
+    ]
+
+
+def test_time_range():
+    index = make_time_index()
+    assert index.match(Range(
+        datetime(2020, 1, 2, tzinfo=UTC), datetime(2021, 1, 10, tzinfo=UTC)
+    )) == [
+        datetime(2020, 1, 2, tzinfo=UTC),
+        datetime(2020, 1, 3, tzinfo=UTC),
+        Range(
+            datetime(2021, 1, 1, tzinfo=UTC),
+            datetime(2021, 1, 10, tzinfo=UTC),
+            'P1D'
+        ),
+    ]
+    # a date covers the whole day
+    assert index.match(date(2020, 1, 1)) == [datetime(2020, 1, 1, tzinfo=UTC)]
+
+
+def test_default_and_multiple():
+    index = make_time_index(default='current')
+    assert index.match() == [datetime(2021, 1, 31, tzinfo=UTC)]
+
+    with pytest.raises(MissingDimensionValueException):
+        make_time_index().match()
+
+    values = [
+        datetime(2020, 1, 1, tzinfo=UTC), datetime(2020, 1, 3, tzinfo=UTC)
+    ]
+    with pytest.raises(InvalidDimensionValueException):
+        make_time_index().match(values)
+    assert make_time_index(multiple_values=True).match(values) == values
+
+
+def test_numeric_and_text():
+    elevation = DimensionIndex(Dimension(
+        'elevation', 'm', values=[Range(0, 1000, 100)], default='0',
+        nearest_value=True,
+    ))
+    assert elevation.match(240.0) == [200.0]
+    assert elevation.match(Range(950, 2000)) == [Range(950.0, 1000.0, 100)]
+
+    band = DimensionIndex(Dimension('band', None, values=['red', 'green']))
+    assert band.match('red') == ['red']
+    with pytest.raises(InvalidDimensionValueException):
+        band.match('blue')
+
+    assert match_dimensions(
+        {'elevation': elevation, 'band': band}, {'BAND': 'green'}
+    ) == {'elevation': [0.0], 'band': ['green']}
+
+
+def test_large():
+    start = datetime(2000, 1, 1, tzinfo=UTC)
+    values = [start + timedelta(hours=i) for i in range(100000)]
+    index = DimensionIndex(Dimension(
+        'time', 'ISO8601', values=values, nearest_value=True
+    ))
+    assert index.match(values[54321] + timedelta(minutes=20)) == [
+        values[54321]
+    ]
+
+
+def test_many_intervals():
+    rng = np.random.default_rng(42)
+    starts = rng.integers(0, 10000, 2000)
+    lengths = rng.integers(0, 200, 2000)
+    # a single long interval must not make lookups linear
+    ranges = [Range(0, 10000)] + [
+        Range(int(start), int(start + length))
+        for start, length in zip(starts, lengths)
+    ]
+    index = DimensionIndex(Dimension('elevation', 'm', values=ranges))
+
+    for low, high in [(-5, -1), (0, 0), (5000, 5000), (4000, 4100)]:
+        expected = sorted(
+            (r.start, r.stop) for r in ranges
+            if r.start <= high and r.stop >= low
+        )
+        assert sorted(
+            (index._ranges[i].start, index._ranges[i].stop)
+            for i in index._overlapping(low, high)
+        ) == expected
+
+    matched = index.match(Range(4000, 4100))
+    assert Range(4000.0, 4100.0, None) in matched
+    assert index.match(5000) == [5000]
+    assert 20000 not in index
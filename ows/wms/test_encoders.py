@@ -0,0 +1,94 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+from datetime import datetime
+
+import pytest
+
+from ows.test import assert_xml_equal
+from .types import ServiceCapabilities, Layer, Style, Dimension
+from .v11 import encoders as v11
+from .v13 import encoders as v13
+
+
+def make_layer_tree(depth, width):
+    style = Style(name='style', title='Style')
+    dimension = Dimension(name='time', units='ISO8601', values=[
+        datetime(2018, 5, 10), datetime(2018, 5, 11)
+    ])
+    root = Layer(title='root', crss=['EPSG:4326'], styles=[style])
+    layer = root
+    for i in range(depth):
+        sub_layer = Layer(
+            name=f'deep{i}', title=f'D\u00e9ep {i}', styles=[style],
+            dimensions=[dimension]
+        )
+        layer.layers.append(sub_layer)
+        layer = sub_layer
+
+    root.layers.extend(
+        Layer(
+            name=f'wide{i}', title='Wide', styles=[style],
+            dimensions=[dimension], min_scale_denominator=i + 1,
+        ) for i in range(width)
+    )
+    return root
+
+
+@pytest.fixture(params=[v11, v13], ids=['1.1', '1.3'])
+def encoders(request):
+    return request.param
+
+
+def test_stream_capabilities(encoders):
+    capabilities = ServiceCapabilities.with_defaults(
+        'http://provider.org', ['image/png'], ['text/xml'],
+        layer=make_layer_tree(5, 500),
+    )
+    expected = encoders.xml_encode_capabilities(
+        capabilities, encoding='utf-8'
+    ).value
+    result = encoders.xml_stream_capabilities(capabilities, chunk_size=4096)
+    chunks = list(result.value)
+    assert len(chunks) > 2
+    assert_xml_equal(b''.join(chunks), expected)
+    assert b''.join(chunks) == expected
+
+    capabilities.layer = None
+    assert b''.join(encoders.xml_stream_capabilities(capabilities).value) == \
+        encoders.xml_encode_capabilities(capabilities, encoding='utf-8').value
+
+
+def test_encode_capabilities_deep_layer_tree(encoders):
+    # deeper than the recursion limit
+    capabilities = ServiceCapabilities.with_defaults(
+        'http://provider.org', ['image/png'], ['text/xml'],
+        layer=make_layer_tree(2000, 0),
+    )
+    assert b''.join(encoders.xml_stream_capabilities(capabilities).value) == \
+        encoders.xml_encode_capabilities(capabilities, encoding='utf-8').value
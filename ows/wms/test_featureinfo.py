@@ -0,0 +1,109 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+import pytest
+
+from ows.util import Version
+from ows.common.types import BoundingBox
+from ows.cache import cache_key
+from .types import GetMapRequest, GetFeatureInfoRequest
+from .v11.decoders import kvp_decode_getfeatureinfo
+from .exceptions import InvalidPointException
+from .featureinfo import PixelGrid, feature_info_location, plan_feature_info
+
+np = pytest.importorskip('numpy')
+
+
+def make_request(crs, bbox, i, j, width=100, height=50, query_layers=('a',)):
+    return GetFeatureInfoRequest(
+        Version(1, 3, 0), ['a', 'b'], None, BoundingBox(crs, bbox), width,
+        height, 'image/png', list(query_layers), 'text/html', i, j
+    )
+
+
+def test_pixel_grid():
+    grid = PixelGrid('EPSG:3857', (0, 0, 1000, 500), 100, 50)
+    assert grid.pixel_size == (10, 10)
+    assert grid.coordinates(0, 0).tolist() == [5, 495]
+    assert grid.footprints(99, 49).tolist() == [990, 0, 1000, 10]
+    coordinates = grid.coordinates(np.arange(3), 0)
+    assert coordinates.shape == (3, 2)
+    assert coordinates[:, 0].tolist() == [5, 15, 25]
+    assert grid.contains([-1, 0, 99, 100], [0, 0, 49, 0]).tolist() == [
+        False, True, True, False
+    ]
+
+
+def test_pixel_grid_axis_order():
+    # latitude first
+    grid = PixelGrid('EPSG:4326', (-90, -180, 90, 180), 360, 180)
+    assert grid.pixel_size == (1, 1)
+    assert grid.coordinates(0, 0).tolist() == [89.5, -179.5]
+    assert grid.footprints(0, 0).tolist() == [89, -180, 90, -179]
+
+    grid = PixelGrid('CRS:84', (-180, -90, 180, 90), 360, 180)
+    assert grid.coordinates(0, 0).tolist() == [-179.5, 89.5]
+
+
+def test_feature_info_location():
+    request = kvp_decode_getfeatureinfo(
+        'service=WMS&version=1.1.1&request=GetFeatureInfo&layers=a&styles=s'
+        '&srs=EPSG:4326&bbox=-180,-90,180,90&width=360&height=180'
+        '&format=image/png&query_layers=a&info_format=text/html&x=10&y=20'
+    )
+    center, footprint = feature_info_location(request)
+    assert center == (69.5, -169.5)
+    assert footprint == (69, -170, 70, -169)
+
+    with pytest.raises(InvalidPointException) as excinfo:
+        feature_info_location(make_request('EPSG:3857', [0, 0, 1, 1], 0, 50))
+    assert excinfo.value.locator == 'j'
+
+
+def test_plan_feature_info():
+    requests = [
+        make_request('EPSG:3857', [0, 0, 1000, 500], 0, 0),
+        make_request('EPSG:4326', [0, 0, 50, 100], 1, 1),
+        make_request('EPSG:3857', [0, 0, 1000, 500], 99, 49, query_layers=['b']),
+        make_request('EPSG:3857', [0, 0, 1000, 500], 100, 0),
+    ]
+    plan = plan_feature_info(requests)
+    assert [len(query) for query in plan] == [3, 1]
+
+    query = plan[0]
+    assert query.indices.tolist() == [0, 2, 3]
+    assert query.query_layers == ['a', 'b']
+    assert query.coordinates[:2].tolist() == [[5, 495], [995, 5]]
+    assert query.valid.tolist() == [True, True, False]
+    assert query.key == cache_key(GetMapRequest(
+        Version(1, 3, 0), ['a', 'b'], None,
+        BoundingBox('EPSG:3857', [0, 0, 1000, 500]), 100, 50, 'image/png'
+    ))
+
+    # latitude first: pixel (1, 1) spans 48..49 N, 1..2 E
+    assert plan[1].footprints.tolist() == [[48, 1, 49, 2]]
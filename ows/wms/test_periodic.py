@@ -0,0 +1,170 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, date, timedelta, timezone
+
+import pytest
+
+from .types import Range
+from .periodic import PeriodicRange
+
+
+UTC = timezone.utc
+
+
+def test_datetime_range():
+    values = PeriodicRange.from_range(Range(
+        datetime(2000, 1, 1, tzinfo=UTC),
+        datetime(2020, 12, 31, tzinfo=UTC),
+        'PT1H'
+    ))
+    assert len(values) == 184080 + 1
+    assert values[0] == datetime(2000, 1, 1, tzinfo=UTC)
+    assert values[-1] == datetime(2020, 12, 31, tzinfo=UTC)
+    assert values[25] == datetime(2000, 1, 2, 1, tzinfo=UTC)
+    with pytest.raises(IndexError):
+        values[len(values)]
+
+    value = datetime(2010, 6, 1, 12, 30, tzinfo=UTC)
+    index = values.bisect_left(value)
+    assert values[index - 1] < value < values[index]
+    assert values.bisect_right(values[index]) == index + 1
+    assert values.index(values[index]) == index
+    assert values[index] in values
+    assert value not in values
+
+    sliced = values[24::24]
+    assert len(sliced) == len(values) // 24
+    assert sliced.step == timedelta(days=1)
+    assert list(sliced[:2]) == [
+        datetime(2000, 1, 2, tzinfo=UTC), datetime(2000, 1, 3, tzinfo=UTC)
+    ]
+    assert sliced.bisect_left(value) == 3804
+
+
+def test_calendar_months():
+    values = PeriodicRange(date(2020, 1, 31), date(2021, 1, 1), 'P1M')
+    assert list(values[:3]) == [
+        date(2020, 1, 31), date(2020, 2, 29), date(2020, 3, 31)
+    ]
+    assert len(values) == 12
+    assert values[1::2][1] == date(2020, 4, 30)
+    assert values.bisect_left(date(2020, 3, 1)) == 2
+
+    yearly = PeriodicRange(date(2000, 1, 1), date(2020, 1, 1), 'P1Y')
+    assert len(yearly) == 21
+    assert yearly[-1] == date(2020, 1, 1)
+
+
+@pytest.mark.parametrize('start, stop, resolution, expected', [
+    ('2000', '2010', 'P1Y', [date(2000, 1, 1), date(2010, 1, 1)]),
+    ('2000-01', '2000-12', 'P3M', [date(2000, 1, 1), date(2000, 10, 1)]),
+    ('0', '10', '2.5', [0.0, 10.0]),
+])
+def test_from_range(start, stop, resolution, expected):
+    values = PeriodicRange.from_range(Range(start, stop, resolution))
+    assert [values[0], values[-1]] == expected
+
+
+def test_date_bounds_sub_day_step():
+    hourly = PeriodicRange.from_range(Range('2000-01-01', '2020-12-31', 'PT1H'))
+    assert len(hourly) == 184080 + 1
+    assert list(hourly[:3]) == [
+        datetime(2000, 1, 1, hour, tzinfo=UTC) for hour in range(3)
+    ]
+    assert hourly[-1] == datetime(2020, 12, 31, tzinfo=UTC)
+
+    values = PeriodicRange.from_range(Range('2000-01-01', '2000-01-03', 'PT12H'))
+    assert list(values) == [
+        datetime(2000, 1, day, hour, tzinfo=UTC)
+        for day in (1, 2, 3) for hour in (0, 12)
+    ][:-1]
+    assert values.index(datetime(2000, 1, 2, tzinfo=UTC)) == 2
+
+    daily = PeriodicRange(date(2000, 1, 1), date(2000, 1, 3), timedelta(days=1))
+    assert list(daily) == [date(2000, 1, 1), date(2000, 1, 2), date(2000, 1, 3)]
+
+
+@pytest.mark.parametrize('start, stop, expected', [
+    ('2000-01-01', '2000-01-02T00:00:00Z', [
+        datetime(2000, 1, 1, tzinfo=UTC), datetime(2000, 1, 2, tzinfo=UTC)
+    ]),
+    (datetime(2000, 1, 1, 12), date(2000, 1, 3), [
+        datetime(2000, 1, 1, 12), datetime(2000, 1, 2, 12)
+    ]),
+])
+def test_mixed_bounds(start, stop, expected):
+    values = PeriodicRange.from_range(Range(start, stop, 'P1D'))
+    assert list(values) == expected
+
+
+def test_numeric_range():
+    values = PeriodicRange(0, 1, 0.1)
+    assert len(values) == 11
+    assert values.bisect_left(0.35) == 4
+    assert values.bisect_right(0.3) == bisect_right(list(values), 0.3)
+    assert values[::-1][0] == pytest.approx(1.0)
+    assert list(values[::-1]) == list(values)[::-1]
+    assert len(PeriodicRange(1, 0, 1)) == 0
+
+    with pytest.raises(ValueError):
+        PeriodicRange(0, 1, 0)
+
+
+@pytest.mark.parametrize('value', [-1, 0, 2.5, 3, 10, 11])
+def test_bisect_matches_list(value):
+    values = PeriodicRange(0, 10, 1)
+    assert values.bisect_left(value) == bisect_left(list(values), value)
+    assert values.bisect_right(value) == bisect_right(list(values), value)
+
+
+def test_to_numpy():
+    np = pytest.importorskip('numpy')
+    values = PeriodicRange(
+        datetime(2000, 1, 1, tzinfo=UTC), datetime(2000, 1, 2, tzinfo=UTC),
+        timedelta(hours=6)
+    )
+    array = values.to_numpy()
+    assert array.dtype == np.dtype('datetime64[us]')
+    assert array.tolist() == [value.replace(tzinfo=None) for value in values]
+    assert PeriodicRange(0, 1, 0.25)[1:].to_numpy().tolist() == [
+        0.25, 0.5, 0.75, 1.0
+    ]
+
+    months = PeriodicRange(date(2020, 1, 31), date(2021, 1, 1), 'P1M')
+    assert months.to_numpy().tolist() == [
+        datetime.combine(value, datetime.min.time()) for value in months
+    ]
+    yearly = PeriodicRange(date(2000, 1, 15), date(2020, 1, 1), 'P1Y')
+    assert yearly.to_numpy()[-1] == np.datetime64('2019-01-15')
+
+    hourly = PeriodicRange(date(2000, 1, 1), date(2000, 1, 2), 'PT12H')
+    assert hourly.to_numpy().tolist() == [
+        value.replace(tzinfo=None) for value in hourly
+    ]
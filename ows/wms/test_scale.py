@@ -0,0 +1,95 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+import pytest
+
+from ows.util import Version
+from ows.common.types import BoundingBox
+from .types import GetMapRequest
+from .v11.decoders import kvp_decode_getmap
+from .scale import (
+    CRS_UNITS, scale_denominator, crs_units, register_crs_units
+)
+
+
+def make_request(crs, bbox, width=256, version=Version(1, 3, 0)):
+    return GetMapRequest(
+        version, ['a'], None, BoundingBox(crs, bbox), width, width,
+        'image/png'
+    )
+
+
+def test_scale_denominator_projected():
+    origin = 20037508.3427892
+    request = make_request('EPSG:3857', [-origin, -origin, origin, origin])
+    # level 0 of WebMercatorQuad
+    assert scale_denominator(request) == pytest.approx(559082264.0287178)
+    assert scale_denominator(
+        make_request('EPSG:32633', [0, 0, 2800, 2800], width=100)
+    ) == pytest.approx(100000)
+
+
+def test_scale_denominator_geographic():
+    expected = 279541132.0143589
+    assert scale_denominator(
+        make_request('EPSG:4326', [-90, -180, 90, 0])
+    ) == pytest.approx(expected)
+    assert scale_denominator(
+        make_request('CRS:84', [-180, -90, 0, 90])
+    ) == pytest.approx(expected)
+    # WMS 1.1 bounding boxes are decoded in the axis order of the CRS
+    assert scale_denominator(kvp_decode_getmap(
+        'service=WMS&version=1.1.1&request=GetMap&layers=a&styles=s'
+        '&srs=EPSG:4326&bbox=-180,-90,0,90&width=256&height=256'
+        '&format=image/png'
+    )) == pytest.approx(expected)
+
+
+def test_unknown_crs():
+    request = make_request('EPSG:99999', [0, 0, 1, 1], width=1)
+    assert scale_denominator(request) is None
+    register_crs_units('EPSG:99999', 0.00028)
+    try:
+        assert crs_units('epsg:99999') == 0.00028
+        assert scale_denominator(request) == pytest.approx(1)
+    finally:
+        del CRS_UNITS['EPSG:99999']
+        crs_units.cache_clear()
+
+
+def test_registered_axis_order():
+    # EPSG:2180 has northing/easting axis order
+    register_crs_units('EPSG:2180', 1.0)
+    try:
+        request = make_request(
+            'urn:ogc:def:crs:EPSG::2180', [0, 0, 2800, 5600], width=100
+        )
+        assert scale_denominator(request) == pytest.approx(200000)
+    finally:
+        del CRS_UNITS['EPSG:2180']
+        crs_units.cache_clear()
@@ -0,0 +1,116 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+import pytest
+
+from ows.util import Version
+from ows.common.types import BoundingBox
+from .types import GetMapRequest
+from .v11.decoders import kvp_decode_getmap
+from .tiling import (
+    TileAlignmentIndex, TileMatrixSet, TileMatrix, web_mercator_quad,
+    world_crs84_quad
+)
+
+
+ORIGIN = 20037508.3427892
+
+
+def make_request(crs, bbox, size=256, version=Version(1, 3, 0)):
+    return GetMapRequest(
+        version, ['a'], None, BoundingBox(crs, bbox), size, size, 'image/png'
+    )
+
+
+@pytest.fixture(scope='module')
+def index():
+    return TileAlignmentIndex([web_mercator_quad(), world_crs84_quad()])
+
+
+def test_web_mercator_tile(index):
+    # tile z=2, x=1, y=2
+    span = 2 * ORIGIN / 4
+    tile = index.find(make_request('epsg:3857', [
+        -ORIGIN + span, ORIGIN - 3 * span, -ORIGIN + 2 * span, ORIGIN - 2 * span
+    ]))
+    assert tile.tile_matrix_set.identifier == 'WebMercatorQuad'
+    assert tile.tile_matrix.identifier == '2'
+    assert (tile.row, tile.col) == (2, 1)
+
+    # rounding of the bbox in the request
+    tile = index.find(make_request('EPSG:3857', [
+        round(v, 3) for v in (0, 0, span / 8, span / 8)
+    ]))
+    assert (tile.tile_matrix.identifier, tile.row, tile.col) == ('5', 15, 16)
+
+
+@pytest.mark.parametrize('crs, bbox, size, version', [
+    # not aligned to a tile
+    ('EPSG:3857', [1000, 0, ORIGIN / 2 + 1000, ORIGIN / 2], 256, '1.3.0'),
+    # not a tile size
+    ('EPSG:3857', [0, 0, ORIGIN / 2, ORIGIN / 2], 512, '1.3.0'),
+    # no such resolution
+    ('EPSG:3857', [0, 0, ORIGIN / 3, ORIGIN / 3], 256, '1.3.0'),
+    # outside the matrix
+    ('EPSG:3857', [ORIGIN, 0, 2 * ORIGIN, ORIGIN], 256, '1.3.0'),
+    # unknown CRS
+    ('EPSG:32633', [0, 0, ORIGIN, ORIGIN], 256, '1.3.0'),
+])
+def test_not_aligned(index, crs, bbox, size, version):
+    request = make_request(crs, bbox, size, Version.from_str(version))
+    assert index.find(request) is None
+
+
+def test_crs84_axis_order(index):
+    # level 1 of WorldCRS84Quad: 4x2 tiles of 90 degrees
+    tile = index.find(make_request('EPSG:4326', [0, -90, 90, 0]))
+    assert (tile.tile_matrix.identifier, tile.row, tile.col) == ('1', 0, 1)
+
+    tile = index.find(make_request('CRS:84', [-90, 0, 0, 90]))
+    assert (tile.tile_matrix.identifier, tile.row, tile.col) == ('1', 0, 1)
+
+    # WMS 1.1 bounding boxes are decoded in the axis order of the CRS
+    tile = index.find(kvp_decode_getmap(
+        'service=WMS&version=1.1.1&request=GetMap&layers=a&styles=s'
+        '&srs=EPSG:4326&bbox=-90,0,0,90&width=256&height=256'
+        '&format=image/png'
+    ))
+    assert (tile.tile_matrix.identifier, tile.row, tile.col) == ('1', 0, 1)
+
+
+def test_axis_order_from_crs():
+    # EPSG:3035 has northing/easting axis order
+    index = TileAlignmentIndex([TileMatrixSet('LAEA', ['EPSG:3035'], [
+        TileMatrix('0', 1000 / 0.00028, (2000000.0, 5500000.0), 10, 10),
+    ])])
+    tile = index.find(make_request(
+        'urn:ogc:def:crs:EPSG::3035',
+        [5500000 - 2 * 256000, 2000000 + 256000, 5500000 - 256000,
+         2000000 + 2 * 256000],
+    ))
+    assert (tile.tile_matrix.identifier, tile.row, tile.col) == ('0', 1, 1)
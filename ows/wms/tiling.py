@@ -0,0 +1,220 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" Detection of GetMap requests that exactly match a tile of a tile matrix
+    set, such as the ones issued by tiled map clients. Such requests can be
+    served from a store of pre-rendered tiles.
+"""
+
+from dataclasses import dataclass, field
+from math import log2
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ows.crs import normalize_crs, is_axis_order_swapped
+from .types import GetMapRequest
+
+
+# the standardized rendering pixel size of 0.28mm
+STANDARDIZED_PIXEL_SIZE = 0.00028
+
+# meters per degree on the equator of the WGS84 ellipsoid
+METERS_PER_DEGREE = 6378137.0 * 2 * 3.141592653589793 / 360
+
+# relative tolerance for resolutions and tile boundaries
+DEFAULT_EPSILON = 1e-6
+
+
+@dataclass
+class TileMatrix:
+    identifier: str
+    scale_denominator: float
+    top_left_corner: Tuple[float, float]
+    matrix_width: int
+    matrix_height: int
+    tile_width: int = 256
+    tile_height: int = 256
+
+
+@dataclass
+class TileMatrixSet:
+    """ A tile matrix set. The ``crss`` are the identifiers of the CRSs of
+        requests this set applies to. Request bounding boxes are decoded in
+        the axis order of the CRS, see :func:`ows.crs.is_axis_order_swapped`.
+    """
+    identifier: str
+    crss: List[str]
+    tile_matrices: List[TileMatrix]
+    meters_per_unit: float = 1.0
+
+    def resolution(self, tile_matrix: TileMatrix) -> float:
+        """ The size of a pixel of the tile matrix in CRS units.
+        """
+        scale = tile_matrix.scale_denominator
+        return scale * STANDARDIZED_PIXEL_SIZE / self.meters_per_unit
+
+
+def web_mercator_quad(levels: int = 25) -> TileMatrixSet:
+    """ The WebMercatorQuad tile matrix set of the OGC Two Dimensional Tile
+        Matrix Set standard.
+    """
+    origin = 20037508.3427892
+    return TileMatrixSet('WebMercatorQuad', ['EPSG:3857', 'EPSG:900913'], [
+        TileMatrix(
+            str(level), 559082264.0287178 / 2 ** level, (-origin, origin),
+            2 ** level, 2 ** level
+        )
+        for level in range(levels)
+    ])
+
+
+def world_crs84_quad(levels: int = 18) -> TileMatrixSet:
+    """ The WorldCRS84Quad tile matrix set of the OGC Two Dimensional Tile
+        Matrix Set standard.
+    """
+    return TileMatrixSet('WorldCRS84Quad', ['CRS:84', 'EPSG:4326'], [
+        TileMatrix(
+            str(level), 279541132.0143589 / 2 ** level, (-180.0, 90.0),
+            2 ** (level + 1), 2 ** level
+        )
+        for level in range(levels)
+    ], meters_per_unit=METERS_PER_DEGREE)
+
+
+@dataclass
+class AlignedTile:
+    tile_matrix_set: TileMatrixSet
+    tile_matrix: TileMatrix
+    row: int
+    col: int
+
+
+@dataclass
+class _Level:
+    tile_matrix_set: TileMatrixSet
+    tile_matrix: TileMatrix
+    resolution: float
+    tile_span_x: float
+    tile_span_y: float
+
+
+@dataclass
+class TileAlignmentIndex:
+    """ Decides whether GetMap requests are aligned to a tile of one of the
+        given tile matrix sets. The resolutions of all tile matrices are
+        precomputed and hashed by their (quantized) logarithm, so that
+        :meth:`find` takes constant time regardless of the number of tile
+        matrices.
+    """
+    tile_matrix_sets: Iterable[TileMatrixSet]
+    epsilon: float = DEFAULT_EPSILON
+    _levels: Dict[Tuple[str, int, int, int], List[_Level]] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    # whether the CRSs of the sets have y/x axis order, from ows.crs
+    _axis_orders: Dict[str, bool] = field(
+        init=False, repr=False, default_factory=dict
+    )
+
+    def __post_init__(self):
+        self.tile_matrix_sets = list(self.tile_matrix_sets)
+        for tile_matrix_set in self.tile_matrix_sets:
+            crss = dict.fromkeys(
+                normalize_crs(crs) for crs in tile_matrix_set.crss
+            )
+            for crs in crss:
+                self._axis_orders[crs] = is_axis_order_swapped(crs)
+                for tile_matrix in tile_matrix_set.tile_matrices:
+                    resolution = tile_matrix_set.resolution(tile_matrix)
+                    key = (
+                        crs, tile_matrix.tile_width, tile_matrix.tile_height,
+                        self._bucket(resolution)
+                    )
+                    self._levels.setdefault(key, []).append(_Level(
+                        tile_matrix_set, tile_matrix, resolution,
+                        resolution * tile_matrix.tile_width,
+                        resolution * tile_matrix.tile_height,
+                    ))
+
+    def _bucket(self, resolution: float) -> int:
+        # buckets are wide enough for resolutions within the tolerance to
+        # be in the same or a neighbouring bucket
+        return round(log2(resolution) / (2 * self.epsilon))
+
+    def find(self, request: GetMapRequest) -> Optional[AlignedTile]:
+        """ Returns the tile the request is aligned to or ``None``.
+        """
+        crs = normalize_crs(request.crs)
+        yx = self._axis_orders.get(crs)
+        if yx is None or request.width <= 0 or request.height <= 0:
+            return None
+
+        bbox = request.bbox
+        if yx:
+            min_y, min_x, max_y, max_x = bbox
+        else:
+            min_x, min_y, max_x, max_y = bbox
+
+        resolution_x = (max_x - min_x) / request.width
+        resolution_y = (max_y - min_y) / request.height
+        if resolution_x <= 0 or resolution_y <= 0 or \
+                abs(resolution_x - resolution_y) > self.epsilon * resolution_x:
+            return None
+
+        # check the neighbouring buckets, in case the resolution is close to
+        # the boundary of one
+        bucket = self._bucket(resolution_x)
+        for key in (bucket, bucket - 1, bucket + 1):
+            for level in self._levels.get(
+                    (crs, request.width, request.height, key), ()):
+                tile = self._match(level, min_x, max_y, resolution_x)
+                if tile is not None:
+                    return tile
+        return None
+
+    def _match(self, level: _Level, min_x: float, max_y: float,
+               resolution: float) -> Optional[AlignedTile]:
+        epsilon = self.epsilon
+        if abs(resolution - level.resolution) > epsilon * level.resolution:
+            return None
+
+        origin_x, origin_y = level.tile_matrix.top_left_corner
+        col = (min_x - origin_x) / level.tile_span_x
+        row = (origin_y - max_y) / level.tile_span_y
+        col_index = round(col)
+        row_index = round(row)
+        if abs(col - col_index) > epsilon or abs(row - row_index) > epsilon:
+            return None
+
+        tile_matrix = level.tile_matrix
+        if not 0 <= col_index < tile_matrix.matrix_width or \
+                not 0 <= row_index < tile_matrix.matrix_height:
+            return None
+
+        return AlignedTile(
+            level.tile_matrix_set, tile_matrix, row_index, col_index
+        )
@@ -0,0 +1,108 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" WMS 1.1.1 KVP decoders. These reuse the WMS 1.3 decoders and only
+    declare the differences of the earlier version: ``SRS`` instead of
+    ``CRS``, ``X``/``Y`` instead of ``I``/``J`` and bounding boxes which are
+    always in x/y (longitude/latitude) order. The decoded bounding boxes are
+    normalized to the axis order of the CRS, so that the resulting requests
+    are the same as for WMS 1.3.
+"""
+
+from ows import kvp
+from ows.decoder import upper
+from ows.util import Version
+from ows.crs import is_axis_order_swapped, swap_axes
+from ows.common.types import GetCapabilitiesRequest
+from ..v13 import decoders as v13
+
+
+# ------------------------------------------------------------------------------
+# GetCapabilities
+# ------------------------------------------------------------------------------
+
+
+class KVPGetCapabilitiesDecoder(kvp.Decoder):
+    object_class = GetCapabilitiesRequest
+
+    service = kvp.Parameter(type=upper, num='?', default='WMS')
+    version = kvp.Parameter(type=Version.from_str, num='?')
+    # WMS 1.0 used "WMTVER" for the version
+    wmtver = kvp.Parameter(type=Version.from_str, num='?')
+    update_sequence = kvp.Parameter('updatesequence', num='?')
+    format = kvp.Parameter(num='?')
+
+    def map_params(self, params):
+        version = params.pop('version')
+        wmtver = params.pop('wmtver')
+        version = version or wmtver
+        params['accept_versions'] = [version] if version else []
+        format_ = params.pop('format')
+        params['accept_formats'] = [format_] if format_ else []
+        return params
+
+
+def kvp_decode_getcapabilities(kvp):
+    decoder = KVPGetCapabilitiesDecoder(kvp)
+    return decoder.decode()
+
+
+# ------------------------------------------------------------------------------
+# GetMap
+# ------------------------------------------------------------------------------
+
+
+class KVPGetMapDecoder(v13.KVPGetMapDecoder):
+    crs = kvp.Parameter('srs', num=1)
+
+    def map_params(self, params):
+        params = super().map_params(params)
+        bounding_box = params['bounding_box']
+        if is_axis_order_swapped(bounding_box.crs):
+            bounding_box.bbox = swap_axes(bounding_box.bbox)
+        return params
+
+
+def kvp_decode_getmap(kvp):
+    decoder = KVPGetMapDecoder(kvp)
+    return decoder.decode()
+
+
+# ------------------------------------------------------------------------------
+# GetFeatureInfo
+# ------------------------------------------------------------------------------
+
+
+class KVPGetFeatureInfoDecoder(KVPGetMapDecoder, v13.KVPGetFeatureInfoDecoder):
+    i = kvp.Parameter('x', type=int, num=1)
+    j = kvp.Parameter('y', type=int, num=1)
+
+
+def kvp_decode_getfeatureinfo(kvp):
+    decoder = KVPGetFeatureInfoDecoder(kvp)
+    return decoder.decode()
@@ -0,0 +1,111 @@
+# ------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# ------------------------------------------------------------------------------
+# Copyright (C) 2020 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# ------------------------------------------------------------------------------
+
+
+from datetime import datetime, timezone
+
+from ows.util import Version
+from ows.common.types import GetCapabilitiesRequest
+from ..types import GetMapRequest, GetFeatureInfoRequest, BoundingBox
+from ..v13 import decoders as v13
+from .decoders import (
+    kvp_decode_getcapabilities, kvp_decode_getmap, kvp_decode_getfeatureinfo
+)
+
+
+# ------------------------------------------------------------------------------
+# GetCapabilities
+# ------------------------------------------------------------------------------
+
+def test_kvp_decode_getcapabilities():
+    request = "service=WMS&version=1.1.1&request=GetCapabilities&updatesequence=12&format=application/vnd.ogc.wms_xml"  # noqa
+    assert kvp_decode_getcapabilities(request) == GetCapabilitiesRequest(
+        'WMS',
+        update_sequence='12',
+        accept_versions=[Version(1, 1, 1)],
+        accept_formats=['application/vnd.ogc.wms_xml'],
+    )
+
+    # WMS 1.0 style
+    request = "request=capabilities&wmtver=1.0.0"
+    assert kvp_decode_getcapabilities(request) == GetCapabilitiesRequest(
+        'WMS', accept_versions=[Version(1, 0, 0)],
+    )
+
+
+# ------------------------------------------------------------------------------
+# GetMap
+# ------------------------------------------------------------------------------
+
+def test_kvp_decode_getmap():
+    request = "service=WMS&version=1.1.1&request=GetMap&layers=a,b,c&styles=s1,s2,&srs=EPSG:3857&bbox=0,0,10,10&width=256&height=256&format=image/jpeg&time=2012-01-01T00:00:00Z"  # noqa
+    assert kvp_decode_getmap(request) == GetMapRequest(
+        Version(1, 1, 1),
+        layers=['a', 'b', 'c'],
+        styles=['s1', 's2', None],
+        bounding_box=BoundingBox('EPSG:3857', [0, 0, 10, 10]),
+        width=256,
+        height=256,
+        format='image/jpeg',
+        time=datetime(2012, 1, 1, tzinfo=timezone.utc),
+        dimensions={}
+    )
+
+
+def test_kvp_decode_getmap_axis_order():
+    # WMS 1.1 bounding boxes are always longitude/latitude, they are
+    # normalized to the axis order of the CRS, as in WMS 1.3
+    request = "service=WMS&version=1.1.1&request=GetMap&layers=a&styles=s&srs=EPSG:4326&bbox=-180,-90,0,45&width=256&height=256&format=image/jpeg"  # noqa
+    decoded = kvp_decode_getmap(request)
+    assert decoded.bounding_box == BoundingBox('EPSG:4326', [-90, -180, 45, 0])
+
+    request13 = "service=WMS&version=1.3.0&request=GetMap&layers=a&styles=s&crs=EPSG:4326&bbox=-90,-180,45,0&width=256&height=256&format=image/jpeg"  # noqa
+    decoded13 = v13.kvp_decode_getmap(request13)
+    assert decoded.bounding_box == decoded13.bounding_box
+
+
+# ------------------------------------------------------------------------------
+# GetFeatureInfo
+# ------------------------------------------------------------------------------
+
+def test_kvp_decode_getfeatureinfo():
+    request = "service=WMS&version=1.1.1&request=GetFeatureInfo&layers=a,b,c&styles=s1,s2,&srs=EPSG:4326&bbox=0,0,10,20&width=256&height=256&format=image/jpeg&query_layers=a,b&info_format=text/xml&x=12&y=13&feature_count=15"  # noqa
+    assert kvp_decode_getfeatureinfo(request) == GetFeatureInfoRequest(
+        Version(1, 1, 1),
+        layers=['a', 'b', 'c'],
+        styles=['s1', 's2', None],
+        bounding_box=BoundingBox('EPSG:4326', [0, 0, 20, 10]),
+        width=256,
+        height=256,
+        format='image/jpeg',
+        dimensions={},
+        query_layers=['a', 'b'],
+        info_format='text/xml',
+        i=12,
+        j=13,
+        feature_count=15,
+    )
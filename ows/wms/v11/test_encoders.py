@@ -210,3 +210,21 @@ def test_encode_getfeatureinfo():
         j=12,
         feature_count=15,
     )
+
+
+def test_encode_getmap_axis_order():
+    from .decoders import kvp_decode_getmap
+    request = GetMapRequest(
+        Version(1, 1, 1),
+        layers=['a'],
+        styles=['s'],
+        bounding_box=BoundingBox('EPSG:4326', [-90, -180, 45, 0]),
+        width=256,
+        height=256,
+        format='image/jpeg',
+        dimensions={}
+    )
+    encoded = kvp_encode_get_map_request(request).value
+    assert 'srs=EPSG%3A4326' in encoded
+    assert 'bbox=-180%2C-90%2C0%2C45' in encoded
+    assert kvp_decode_getmap(encoded) == request
@@ -26,14 +26,18 @@
 # -------------------------------------------------------------------------------
 
 from datetime import date, datetime, timedelta
+from typing import Iterator
+
+from lxml import etree
 
 from ows.util import Result, isoformat, duration
+from ows.xml import encode_fragment, stream_element
 from ..types import (
     ServiceCapabilities, Operation, Layer, Style,
     Dimension, Range, GetMapRequest,
     DimensionValueType, DimensionResolutionType
 )
-from .namespaces import WMS, ns_xlink
+from .namespaces import WMS, ns_xlink, nsmap
 
 
 def reference_attrs(href=None, type=None, role=None, arcrole=None, title=None,
@@ -152,102 +156,183 @@ def encode_style(style: Style):
     )
 
 
-def encode_layer(layer: Layer):
-    return WMS('Layer',
+def _encode_layer_properties(layer: Layer):
+    return [
         WMS('Name', layer.name) if layer.name else None,
         WMS('Title', layer.title),
         WMS('Abstract', layer.abstract) if layer.abstract else None,
         WMS('KeywordList', *[
             WMS('Keyword', keyword)
             for keyword in layer.keywords
-        ]) if layer.keywords else None, *[
-            WMS('CRS', crs)
-            for crs in layer.crss
-        ] + [
-            WMS('EX_GeographicBoundingBox',
-                WMS('westBoundLongitude',
-                    str(layer.wgs84_bounding_box.bbox[0])
-                ),
-                WMS('eastBoundLongitude',
-                    str(layer.wgs84_bounding_box.bbox[2])
-                ),
-                WMS('southBoundLatitude',
-                    str(layer.wgs84_bounding_box.bbox[1])
-                ),
-                WMS('northBoundLatitude',
-                    str(layer.wgs84_bounding_box.bbox[3])
-                ),
-            ) if layer.wgs84_bounding_box else None
-        ] + [
-            WMS('BoundingBox',
-                CRS=bounding_box.crs,
-                minx=str(bounding_box.bbox[0]),
-                miny=str(bounding_box.bbox[1]),
-                maxx=str(bounding_box.bbox[2]),
-                maxy=str(bounding_box.bbox[3]),
-            ) for bounding_box in layer.bounding_boxes
-        ] + [
-            encode_dimension(dimension)
-            for dimension in layer.dimensions
-        ] + [
-            WMS('Attribution', layer.attribution)
-            if layer.attribution else None
-        ] + [
-            WMS('AuthorityURL',
-                WMS('OnlineResource', **reference_attrs(href=href)),
-                name=name,
-            )
-            for name, href in layer.authority_urls.items()
-        ] + [
-            WMS('Identifier',
-                identifier,
-                authority=identifier,
-            )
-            for authority, identifier in layer.identifiers.items()
-        ] + [
-            WMS('MetadataURL',
-                WMS('Format', metadata_url.format),
-                WMS('OnlineResource', **reference_attrs(
-                    href=metadata_url.href
-                )),
-                # type=metadata_url.type,
-            )
-            for metadata_url in layer.metadata_urls
-        ] + [
-            WMS('DataURL',
-                WMS('Format', data_url.format),
-                WMS('OnlineResource', **reference_attrs(
-                    href=data_url.href
-                )),
-            )
-            for data_url in layer.data_urls
-        ] + [
-            WMS('FeatureListURL',
-                WMS('Format', feature_list_url.format),
-                WMS('OnlineResource', **reference_attrs(
-                    href=feature_list_url.href
-                )),
-            )
-            for feature_list_url in layer.feature_list_urls
-        ] + [
-            encode_style(style)
-            for style in layer.styles
-        ] + [
-            WMS('MinScaleDenominator',
-                str(layer.min_scale_denominator)
-            ) if layer.min_scale_denominator else None,
-            WMS('MaxScaleDenominator',
-                str(layer.max_scale_denominator)
-            ) if layer.max_scale_denominator else None,
-        ] + [
-            encode_layer(sub_layer)
-            for sub_layer in layer.layers
-        ]
-    )
+        ]) if layer.keywords else None,
+    ] + [
+        WMS('CRS', crs)
+        for crs in layer.crss
+    ] + [
+        WMS('EX_GeographicBoundingBox',
+            WMS('westBoundLongitude',
+                str(layer.wgs84_bounding_box.bbox[0])
+            ),
+            WMS('eastBoundLongitude',
+                str(layer.wgs84_bounding_box.bbox[2])
+            ),
+            WMS('southBoundLatitude',
+                str(layer.wgs84_bounding_box.bbox[1])
+            ),
+            WMS('northBoundLatitude',
+                str(layer.wgs84_bounding_box.bbox[3])
+            ),
+        ) if layer.wgs84_bounding_box else None
+    ] + [
+        WMS('BoundingBox',
+            CRS=bounding_box.crs,
+            minx=str(bounding_box.bbox[0]),
+            miny=str(bounding_box.bbox[1]),
+            maxx=str(bounding_box.bbox[2]),
+            maxy=str(bounding_box.bbox[3]),
+        ) for bounding_box in layer.bounding_boxes
+    ]
 
 
-def xml_encode_capabilities(capabilities: ServiceCapabilities, **kwargs):
-    root = WMS('WMS_Capabilities',
+def _encode_layer_references(layer: Layer):
+    return [
+        WMS('Attribution', layer.attribution)
+        if layer.attribution else None
+    ] + [
+        WMS('AuthorityURL',
+            WMS('OnlineResource', **reference_attrs(href=href)),
+            name=name,
+        )
+        for name, href in layer.authority_urls.items()
+    ] + [
+        WMS('Identifier',
+            identifier,
+            authority=identifier,
+        )
+        for authority, identifier in layer.identifiers.items()
+    ] + [
+        WMS('MetadataURL',
+            WMS('Format', metadata_url.format),
+            WMS('OnlineResource', **reference_attrs(
+                href=metadata_url.href
+            )),
+            # type=metadata_url.type,
+        )
+        for metadata_url in layer.metadata_urls
+    ] + [
+        WMS('DataURL',
+            WMS('Format', data_url.format),
+            WMS('OnlineResource', **reference_attrs(
+                href=data_url.href
+            )),
+        )
+        for data_url in layer.data_urls
+    ] + [
+        WMS('FeatureListURL',
+            WMS('Format', feature_list_url.format),
+            WMS('OnlineResource', **reference_attrs(
+                href=feature_list_url.href
+            )),
+        )
+        for feature_list_url in layer.feature_list_urls
+    ]
+
+
+def _encode_layer_scale(layer: Layer):
+    return [
+        WMS('MinScaleDenominator',
+            str(layer.min_scale_denominator)
+        ) if layer.min_scale_denominator else None,
+        WMS('MaxScaleDenominator',
+            str(layer.max_scale_denominator)
+        ) if layer.max_scale_denominator else None,
+    ]
+
+
+def _encode_layer_element(layer: Layer):
+    children = _encode_layer_properties(layer)
+    children.extend(encode_dimension(dimension) for dimension in layer.dimensions)
+    children.extend(_encode_layer_references(layer))
+    children.extend(encode_style(style) for style in layer.styles)
+    children.extend(_encode_layer_scale(layer))
+    return WMS('Layer', *children)
+
+
+def encode_layer(layer: Layer):
+    # walk the tree with an explicit stack, as deeply nested layers would
+    # otherwise exceed the recursion limit
+    root = _encode_layer_element(layer)
+    stack = [(layer, root)]
+    while stack:
+        layer, element = stack.pop()
+        for sub_layer in layer.layers:
+            sub_element = _encode_layer_element(sub_layer)
+            element.append(sub_element)
+            stack.append((sub_layer, sub_element))
+    return root
+
+
+def iter_encode_layer_contents(layer: Layer, encoding='utf-8',
+                               chunk_size=65536) -> Iterator[bytes]:
+    """ Yields the encoded contents of the ``Layer`` element of ``layer``,
+        including all of its sub-layers, in chunks of about ``chunk_size``
+        bytes. Only the elements of a single layer are built at a time.
+        Styles and dimensions shared by several layers are encoded once.
+        The chunks are equal to the serialization of :func:`encode_layer`
+        and may only be embedded where the namespaces of ``nsmap`` are
+        declared.
+    """
+    open_tag = '<Layer>'.encode(encoding)
+    close_tag = '</Layer>'.encode(encoding)
+    # encoded styles and dimensions by identity. The objects are kept
+    # along, so that their ids cannot be reused during the encoding
+    fragments = {}
+
+    def encode_shared(item, encoder):
+        try:
+            return fragments[id(item)][1]
+        except KeyError:
+            encoded = encode_fragment([encoder(item)], nsmap, encoding)
+            fragments[id(item)] = (item, encoded)
+            return encoded
+
+    buffer = []
+    size = 0
+    stack = [layer]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, bytes):
+            buffer.append(item)
+            size += len(item)
+            continue
+
+        encoded = b''.join([
+            encode_fragment(_encode_layer_properties(item), nsmap, encoding),
+            *[
+                encode_shared(dimension, encode_dimension)
+                for dimension in item.dimensions
+            ],
+            encode_fragment(_encode_layer_references(item), nsmap, encoding),
+            *[encode_shared(style, encode_style) for style in item.styles],
+            encode_fragment(_encode_layer_scale(item), nsmap, encoding),
+        ])
+        buffer.append(encoded)
+        size += len(encoded)
+
+        for sub_layer in reversed(item.layers):
+            stack.extend((close_tag, sub_layer, open_tag))
+
+        if size >= chunk_size:
+            yield b''.join(buffer)
+            buffer = []
+            size = 0
+
+    if buffer:
+        yield b''.join(buffer)
+
+
+def _encode_capabilities(capabilities: ServiceCapabilities, layer=None):
+    return WMS('WMS_Capabilities',
         WMS('Service',
             WMS('Name', 'WMS'),
             WMS('Title', capabilities.title or ''),
@@ -314,7 +399,7 @@ def xml_encode_capabilities(capabilities: ServiceCapabilities, **kwargs):
                 WMS('Format', exception_format)
                 for exception_format in capabilities.exception_formats
             ]),
-            encode_layer(capabilities.layer) if capabilities.layer else None,
+            layer,
         ),
         version=(
             str(capabilities.service_type_versions[0])
@@ -323,9 +408,34 @@ def xml_encode_capabilities(capabilities: ServiceCapabilities, **kwargs):
         updateSequence=capabilities.update_sequence
     )
 
+
+def xml_encode_capabilities(capabilities: ServiceCapabilities, **kwargs):
+    root = _encode_capabilities(
+        capabilities,
+        encode_layer(capabilities.layer) if capabilities.layer else None,
+    )
     return Result.from_etree(root, **kwargs)
 
 
+def xml_stream_capabilities(capabilities: ServiceCapabilities,
+                            encoding='utf-8', chunk_size=65536, **kwargs):
+    """ Encodes the capabilities like :func:`xml_encode_capabilities`, but
+        as a streaming result, without building the element tree of the
+        layers. Intended for services with large layer trees.
+    """
+    if not capabilities.layer:
+        root = _encode_capabilities(capabilities)
+        chunks = [etree.tostring(root, encoding=encoding, **kwargs)]
+    else:
+        placeholder = WMS('Layer')
+        root = _encode_capabilities(capabilities, placeholder)
+        chunks = stream_element(root, placeholder, iter_encode_layer_contents(
+            capabilities.layer, encoding, chunk_size
+        ), encoding, **kwargs)
+
+    return Result.from_chunks(chunks, content_type='application/xml')
+
+
 def _encode_dimension(values, value_encoder=str, resolution_encoder=str):
     values = [values] if not isinstance(values, list) else values
 
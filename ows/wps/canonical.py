@@ -0,0 +1,201 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" Canonical keys for WPS Execute requests, see :mod:`ows.cache` for the
+    keys of the other request types.
+
+    Requests only differing in the order of their inputs, in the notation
+    of their literal values or bounding boxes, or in the serialization of
+    their XML inputs (attribute order, namespace prefixes in scope, empty
+    elements) share the same key.
+"""
+
+from hashlib import blake2b, sha256
+import json
+from typing import Dict, List
+
+from lxml import etree
+
+from ows.cache import (
+    DEFAULT_PRECISION, KEY_SIZE, SEPARATOR, canonical_crs, quantize_number
+)
+from ows.common.types import BoundingBox
+from .v20.types import (
+    ExecuteRequest, Input, OutputDefinition, Data, Reference, LiteralValue
+)
+from .inputstore import SpooledInput
+
+
+FLOAT_DATA_TYPES = ('double', 'float', 'decimal')
+INTEGER_DATA_TYPES = (
+    'integer', 'int', 'long', 'short', 'byte', 'nonnegativeinteger',
+    'positiveinteger', 'nonpositiveinteger', 'negativeinteger',
+)
+
+
+def _literal(literal: LiteralValue, precision: int) -> List[str]:
+    data_type = literal.data_type or ''
+    # xs:double, http://www.w3.org/2001/XMLSchema#double
+    local_type = data_type.rsplit('#', 1)[-1].rsplit(':', 1)[-1].lower()
+    value = literal.value
+    if isinstance(value, str):
+        value = value.strip()
+    try:
+        if local_type in FLOAT_DATA_TYPES:
+            value = quantize_number(value, precision)
+        elif local_type in INTEGER_DATA_TYPES:
+            value = str(int(value))
+        elif local_type == 'boolean':
+            value = str(str(value).lower() in ('true', '1')).lower()
+    except (ValueError, OverflowError):
+        pass
+    return ['literal', str(value), local_type, literal.uom or '']
+
+
+def _is_element(value) -> bool:
+    return isinstance(value, etree._Element) and isinstance(value.tag, str)
+
+
+def _is_element_list(value) -> bool:
+    return isinstance(value, list) and bool(value) and all(
+        isinstance(item, etree._Element) for item in value
+    )
+
+
+def canonical_xml(value) -> bytes:
+    """ The exclusive canonical XML (C14N) of an element or of the list of
+        elements the decoder produces for inline XML data. Comments and
+        processing instructions are skipped.
+    """
+    if not isinstance(value, list):
+        value = [value]
+    return b''.join(
+        etree.tostring(
+            element, method='c14n', exclusive=True, with_comments=False,
+            with_tail=False,
+        )
+        for element in value if _is_element(element)
+    )
+
+
+def _data_value(value, precision: int) -> List[str]:
+    if isinstance(value, LiteralValue):
+        return _literal(value, precision)
+    elif isinstance(value, BoundingBox):
+        return ['bbox', canonical_crs(value.crs)] + [
+            quantize_number(v, precision) for v in value.bbox
+        ]
+    elif _is_element(value) or _is_element_list(value):
+        return ['xml', canonical_xml(value).decode('utf-8')]
+    elif isinstance(value, bytes):
+        return ['bytes', sha256(value).hexdigest()]
+    elif isinstance(value, SpooledInput):
+        return ['bytes', value.digest]
+    return ['text', str(value)]
+
+
+def _inputs(inputs: List[Input], precision: int,
+            reference_digests: Dict[int, str]) -> list:
+    parts = []
+    # the order of inputs with different identifiers is irrelevant
+    for input_ in sorted(inputs or (), key=lambda i: i.identifier):
+        data = input_.data
+        if isinstance(data, Reference):
+            digest = reference_digests.get(id(data))
+            if digest is not None:
+                value = ['content', digest]
+            else:
+                value = [
+                    'reference', data.href, data.body or '',
+                    data.body_reference_href or '',
+                ]
+        elif isinstance(data, Data):
+            value = _data_value(data.value, precision)
+        else:
+            value = _inputs(input_.inputs, precision, reference_digests)
+
+        format_ = [
+            data.mime_type or '', data.encoding or '', data.schema or ''
+        ] if data is not None else []
+        parts.append([input_.identifier, value, format_])
+    return parts
+
+
+def _outputs(output_definitions: List[OutputDefinition]) -> list:
+    return [
+        [
+            output.identifier,
+            output.transmission.value if output.transmission else '',
+            output.mime_type or '', output.encoding or '', output.schema or '',
+            _outputs(output.output_definitions),
+        ]
+        for output in sorted(
+            output_definitions or (), key=lambda o: o.identifier
+        )
+    ]
+
+
+def canonical_form(request: ExecuteRequest, process_version=None,
+                   fetched=None,
+                   precision: int = DEFAULT_PRECISION) -> bytes:
+    """ The canonical serialization of an Execute request, see
+        :func:`execute_cache_key`.
+    """
+    reference_digests = {
+        id(item.reference): item.digest for item in fetched or ()
+    }
+    return SEPARATOR.join([
+        'Execute',
+        str(request.version),
+        request.process_id,
+        str(process_version or ''),
+        request.response.value if request.response else '',
+        json.dumps(
+            _inputs(request.inputs, precision, reference_digests),
+            separators=(',', ':'), ensure_ascii=False,
+        ),
+        json.dumps(
+            _outputs(request.output_definitions),
+            separators=(',', ':'), ensure_ascii=False,
+        ),
+    ]).encode('utf-8')
+
+
+def execute_cache_key(request: ExecuteRequest, process_version=None,
+                      fetched=None,
+                      precision: int = DEFAULT_PRECISION) -> bytes:
+    """ The key of an Execute request, including the version of the
+        process. Inputs passed by reference are identified by the digest
+        of their content when they were fetched (see
+        :class:`ows.wps.references.FetchedReference`), by their URL and body
+        otherwise. The execution mode is not part of the key.
+    """
+    return blake2b(
+        canonical_form(request, process_version, fetched, precision),
+        digest_size=KEY_SIZE
+    ).digest()
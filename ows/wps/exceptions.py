@@ -0,0 +1,137 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+class NoSuchProcessException(Exception):
+    """ A request referenced a process that is not offered by the server.
+    """
+    code = "NoSuchProcess"
+
+    def __init__(self, process_id):
+        super().__init__("No such process '%s'" % process_id)
+        self.locator = process_id
+
+
+class NoSuchJobException(Exception):
+    """ A request referenced an unknown, expired or dismissed job.
+    """
+    code = "NoSuchJob"
+
+    def __init__(self, job_id):
+        super().__init__("No such job '%s'" % job_id)
+        self.locator = job_id
+
+
+class ResultNotReadyException(Exception):
+    """ The result of a job was requested before the job finished.
+    """
+    code = "ResultNotReady"
+
+    def __init__(self, job_id):
+        super().__init__("The result of job '%s' is not ready" % job_id)
+        self.locator = job_id
+
+
+class ServerBusyException(Exception):
+    """ The server cannot accept any more jobs at the moment.
+    """
+    code = "ServerBusy"
+    locator = None
+
+    def __init__(self, message="The server is too busy to accept the job"):
+        super().__init__(message)
+
+
+class JobFailedException(Exception):
+    """ Reports the failure of a job, when its result is requested.
+    """
+    code = "NoApplicableCode"
+
+    def __init__(self, job_id, message=None):
+        super().__init__(message or "Job '%s' failed" % job_id)
+        self.locator = job_id
+
+
+class DataNotAccessibleException(Exception):
+    """ An input passed by reference could not be retrieved.
+    """
+    code = "DataNotAccessible"
+
+    def __init__(self, message, locator=None):
+        super().__init__(message)
+        self.locator = locator
+
+
+class SizeExceededException(Exception):
+    """ An input exceeds the maximum size allowed by its format.
+    """
+    code = "SizeExceeded"
+
+    def __init__(self, message, locator=None):
+        super().__init__(message)
+        self.locator = locator
+
+
+class NoSuchInputException(Exception):
+    """ An input of an Execute request is not offered by the process.
+    """
+    code = "NoSuchInput"
+
+    def __init__(self, identifier):
+        super().__init__("No such input '%s'" % identifier)
+        self.locator = identifier
+
+
+class NoSuchOutputException(Exception):
+    """ An output of an Execute request is not offered by the process.
+    """
+    code = "NoSuchOutput"
+
+    def __init__(self, identifier):
+        super().__init__("No such output '%s'" % identifier)
+        self.locator = identifier
+
+
+class NoSuchFormatException(Exception):
+    """ An input or output uses a format that is not supported for it.
+    """
+    code = "NoSuchFormat"
+
+    def __init__(self, message, locator=None):
+        super().__init__(message)
+        self.locator = locator
+
+
+class WrongInputDataException(Exception):
+    """ The value of an input does not match its description, for example
+        because it is outside the allowed values.
+    """
+    code = "WrongInputData"
+
+    def __init__(self, message, locator=None):
+        super().__init__(message)
+        self.locator = locator
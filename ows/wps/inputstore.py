@@ -0,0 +1,336 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" Spooling of large inline inputs of WPS Execute requests.
+
+    Decoded complex data is kept as lxml elements or strings, which use
+    several times the memory of their serialized form and keep the whole
+    request document alive. The :class:`InputStore` serializes inline
+    values once, keeps small ones in memory within a budget and spills the
+    others to temporary files. Base64 encoded values are decoded on the
+    way, piece by piece. Processes access all of them uniformly with
+    :func:`open_input`.
+"""
+
+import binascii
+from contextlib import contextmanager
+from dataclasses import dataclass
+from hashlib import sha256
+from io import BytesIO
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+from typing import BinaryIO, Dict, Iterator, List, Union
+
+from lxml import etree
+
+from .v20.types import ExecuteRequest, Input, Data, LiteralValue
+from .references import MEGABYTE
+
+
+@dataclass
+class SpooledInput:
+    """ The serialized content of an inline input, either in memory
+        (``content``) or in a file (``path``).
+    """
+    size: int
+    digest: str
+    path: str = None
+    content: bytes = None
+
+    def open(self) -> BinaryIO:
+        """ Open the content as a binary file object.
+        """
+        if self.content is not None:
+            return BytesIO(self.content)
+        return open(self.path, 'rb')
+
+    def read(self) -> bytes:
+        if self.content is not None:
+            return self.content
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    @contextmanager
+    def map(self) -> Iterator[memoryview]:
+        """ A read-only view of the content, memory-mapped for spilled
+            inputs. The view must not be used after leaving the context.
+        """
+        if self.content is not None:
+            with memoryview(self.content) as view:
+                yield view
+            return
+        if not self.size:
+            yield memoryview(b'')
+            return
+
+        with open(self.path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with memoryview(mapped) as view:
+                yield view
+        finally:
+            try:
+                mapped.close()
+            except BufferError:
+                # slices of the view are still alive, the mapping is
+                # closed once they are garbage collected
+                pass
+
+
+class _Spool:
+    """ Collects the serialized content in memory and moves it to a file
+        once it exceeds the limit.
+    """
+
+    def __init__(self, directory: str, limit: int):
+        self.directory = directory
+        self.limit = limit
+        self.size = 0
+        self.path = None
+        self._chunks = []
+        self._file = None
+        self._hash = sha256()
+
+    def write(self, chunk: bytes):
+        if not chunk:
+            return
+        self.size += len(chunk)
+        self._hash.update(chunk)
+        if self._file is None and self.size > self.limit:
+            fd, self.path = tempfile.mkstemp(dir=self.directory)
+            self._file = os.fdopen(fd, 'wb')
+            self._file.writelines(self._chunks)
+            self._chunks = []
+
+        if self._file is not None:
+            self._file.write(chunk)
+        else:
+            self._chunks.append(bytes(chunk))
+
+    def close(self) -> SpooledInput:
+        digest = self._hash.hexdigest()
+        if self._file is not None:
+            self._file.close()
+            return SpooledInput(self.size, digest, path=self.path)
+        return SpooledInput(self.size, digest, content=b''.join(self._chunks))
+
+    def discard(self):
+        if self._file is not None:
+            self._file.close()
+            os.remove(self.path)
+
+
+def _write_base64(spool: _Spool, text: str, chunk_size: int):
+    rest = ''
+    for start in range(0, len(text), chunk_size):
+        # whitespace may occur anywhere in the encoded text
+        piece = rest + ''.join(text[start:start + chunk_size].split())
+        cut = len(piece) - len(piece) % 4
+        spool.write(binascii.a2b_base64(piece[:cut]))
+        rest = piece[cut:]
+    if rest:
+        raise ValueError('Invalid base64 encoded data')
+
+
+def _is_element(value) -> bool:
+    return isinstance(value, etree._Element) \
+        and isinstance(value.tag, str)
+
+
+def _serialize(element) -> bytes:
+    return etree.tostring(
+        element, encoding='utf-8', xml_declaration=False, with_tail=False
+    )
+
+
+class InputStore:
+    """ Replaces the inline complex data of requests with
+        :class:`SpooledInput` handles.
+
+        :param directory: where the spilled inputs are stored, a new
+                          temporary directory by default
+        :param threshold: the size in bytes above which inputs are spilled
+                          to disk
+        :param memory_budget: the total size of inputs kept in memory. Once
+                              it is used up, all further inputs are spilled.
+        :param min_size: values (e.g. literals) shorter than this are left
+                         as they are
+        :param chunk_size: the size of the pieces base64 data is decoded in
+    """
+
+    def __init__(self, directory: str = None, threshold: int = MEGABYTE,
+                 memory_budget: int = 64 * MEGABYTE, min_size: int = 1024,
+                 chunk_size: int = 64 * 1024):
+        self._owns_directory = directory is None
+        self.directory = directory or tempfile.mkdtemp(prefix='wps-inputs-')
+        self.threshold = threshold
+        self.memory_budget = memory_budget
+        self.min_size = min_size
+        self.chunk_size = chunk_size
+        self.memory_used = 0
+        self._spooled: Dict[str, List[SpooledInput]] = {}
+        self._lock = threading.Lock()
+
+    def _reserve(self, size: int) -> bool:
+        with self._lock:
+            if size > self.threshold \
+                    or self.memory_used + size > self.memory_budget:
+                return False
+            self.memory_used += size
+            return True
+
+    def spool_data(self, data: Data, owner: str) -> Data:
+        """ Spool the value of the data, if it is complex: XML elements, or
+            text of at least ``min_size`` characters with a mime type or
+            encoding. Detaches spooled elements from their document, so that
+            they can be freed.
+        """
+        value = data.value
+        elements = None
+        text = None
+        if isinstance(value, list) and value and all(
+            isinstance(item, etree._Element) for item in value
+        ):
+            elements = value
+        elif _is_element(value):
+            elements = [value]
+        elif not (data.mime_type or data.encoding):
+            # literal values without a format are left to the process
+            return data
+        elif isinstance(value, LiteralValue) \
+                and isinstance(value.value, str):
+            text = value.value
+        elif isinstance(value, (str, bytes)):
+            text = value
+        else:
+            return data
+
+        base64_encoded = (data.encoding or '').lower() == 'base64'
+        if text is not None and len(text) < self.min_size:
+            return data
+
+        spool = _Spool(self.directory, self.threshold)
+        try:
+            if elements is not None:
+                for element in elements:
+                    spool.write(_serialize(element))
+            elif base64_encoded:
+                if isinstance(text, bytes):
+                    text = text.decode('ascii')
+                _write_base64(spool, text, self.chunk_size)
+            else:
+                spool.write(
+                    text if isinstance(text, bytes) else text.encode('utf-8')
+                )
+        except BaseException:
+            spool.discard()
+            raise
+
+        spooled = spool.close()
+        if spooled.content is not None and not self._reserve(spooled.size):
+            # over budget: write the content after all
+            fd, path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(spooled.content)
+            spooled = SpooledInput(spooled.size, spooled.digest, path=path)
+
+        with self._lock:
+            self._spooled.setdefault(owner, []).append(spooled)
+
+        for element in elements or ():
+            parent = element.getparent()
+            if parent is not None:
+                parent.remove(element)
+
+        return Data(
+            spooled, data.mime_type,
+            None if base64_encoded else data.encoding, data.schema,
+        )
+
+    def spool_inputs(self, inputs: List[Input], owner: str) -> List[Input]:
+        """ Spool the inline data of the inputs, including nested ones, in
+            place.
+        """
+        stack = list(inputs or ())
+        while stack:
+            input_ = stack.pop()
+            if isinstance(input_.data, Data):
+                input_.data = self.spool_data(input_.data, owner)
+            elif input_.inputs:
+                stack.extend(input_.inputs)
+        return inputs
+
+    def spool_request(self, request: ExecuteRequest,
+                      owner: str) -> ExecuteRequest:
+        self.spool_inputs(request.inputs, owner)
+        return request
+
+    def release(self, owner: str):
+        """ Remove the spooled inputs of the owner, e.g. a job.
+        """
+        with self._lock:
+            spooled = self._spooled.pop(owner, ())
+            for item in spooled:
+                if item.content is not None:
+                    self.memory_used -= item.size
+        for item in spooled:
+            if item.path is not None:
+                try:
+                    os.remove(item.path)
+                except FileNotFoundError:
+                    pass
+
+    def close(self):
+        """ Remove all spooled inputs and the temporary directory.
+        """
+        for owner in list(self._spooled):
+            self.release(owner)
+        if self._owns_directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def open_input(data: Union[Data, SpooledInput, bytes, str]) -> BinaryIO:
+    """ Uniform binary file access to the value of an input: spooled
+        content, bytes, text, literal values or XML elements.
+    """
+    value = data.value if isinstance(data, Data) else data
+    if isinstance(value, SpooledInput):
+        return value.open()
+    elif isinstance(value, LiteralValue):
+        value = value.value
+    elif _is_element(value):
+        value = _serialize(value)
+    elif isinstance(value, list):
+        value = b''.join(_serialize(item) for item in value)
+
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    return BytesIO(value)
@@ -0,0 +1,673 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" An in-process engine for asynchronous WPS 2.0 jobs.
+
+    The :class:`JobManager` runs decoded ``ExecuteRequest`` objects on a
+    pool of threads or processes and answers ``GetStatus``, ``GetResult``
+    and ``Dismiss`` requests. Processes are plain functions, called with
+    the request and a :class:`JobContext`:
+
+    .. code-block:: python
+
+        def buffer(request, context):
+            for step in range(100):
+                context.check_cancelled()
+                ...
+                context.progress(step)
+            return {'BUFFERED_GEOMETRY': geometry}
+
+        manager = JobManager({'buffer': buffer}, concurrency_limits={
+            'buffer': 2,
+        })
+        status_info = manager.execute(request)
+"""
+
+import asyncio
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from functools import partial
+from itertools import takewhile
+import multiprocessing
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from uuid import uuid4
+
+from ows.util import UTC
+from .types import JobStatus, StatusInfo
+from .status import PollScheduler, StatusWaiters
+from .v20.types import (
+    ExecuteRequest, ExecutionMode, GetStatusRequest, GetResultRequest,
+    DismissRequest
+)
+from .exceptions import (
+    NoSuchProcessException, NoSuchJobException, ResultNotReadyException,
+    ServerBusyException, JobFailedException
+)
+
+
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+
+class JobCancelled(Exception):
+    """ Raised by :meth:`JobContext.check_cancelled` when the job was
+        dismissed.
+    """
+
+
+class JobContext:
+    """ Passed to the process functions to report the progress of the job
+        and to check whether it was dismissed. The state is kept in
+        mappings provided by the executor, which may be shared with other
+        processes.
+    """
+
+    def __init__(self, job_id: str, progress, cancelled):
+        self.job_id = job_id
+        self._progress = progress
+        self._cancelled = cancelled
+
+    def progress(self, percent_completed: int,
+                 estimated_completion: datetime = None):
+        """ Report the progress of the job. Without an explicit estimate,
+            the completion is extrapolated from the progress so far.
+        """
+        self._progress[self.job_id] = (
+            percent_completed, estimated_completion
+        )
+
+    def get_progress(self) -> Tuple[Optional[int], Optional[datetime]]:
+        return self._progress.get(self.job_id, (None, None))
+
+    @property
+    def cancelled(self) -> bool:
+        return self.job_id in self._cancelled
+
+    def check_cancelled(self):
+        """ Raises :class:`JobCancelled` if the job was dismissed. Processes
+            shall call this regularly to stop early.
+        """
+        if self.cancelled:
+            raise JobCancelled(self.job_id)
+
+    def cancel(self):
+        self._cancelled[self.job_id] = True
+
+    def release(self):
+        self._progress.pop(self.job_id, None)
+        self._cancelled.pop(self.job_id, None)
+
+
+ProcessFunction = Callable[[ExecuteRequest, JobContext], Any]
+
+
+class _PoolJobExecutor:
+    def __init__(self, pool, max_workers: int, progress, cancelled):
+        self.max_workers = max_workers
+        self._pool = pool
+        self._progress = progress
+        self._cancelled = cancelled
+
+    def create_context(self, job_id: str) -> JobContext:
+        return JobContext(job_id, self._progress, self._cancelled)
+
+    def submit(self, function: ProcessFunction, request: ExecuteRequest,
+               context: JobContext) -> Future:
+        return self._pool.submit(function, request, context)
+
+    def shutdown(self, wait=True):
+        self._pool.shutdown(wait)
+
+
+class ThreadJobExecutor(_PoolJobExecutor):
+    """ Runs jobs on a pool of threads.
+    """
+
+    def __init__(self, max_workers: int = None):
+        max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        super().__init__(
+            ThreadPoolExecutor(max_workers, thread_name_prefix='wps-job'),
+            max_workers, {}, {}
+        )
+
+
+class ProcessJobExecutor(_PoolJobExecutor):
+    """ Runs jobs on a pool of processes. The process functions, requests
+        and outputs must be picklable. Progress and cancellation are shared
+        through a ``multiprocessing`` manager.
+    """
+
+    def __init__(self, max_workers: int = None, mp_context=None):
+        max_workers = max_workers or os.cpu_count() or 1
+        mp_context = mp_context or multiprocessing.get_context()
+        self._manager = mp_context.Manager()
+        super().__init__(
+            ProcessPoolExecutor(max_workers, mp_context=mp_context),
+            max_workers, self._manager.dict(), self._manager.dict()
+        )
+
+    def shutdown(self, wait=True):
+        super().shutdown(wait)
+        self._manager.shutdown()
+
+
+@dataclass
+class JobResult:
+    """ The result of a successful job: the outputs as returned by the
+        process function.
+    """
+    job_id: str
+    outputs: Any
+    expiration_date: datetime = None
+
+
+@dataclass
+class _StoredJob:
+    process_id: str
+    status_info: StatusInfo
+    outputs: Any = None
+    message: str = None
+
+
+class MemoryJobStore:
+    """ Keeps the status and outputs of jobs in memory.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, _StoredJob] = {}
+        self._lock = threading.Lock()
+
+    def add(self, process_id: str, status_info: StatusInfo,
+            request: ExecuteRequest = None):
+        with self._lock:
+            self._jobs[status_info.job_id] = _StoredJob(
+                process_id, replace(status_info)
+            )
+
+    def update(self, status_info: StatusInfo):
+        with self._lock:
+            job = self._jobs.get(status_info.job_id)
+            if job is not None:
+                job.status_info = replace(status_info)
+
+    def finish(self, status_info: StatusInfo, outputs: Any = None,
+               message: str = None):
+        """ Store the final status of a job along with its outputs or the
+            error message.
+        """
+        with self._lock:
+            job = self._jobs.get(status_info.job_id)
+            if job is not None:
+                job.status_info = replace(status_info)
+                job.outputs = outputs
+                job.message = message
+
+    def get_status(self, job_id: str) -> Optional[StatusInfo]:
+        job = self._jobs.get(job_id)
+        return replace(job.status_info) if job is not None else None
+
+    def get_outputs(self, job_id: str) -> Tuple[Any, Optional[str]]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None, None
+        return job.outputs, job.message
+
+    def remove(self, job_id: str) -> bool:
+        with self._lock:
+            return self._jobs.pop(job_id, None) is not None
+
+    def claim_interrupted(self) -> List[Tuple[str, ExecuteRequest]]:
+        """ Jobs in memory cannot outlive their manager, so there are no
+            interrupted jobs to take over.
+        """
+        return []
+
+    def expired(self, now: datetime) -> List[str]:
+        """ The IDs of the jobs with an expiration date before ``now``.
+        """
+        expired = []
+        for job_id, job in list(self._jobs.items()):
+            expiration_date = job.status_info.expiration_date
+            if expiration_date is not None and expiration_date <= now:
+                expired.append(job_id)
+        return expired
+
+
+@dataclass
+class _Job:
+    job_id: str
+    request: ExecuteRequest
+    function: ProcessFunction
+    context: JobContext
+    started: datetime = None
+    future: Future = None
+    done: threading.Event = field(default_factory=threading.Event)
+    # the key of the request in the result cache, if it is cached
+    cache_key: bytes = None
+
+
+class JobManager:
+    """ Runs WPS processes as jobs and keeps track of their status.
+
+        :param processes: the process functions by process identifier
+        :param executor: a :class:`ThreadJobExecutor` (the default) or a
+                         :class:`ProcessJobExecutor`
+        :param store: where the status and outputs of the jobs are kept,
+                      a :class:`MemoryJobStore` by default
+        :param max_queued: the maximum number of jobs waiting to be run.
+                           Further jobs are rejected with a
+                           :class:`ServerBusyException`.
+        :param concurrency_limits: the maximum number of concurrently
+                                   running jobs per process identifier
+        :param poll_interval: the interval suggested to clients to poll
+                              the status of jobs, as long as nothing is
+                              known about their duration
+        :param result_ttl: how long the results of finished jobs are kept
+        :param result_cache: an :class:`ows.wps.resultcache.ExecuteResultCache`
+                             to reuse the outputs of earlier jobs with the
+                             same inputs
+        :param validators: the :class:`ows.wps.validation.ProcessValidator`
+                           by process identifier. Requests are validated
+                           before a job is created for them.
+        :param poll_scheduler: the :class:`ows.wps.status.PollScheduler`
+                               suggesting the next poll of jobs
+        :param input_store: an :class:`ows.wps.inputstore.InputStore` to
+                            spool the large inline inputs of the requests
+                            (in place) while their jobs are queued and run
+    """
+
+    def __init__(self, processes: Dict[str, ProcessFunction],
+                 executor: _PoolJobExecutor = None,
+                 store: MemoryJobStore = None, max_queued: int = 100,
+                 concurrency_limits: Dict[str, int] = None,
+                 poll_interval: timedelta = timedelta(seconds=5),
+                 result_ttl: timedelta = timedelta(days=1),
+                 result_cache=None, validators: Dict[str, Any] = None,
+                 poll_scheduler: PollScheduler = None, input_store=None):
+        self.processes = processes
+        self.executor = executor or ThreadJobExecutor()
+        self.store = store if store is not None else MemoryJobStore()
+        self.max_queued = max_queued
+        self.concurrency_limits = concurrency_limits or {}
+        self.poll_interval = poll_interval
+        self.result_ttl = result_ttl
+        self.result_cache = result_cache
+        self.validators = validators or {}
+        self.poll_scheduler = poll_scheduler or PollScheduler(
+            min_interval=min(timedelta(seconds=1), poll_interval),
+            default_interval=poll_interval,
+        )
+        self.status_waiters = StatusWaiters()
+        self.input_store = input_store
+
+        self._lock = threading.RLock()
+        # the unfinished jobs of this manager
+        self._jobs: Dict[str, _Job] = {}
+        self._pending = deque()
+        self._running = Counter()
+        self._active = 0
+        self._closed = False
+
+    def execute(self, request: ExecuteRequest) \
+            -> Union[StatusInfo, JobResult]:
+        """ Run the process of the request. In synchronous mode, wait for
+            the job and return its result, otherwise return the status of
+            the newly created job.
+        """
+        status_info = self.submit(request)
+        if request.mode != ExecutionMode.sync:
+            return status_info
+
+        job_id = status_info.job_id
+        self.wait(job_id)
+        try:
+            return self.get_result(GetResultRequest(job_id))
+        finally:
+            # results of synchronous executions cannot be requested later
+            self.store.remove(job_id)
+
+    def submit(self, request: ExecuteRequest) -> StatusInfo:
+        """ Queue a job for the request, regardless of its mode. When the
+            outputs for the request are cached, the job is finished right
+            away.
+        """
+        try:
+            function = self.processes[request.process_id]
+        except KeyError:
+            raise NoSuchProcessException(request.process_id) from None
+
+        validator = self.validators.get(request.process_id)
+        if validator is not None:
+            validator.validate(request)
+
+        job_id = uuid4().hex
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self.result_cache.key(request)
+        if cache_key is not None:
+            marker = object()
+            outputs = self.result_cache.get(cache_key, marker)
+            if outputs is not marker:
+                return self._finish_cached(job_id, request, outputs)
+
+        if self.input_store is not None:
+            self.input_store.spool_request(request, job_id)
+
+        status_info = StatusInfo(
+            job_id, JobStatus.accepted,
+            next_poll=_now() + self.poll_interval,
+        )
+        with self._lock:
+            try:
+                if self._closed:
+                    raise ServerBusyException('The server is shutting down')
+                elif len(self._pending) >= self.max_queued:
+                    raise ServerBusyException()
+                self.store.add(request.process_id, status_info, request)
+            except BaseException:
+                # no job was created for the spooled inputs
+                if self.input_store is not None:
+                    self.input_store.release(job_id)
+                raise
+
+            job = _Job(
+                job_id, request, function,
+                self.executor.create_context(job_id), cache_key=cache_key,
+            )
+            self._jobs[job_id] = job
+            self._pending.append(job)
+            self._dispatch()
+
+        return self.store.get_status(job_id) or status_info
+
+    def _finish_cached(self, job_id: str, request: ExecuteRequest,
+                       outputs: Any) -> StatusInfo:
+        status_info = StatusInfo(
+            job_id, JobStatus.succeded,
+            expiration_date=_now() + self.result_ttl, percent_completed=100,
+        )
+        self.store.add(request.process_id, status_info, request)
+        self.store.finish(status_info, outputs)
+        return status_info
+
+    def recover(self) -> List[str]:
+        """ Requeue the jobs in the store that were interrupted, for
+            example by a restart of the worker that ran them. Returns their
+            IDs.
+        """
+        recovered = []
+        with self._lock:
+            for job_id, request in self.store.claim_interrupted():
+                function = self.processes.get(request.process_id)
+                if function is None:
+                    self.store.finish(StatusInfo(
+                        job_id, JobStatus.failed,
+                        expiration_date=_now() + self.result_ttl,
+                    ), message=f"No such process '{request.process_id}'")
+                    continue
+
+                job = _Job(
+                    job_id, request, function,
+                    self.executor.create_context(job_id)
+                )
+                self._jobs[job_id] = job
+                self._pending.append(job)
+                recovered.append(job_id)
+            self._dispatch()
+        return recovered
+
+    def _dispatch(self):
+        """ Start pending jobs while there are free workers, skipping jobs
+            of processes at their concurrency limit.
+        """
+        if self._closed:
+            return
+
+        skipped = []
+        while self._pending and self._active < self.executor.max_workers:
+            job = self._pending.popleft()
+            process_id = job.request.process_id
+            limit = self.concurrency_limits.get(process_id)
+            if limit is not None and self._running[process_id] >= limit:
+                skipped.append(job)
+                continue
+            self._start(job)
+        self._pending.extendleft(reversed(skipped))
+
+    def _start(self, job: _Job):
+        job.started = _now()
+        self._running[job.request.process_id] += 1
+        self._active += 1
+        status_info = StatusInfo(
+            job.job_id, JobStatus.running, percent_completed=0,
+        )
+        status_info.next_poll = self.poll_scheduler.next_poll(
+            status_info, job.started, job.request.process_id, job.started
+        )
+        self.store.update(status_info)
+        job.future = self.executor.submit(
+            job.function, job.request, job.context
+        )
+        job.future.add_done_callback(partial(self._finish, job))
+        self.status_waiters.notify(job.job_id)
+
+    def _finish(self, job: _Job, future: Future):
+        outputs = message = None
+        try:
+            outputs = future.result()
+        except BaseException as exc:
+            message = str(exc) or type(exc).__name__
+
+        now = _now()
+        with self._lock:
+            self._running[job.request.process_id] -= 1
+            self._active -= 1
+            # dismissed jobs are already removed
+            if self._jobs.pop(job.job_id, None) is not None:
+                percent_completed, _ = job.context.get_progress()
+                if message is None:
+                    try:
+                        self.store.finish(StatusInfo(
+                            job.job_id, JobStatus.succeded,
+                            expiration_date=now + self.result_ttl,
+                            percent_completed=100,
+                        ), outputs)
+                    except TypeError as exc:
+                        # outputs that cannot be stored fail the job
+                        message = str(exc)
+                if message is not None:
+                    self.store.finish(StatusInfo(
+                        job.job_id, JobStatus.failed,
+                        expiration_date=now + self.result_ttl,
+                        percent_completed=percent_completed,
+                    ), message=message)
+                if message is None and job.cache_key is not None:
+                    self.result_cache.put(job.cache_key, outputs)
+            if message is None:
+                self.poll_scheduler.record_duration(
+                    job.request.process_id, now - job.started
+                )
+            if self.input_store is not None:
+                self.input_store.release(job.job_id)
+            job.context.release()
+            job.done.set()
+            self._dispatch()
+        self.status_waiters.notify(job.job_id)
+
+    def _get_status(self, job_id: str) -> StatusInfo:
+        status_info = self.store.get_status(job_id)
+        if status_info is None:
+            raise NoSuchJobException(job_id)
+
+        job = self._jobs.get(job_id)
+        if job is None or status_info.status not in (
+            JobStatus.accepted, JobStatus.running
+        ):
+            return status_info
+
+        now = _now()
+        process_id = job.request.process_id
+        queue_position = None
+        if status_info.status == JobStatus.running:
+            percent_completed, estimated_completion = \
+                job.context.get_progress()
+            if percent_completed is not None:
+                status_info.percent_completed = percent_completed
+                if estimated_completion is None and percent_completed > 0:
+                    elapsed = now - job.started
+                    estimated_completion = job.started + elapsed * (
+                        100 / percent_completed
+                    )
+                status_info.estimated_completion = estimated_completion
+        else:
+            with self._lock:
+                queue_position = sum(
+                    1 for _ in takewhile(
+                        lambda pending: pending is not job, self._pending
+                    )
+                )
+
+        workers = self.executor.max_workers
+        limit = self.concurrency_limits.get(process_id)
+        if limit is not None:
+            workers = min(workers, limit)
+        status_info.next_poll = self.poll_scheduler.next_poll(
+            status_info, now, process_id, job.started, queue_position,
+            workers,
+        )
+        return status_info
+
+    def get_status(self, request: GetStatusRequest) -> StatusInfo:
+        return self._get_status(request.job_id)
+
+    async def wait_status(self, request: GetStatusRequest, timeout: float,
+                          status_info: StatusInfo = None,
+                          check_interval: float = 1.0) -> StatusInfo:
+        """ Long polling variant of :meth:`get_status`: waits until the
+            status or progress of the job differs from ``status_info`` (by
+            default the status at the time of the call) or the timeout (in
+            seconds) expires, and returns the current status. Status
+            changes are signalled right away, the progress reported by
+            processes is checked every ``check_interval`` seconds.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        current = self._get_status(request.job_id)
+        if status_info is None:
+            status_info = current
+
+        while current.status == status_info.status \
+                and current.percent_completed == status_info.percent_completed \
+                and current.status in (JobStatus.accepted, JobStatus.running):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await self.status_waiters.wait(
+                request.job_id, min(remaining, check_interval)
+            )
+            current = self._get_status(request.job_id)
+        return current
+
+    def get_result(self, request: GetResultRequest) -> JobResult:
+        """ The result of a finished job. Raises a
+            :class:`ResultNotReadyException` for unfinished jobs and a
+            :class:`JobFailedException` for failed ones.
+        """
+        status_info = self._get_status(request.job_id)
+        if status_info.status in (JobStatus.accepted, JobStatus.running):
+            raise ResultNotReadyException(request.job_id)
+
+        outputs, message = self.store.get_outputs(request.job_id)
+        if status_info.status == JobStatus.failed:
+            raise JobFailedException(request.job_id, message)
+        return JobResult(
+            request.job_id, outputs, status_info.expiration_date
+        )
+
+    def dismiss(self, request: DismissRequest) -> StatusInfo:
+        """ Remove a job. Queued jobs are dropped, running jobs are
+            cancelled cooperatively, see :meth:`JobContext.check_cancelled`.
+        """
+        job_id = request.job_id
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+            if job is not None:
+                try:
+                    self._pending.remove(job)
+                except ValueError:
+                    job.context.cancel()
+                    job.future.cancel()
+                else:
+                    job.context.release()
+                    job.done.set()
+                    if self.input_store is not None:
+                        self.input_store.release(job_id)
+
+            if not self.store.remove(job_id):
+                raise NoSuchJobException(job_id)
+
+        self.status_waiters.notify(job_id)
+        return StatusInfo(job_id, JobStatus.dismissed)
+
+    def wait(self, job_id: str, timeout: float = None) -> bool:
+        """ Wait for a job of this manager to finish. Returns ``False`` if
+            the timeout expired before.
+        """
+        job = self._jobs.get(job_id)
+        return job is None or job.done.wait(timeout)
+
+    def sweep(self, now: datetime = None) -> List[str]:
+        """ Remove the finished jobs whose results expired. Returns their
+            IDs.
+        """
+        expired = self.store.expired(now or _now())
+        for job_id in expired:
+            self.store.remove(job_id)
+        return expired
+
+    def shutdown(self, wait=True, cancel=False):
+        """ Stop running jobs. Queued jobs are not started anymore, running
+            ones are cancelled when ``cancel`` is set.
+        """
+        with self._lock:
+            self._closed = True
+            # queued jobs keep their status, so that a persistent store can
+            # requeue them later
+            for job in self._pending:
+                self._jobs.pop(job.job_id)
+                job.context.release()
+                job.done.set()
+            self._pending.clear()
+            if cancel:
+                for job in self._jobs.values():
+                    job.context.cancel()
+        self.executor.shutdown(wait)
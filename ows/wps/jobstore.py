@@ -0,0 +1,530 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" A persistent store for WPS jobs in an SQLite database, shared by all
+    worker processes of a machine.
+"""
+
+from base64 import b64decode, b64encode
+from dataclasses import asdict
+from datetime import datetime
+import json
+import os
+import sqlite3
+import threading
+from time import time
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from lxml import etree
+
+from ows.common.types import BoundingBox
+from ows.util import UTC, Version
+from .types import JobStatus, StatusInfo
+from .v20.types import (
+    ExecuteRequest, ExecutionMode, ResponseType, TransmissionType, Input,
+    Data, Reference, LiteralValue, OutputDefinition,
+)
+from .canonical import execute_cache_key
+from .inputstore import SpooledInput
+from .payloads import (
+    FilePayload, FileDescriptorPayload, MemoryMapPayload, IteratorPayload
+)
+
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    process_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    expiration_date REAL,
+    estimated_completion REAL,
+    next_poll REAL,
+    percent_completed INTEGER,
+    inputs_digest TEXT,
+    owner TEXT,
+    lease_expires REAL,
+    request TEXT,
+    outputs TEXT,
+    output_locations TEXT,
+    message TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_expiration_date ON jobs (expiration_date)
+    WHERE expiration_date IS NOT NULL;
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+'''
+
+UNFINISHED = (JobStatus.accepted, JobStatus.running)
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value is not None else None
+
+
+def _datetime(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value, UTC) if value is not None else None
+
+
+def inputs_digest(request: ExecuteRequest) -> str:
+    """ A digest of the process, inputs and outputs of an Execute request,
+        see :func:`ows.wps.canonical.execute_cache_key`.
+    """
+    return execute_cache_key(request).hex()
+
+
+def _is_element(value) -> bool:
+    return isinstance(value, etree._Element) and isinstance(value.tag, str)
+
+
+def _c14n(element) -> str:
+    # inclusive C14N keeps all namespaces in scope, as QName values in
+    # attributes or text may refer to them
+    return etree.tostring(
+        element, method='c14n', with_comments=False, with_tail=False
+    ).decode('utf-8')
+
+
+def _format(data) -> dict:
+    return {
+        'mime_type': data.mime_type,
+        'encoding': data.encoding,
+        'schema': data.schema,
+    }
+
+
+def _dump_reference(reference: Reference) -> dict:
+    return dict(
+        href=reference.href, body=reference.body,
+        body_reference_href=reference.body_reference_href,
+        **_format(reference)
+    )
+
+
+def _dump_value(value) -> dict:
+    """ Serialize an input or output value as a JSON compatible dictionary
+        with a single item, naming the kind of the value. Raises a
+        :class:`TypeError` for values that cannot be stored.
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return {'json': value}
+    elif isinstance(value, LiteralValue):
+        return {'literal': [value.value, value.data_type, value.uom]}
+    elif isinstance(value, BoundingBox):
+        return {'bbox': [value.crs, list(value.bbox)]}
+    elif isinstance(value, Data):
+        return {'data': dict(value=_dump_value(value.value), **_format(value))}
+    elif isinstance(value, Reference):
+        return {'reference': _dump_reference(value)}
+    elif isinstance(value, dict):
+        return {'outputs': {
+            identifier: _dump_value(item) for identifier, item in value.items()
+        }}
+    elif isinstance(value, FilePayload):
+        return {'file': asdict(value)}
+    elif isinstance(value, MemoryMapPayload):
+        return {'mmap': asdict(value)}
+    elif isinstance(value, (FileDescriptorPayload, IteratorPayload)):
+        # these can only be read once, but results may be retrieved again
+        return _dump_value(Data(
+            b''.join(value.iter_chunks()), **_format(value)
+        ))
+    elif _is_element(value):
+        return {'element': _c14n(value)}
+    elif isinstance(value, list) and value and all(
+        isinstance(item, etree._Element) for item in value
+    ):
+        return {'xml': [_c14n(item) for item in value if _is_element(item)]}
+    elif isinstance(value, SpooledInput):
+        value = value.read()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {'bytes': b64encode(value).decode('ascii')}
+    elif isinstance(value, str):
+        return {'text': value}
+    raise TypeError(f'Cannot store values of type {type(value).__name__}')
+
+
+def _load_value(value: dict):
+    (kind, item), = value.items()
+    if kind == 'literal':
+        return LiteralValue(*item)
+    elif kind == 'bbox':
+        return BoundingBox(*item)
+    elif kind == 'element':
+        return etree.fromstring(item)
+    elif kind == 'xml':
+        return [etree.fromstring(element) for element in item]
+    elif kind == 'bytes':
+        return b64decode(item)
+    elif kind in ('text', 'json'):
+        return item
+    elif kind == 'data':
+        item = dict(item)
+        return Data(_load_value(item.pop('value')), **item)
+    elif kind == 'reference':
+        return Reference(**item)
+    elif kind == 'outputs':
+        return {
+            identifier: _load_value(value) for identifier, value in item.items()
+        }
+    elif kind == 'file':
+        return FilePayload(**item)
+    elif kind == 'mmap':
+        return MemoryMapPayload(**item)
+    raise ValueError(f'Unknown kind of stored value {kind!r}')
+
+
+def _dump_inputs(inputs: List[Input]) -> list:
+    dumped = []
+    for input_ in inputs or ():
+        item = {'id': input_.identifier}
+        if isinstance(input_.data, Data):
+            item['data'] = dict(
+                value=_dump_value(input_.data.value), **_format(input_.data)
+            )
+        elif isinstance(input_.data, Reference):
+            item['reference'] = _dump_reference(input_.data)
+        if input_.inputs:
+            item['inputs'] = _dump_inputs(input_.inputs)
+        dumped.append(item)
+    return dumped
+
+
+def _load_inputs(inputs: list) -> List[Input]:
+    loaded = []
+    for item in inputs:
+        data = None
+        if 'data' in item:
+            data = dict(item['data'])
+            data = Data(_load_value(data.pop('value')), **data)
+        elif 'reference' in item:
+            data = Reference(**item['reference'])
+        loaded.append(Input(
+            item['id'], data,
+            _load_inputs(item['inputs']) if 'inputs' in item else None,
+        ))
+    return loaded
+
+
+def _dump_outputs(output_definitions: List[OutputDefinition]) -> list:
+    return [
+        dict(
+            id=output.identifier,
+            transmission=(
+                output.transmission.value if output.transmission else None
+            ),
+            outputs=_dump_outputs(output.output_definitions),
+            **_format(output)
+        )
+        for output in output_definitions or ()
+    ]
+
+
+def _load_outputs(outputs: list) -> Optional[List[OutputDefinition]]:
+    if not outputs:
+        return None
+    return [
+        OutputDefinition(
+            item['id'],
+            TransmissionType(item['transmission'])
+            if item['transmission'] else None,
+            item['mime_type'], item['encoding'], item['schema'],
+            _load_outputs(item['outputs']),
+        )
+        for item in outputs
+    ]
+
+
+def dump_request(request: ExecuteRequest) -> str:
+    """ Serialize an Execute request as JSON. Inline XML data is stored as
+        canonical XML (C14N), spooled inputs (see
+        :class:`ows.wps.inputstore.SpooledInput`) with their content. Raises
+        a :class:`TypeError` for input values that cannot be stored.
+    """
+    return json.dumps({
+        'process_id': request.process_id,
+        'mode': request.mode.value if request.mode else None,
+        'response': request.response.value if request.response else None,
+        'version': str(request.version),
+        'inputs': _dump_inputs(request.inputs),
+        'outputs': _dump_outputs(request.output_definitions),
+    }, separators=(',', ':'))
+
+
+def load_request(value: str) -> ExecuteRequest:
+    """ Restore an Execute request serialized by :func:`dump_request`.
+    """
+    item = json.loads(value)
+    return ExecuteRequest(
+        item['process_id'],
+        ExecutionMode(item['mode']) if item['mode'] else None,
+        ResponseType(item['response']) if item['response'] else None,
+        _load_inputs(item['inputs']),
+        _load_outputs(item['outputs']) or [],
+        Version.from_str(item['version']),
+    )
+
+
+class SQLiteJobStore:
+    """ Keeps the status and outputs of jobs in an SQLite database in WAL
+        mode, so that any number of processes can read the status of jobs
+        while one of them writes. Each thread uses its own connection.
+
+        Jobs are owned by the store which created or claimed them,
+        identified by a random token per store and process. The owner holds
+        a lease on its unfinished jobs, which a background thread renews.
+        When the lease expired, e.g. because the worker was restarted,
+        :meth:`claim_interrupted` hands the jobs over to another store.
+
+        :param path: the path of the database file
+        :param timeout: how long to wait for locks held by other processes
+        :param lease: the duration of the leases in seconds. They are
+                      renewed three times per lease.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0,
+                 lease: float = 60.0):
+        self.path = path
+        self.timeout = timeout
+        self.lease = lease
+        self._local = threading.local()
+        self._owner = None
+        self._owner_pid = None
+        self._stopped = None
+        self._owner_lock = threading.Lock()
+        connection = self._connection()
+        connection.execute('PRAGMA journal_mode=WAL')
+        with connection:
+            connection.executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # connections must not be shared across forked processes
+        pid = os.getpid()
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != pid:
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+            self._local.pid = pid
+        return connection
+
+    def _execute(self, sql: str, params=()) -> sqlite3.Cursor:
+        connection = self._connection()
+        with connection:
+            return connection.execute(sql, params)
+
+    @property
+    def owner(self) -> str:
+        """ The token identifying this store in the current process as the
+            owner of jobs. Renewing the leases starts with the first use.
+        """
+        pid = os.getpid()
+        with self._owner_lock:
+            # forked processes are separate owners
+            if self._owner_pid != pid:
+                self._owner = uuid4().hex
+                self._owner_pid = pid
+                self._stopped = threading.Event()
+                threading.Thread(
+                    target=self._renew_leases, args=(self._stopped,),
+                    name='wps-job-leases', daemon=True,
+                ).start()
+            return self._owner
+
+    def _renew_leases(self, stopped: threading.Event):
+        while not stopped.wait(self.lease / 3):
+            try:
+                self.renew()
+            except sqlite3.Error:
+                # retried with the next renewal, before the lease expires
+                pass
+        self.close()
+
+    def renew(self):
+        """ Extend the leases of the unfinished jobs of this store.
+        """
+        self._execute(
+            'UPDATE jobs SET lease_expires = ? '
+            'WHERE owner = ? AND status IN (?, ?)',
+            (time() + self.lease, self.owner) + UNFINISHED
+        )
+
+    def close(self):
+        """ Close the connection of the current thread and stop renewing
+            the leases of the jobs of this store.
+        """
+        if self._stopped is not None and self._owner_pid == os.getpid():
+            self._stopped.set()
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def add(self, process_id: str, status_info: StatusInfo,
+            request: ExecuteRequest = None):
+        self._execute(
+            'INSERT INTO jobs (job_id, process_id, status, expiration_date, '
+            'estimated_completion, next_poll, percent_completed, '
+            'inputs_digest, owner, lease_expires, request) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', (
+                status_info.job_id, process_id, status_info.status,
+                _timestamp(status_info.expiration_date),
+                _timestamp(status_info.estimated_completion),
+                _timestamp(status_info.next_poll),
+                status_info.percent_completed,
+                inputs_digest(request) if request is not None else None,
+                self.owner,
+                time() + self.lease,
+                dump_request(request) if request is not None else None,
+            )
+        )
+
+    def update(self, status_info: StatusInfo):
+        self._execute(
+            'UPDATE jobs SET status = ?, expiration_date = ?, '
+            'estimated_completion = ?, next_poll = ?, percent_completed = ? '
+            'WHERE job_id = ?', (
+                status_info.status,
+                _timestamp(status_info.expiration_date),
+                _timestamp(status_info.estimated_completion),
+                _timestamp(status_info.next_poll),
+                status_info.percent_completed,
+                status_info.job_id,
+            )
+        )
+
+    def finish(self, status_info: StatusInfo, outputs: Any = None,
+               message: str = None):
+        """ Store the final status of a job along with its outputs or the
+            error message. The locations of outputs passed by reference are
+            stored separately, see :meth:`get_output_locations`. Raises a
+            :class:`TypeError` for outputs that cannot be stored.
+        """
+        locations = None
+        if isinstance(outputs, dict):
+            locations = json.dumps({
+                identifier: output.href
+                for identifier, output in outputs.items()
+                if isinstance(output, Reference)
+            })
+        if outputs is not None:
+            outputs = json.dumps(_dump_value(outputs), separators=(',', ':'))
+        self._execute(
+            'UPDATE jobs SET status = ?, expiration_date = ?, '
+            'estimated_completion = ?, next_poll = ?, percent_completed = ?, '
+            'outputs = ?, output_locations = ?, message = ?, request = NULL '
+            'WHERE job_id = ?', (
+                status_info.status,
+                _timestamp(status_info.expiration_date),
+                _timestamp(status_info.estimated_completion),
+                _timestamp(status_info.next_poll),
+                status_info.percent_completed,
+                outputs,
+                locations,
+                message,
+                status_info.job_id,
+            )
+        )
+
+    def get_status(self, job_id: str) -> Optional[StatusInfo]:
+        row = self._connection().execute(
+            'SELECT status, expiration_date, estimated_completion, '
+            'next_poll, percent_completed FROM jobs WHERE job_id = ?',
+            (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        status, expiration, estimate, next_poll, percent = row
+        return StatusInfo(
+            job_id, status, _datetime(expiration), _datetime(estimate),
+            _datetime(next_poll), percent
+        )
+
+    def get_outputs(self, job_id: str) -> Tuple[Any, Optional[str]]:
+        row = self._connection().execute(
+            'SELECT outputs, message FROM jobs WHERE job_id = ?', (job_id,)
+        ).fetchone()
+        if row is None:
+            return None, None
+        outputs, message = row
+        if outputs is not None:
+            outputs = _load_value(json.loads(outputs))
+        return outputs, message
+
+    def get_output_locations(self, job_id: str) -> Dict[str, str]:
+        """ The locations of the outputs of a job passed by reference.
+        """
+        row = self._connection().execute(
+            'SELECT output_locations FROM jobs WHERE job_id = ?', (job_id,)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return {}
+        return json.loads(row[0])
+
+    def remove(self, job_id: str) -> bool:
+        return self._execute(
+            'DELETE FROM jobs WHERE job_id = ?', (job_id,)
+        ).rowcount > 0
+
+    def expired(self, now: datetime) -> List[str]:
+        """ The IDs of the jobs with an expiration date before ``now``.
+        """
+        return [job_id for job_id, in self._connection().execute(
+            'SELECT job_id FROM jobs WHERE expiration_date <= ?',
+            (_timestamp(now),)
+        )]
+
+    def claim_interrupted(self) -> List[Tuple[str, ExecuteRequest]]:
+        """ Take over the unfinished jobs whose owner did not renew its
+            lease in time. The jobs are reset to ``Accepted`` and returned
+            along with their requests, to be queued again. Each job is only
+            claimed by a single store.
+        """
+        owner = self.owner
+        rows = self._connection().execute(
+            'SELECT job_id, owner, lease_expires, request FROM jobs '
+            'WHERE status IN (?, ?) AND owner IS NOT ? '
+            'AND (lease_expires IS NULL OR lease_expires < ?) '
+            'AND request IS NOT NULL',
+            UNFINISHED + (owner, time())
+        ).fetchall()
+
+        claimed = []
+        for job_id, previous_owner, lease_expires, request in rows:
+            cursor = self._execute(
+                'UPDATE jobs SET owner = ?, lease_expires = ?, status = ?, '
+                'estimated_completion = NULL, percent_completed = NULL '
+                'WHERE job_id = ? AND owner IS ? AND lease_expires IS ? '
+                'AND status IN (?, ?)',
+                (
+                    owner, time() + self.lease, JobStatus.accepted, job_id,
+                    previous_owner, lease_expires,
+                ) + UNFINISHED
+            )
+            if cursor.rowcount:
+                claimed.append((job_id, load_request(request)))
+        return claimed
@@ -0,0 +1,224 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" Output payloads of WPS processes that are streamed to the client
+    instead of being read into memory: files, open file descriptors,
+    memory-mapped files and iterators of bytes. Processes return them as
+    their output values and :func:`raw_output_result` (for raw responses)
+    or :func:`ows.wps.v20.encoders.xml_stream_result` (for document
+    responses) stream them chunk by chunk.
+"""
+
+from dataclasses import dataclass
+import mmap
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from lxml import etree
+
+from ows.util import Result
+from .v20.types import Data, LiteralValue, OutputDefinition, Reference
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _read_chunks(read, chunk_size: int, length: Optional[int]) \
+        -> Iterator[bytes]:
+    remaining = length
+    while remaining is None or remaining > 0:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        chunk = read(size)
+        if not chunk:
+            break
+        if remaining is not None:
+            remaining -= len(chunk)
+        yield chunk
+
+
+@dataclass
+class FilePayload:
+    """ The content of a file, or ``length`` bytes of it starting at
+        ``offset``.
+    """
+    path: str
+    mime_type: str = None
+    encoding: str = None
+    schema: str = None
+    offset: int = 0
+    length: int = None
+
+    @property
+    def size(self) -> int:
+        size = os.path.getsize(self.path) - self.offset
+        return size if self.length is None else min(size, self.length)
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) \
+            -> Iterator[bytes]:
+        with open(self.path, 'rb', buffering=0) as f:
+            f.seek(self.offset)
+            yield from _read_chunks(f.read, chunk_size, self.length)
+
+
+@dataclass
+class FileDescriptorPayload:
+    """ The remaining content of an open file descriptor, for example the
+        read end of a pipe. The descriptor is closed after it was read,
+        unless ``close`` is false.
+    """
+    fd: int
+    mime_type: str = None
+    encoding: str = None
+    schema: str = None
+    close: bool = True
+
+    size = None
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) \
+            -> Iterator[bytes]:
+        try:
+            yield from _read_chunks(
+                lambda size: os.read(self.fd, size), chunk_size, None
+            )
+        finally:
+            if self.close:
+                os.close(self.fd)
+
+
+@dataclass
+class MemoryMapPayload:
+    """ A region of a file that is mapped into memory. The chunks are
+        read-only views into the mapping, which are released when the next
+        chunk is requested, so they must be consumed (e.g: written to the
+        socket) one after another.
+    """
+    path: str
+    mime_type: str = None
+    encoding: str = None
+    schema: str = None
+    offset: int = 0
+    length: int = None
+
+    @property
+    def size(self) -> int:
+        size = os.path.getsize(self.path) - self.offset
+        return size if self.length is None else min(size, self.length)
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) \
+            -> Iterator[memoryview]:
+        size = self.size
+        if size <= 0:
+            return
+
+        with open(self.path, 'rb') as f:
+            # mappings must start at a multiple of the allocation granularity
+            start = self.offset - self.offset % mmap.ALLOCATIONGRANULARITY
+            mapped = mmap.mmap(
+                f.fileno(), self.offset - start + size,
+                access=mmap.ACCESS_READ, offset=start,
+            )
+        try:
+            with memoryview(mapped) as view:
+                end = self.offset - start + size
+                for position in range(self.offset - start, end, chunk_size):
+                    chunk = view[position:min(position + chunk_size, end)]
+                    try:
+                        yield chunk
+                    finally:
+                        chunk.release()
+        finally:
+            mapped.close()
+
+
+@dataclass
+class IteratorPayload:
+    """ Content produced by an iterable of bytes-like objects, e.g. a
+        generator. It can only be streamed once.
+    """
+    chunks: Iterable[bytes]
+    mime_type: str = None
+    encoding: str = None
+    schema: str = None
+
+    size = None
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) \
+            -> Iterator[bytes]:
+        return iter(self.chunks)
+
+
+Payload = Union[
+    FilePayload, FileDescriptorPayload, MemoryMapPayload, IteratorPayload
+]
+PAYLOAD_TYPES = (
+    FilePayload, FileDescriptorPayload, MemoryMapPayload, IteratorPayload
+)
+
+
+def select_raw_output(outputs: Dict[str, Any],
+                      output_definitions: List[OutputDefinition] = None) \
+        -> Any:
+    """ The value of the single output of a raw response: the first
+        requested output, or the only output of the process.
+    """
+    if output_definitions:
+        identifier = output_definitions[0].identifier
+    elif len(outputs) == 1:
+        identifier = next(iter(outputs))
+    else:
+        raise ValueError(
+            'A raw response requires exactly one output to be selected'
+        )
+    return outputs[identifier]
+
+
+def raw_output_result(value: Any, mime_type: str = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Result:
+    """ The response of a GetResult or synchronous Execute request with
+        the ``raw`` response type: the output itself, streamed when it is a
+        payload. ``mime_type`` is used when the value does not specify one,
+        usually the one of the output definition.
+    """
+    if isinstance(value, Data):
+        mime_type = value.mime_type or mime_type
+        value = value.value
+
+    if isinstance(value, PAYLOAD_TYPES):
+        return Result.from_chunks(
+            value.iter_chunks(chunk_size),
+            value.mime_type or mime_type or 'application/octet-stream'
+        )
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        return Result(value, mime_type or 'application/octet-stream')
+    elif isinstance(value, etree._Element):
+        return Result.from_etree(value, mime_type or 'application/xml')
+    elif isinstance(value, Reference):
+        raise ValueError('Outputs by reference cannot be returned raw')
+    elif isinstance(value, LiteralValue):
+        value = value.value
+    return Result(str(value).encode('utf-8'), mime_type or 'text/plain')
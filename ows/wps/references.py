@@ -0,0 +1,400 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" Retrieval of the inputs of WPS Execute requests that are passed by
+    reference. All references of a request are fetched concurrently with
+    ``asyncio`` and ``aiohttp``, over pooled keep-alive connections, and
+    streamed to content addressed files.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from hashlib import sha256
+import os
+import ssl
+import tempfile
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .types import ProcessDescription, InputDescription
+from .v20.types import ExecuteRequest, Input, Reference
+from .exceptions import DataNotAccessibleException, SizeExceededException
+
+
+MEGABYTE = 1024 * 1024
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+SCHEMES = ('http', 'https')
+
+
+@dataclass
+class FetchedReference:
+    """ An input passed by reference and the file it was retrieved to. The
+        file is named after the SHA-256 ``digest`` of its content, so that
+        identical content is only stored once.
+    """
+    identifier: str
+    reference: Reference
+    path: str
+    digest: str
+    size: int
+    content_type: Optional[str] = None
+
+
+def iter_references(inputs: List[Input]) -> Iterator[Tuple[Input, Reference]]:
+    """ Yields the inputs passed by reference, including nested ones, in
+        document order.
+    """
+    stack = list(reversed(inputs))
+    while stack:
+        input_ = stack.pop()
+        if isinstance(input_.data, Reference):
+            yield input_, input_.data
+        elif input_.inputs:
+            stack.extend(reversed(input_.inputs))
+
+
+def _input_descriptions(process_description: Optional[ProcessDescription]) \
+        -> Dict[str, InputDescription]:
+    if process_description is None:
+        return {}
+    descriptions = {}
+    stack = list(process_description.inputs)
+    while stack:
+        description = stack.pop()
+        descriptions[description.identifier] = description
+        stack.extend(description.inputs)
+    return descriptions
+
+
+def _max_size(description: Optional[InputDescription],
+              reference: Reference) -> Optional[int]:
+    """ The maximum size in bytes of the format of the referenced data, or
+        of the default (first) format of the input.
+    """
+    if description is None or description.data_description is None:
+        return None
+    formats = description.data_description.formats
+    if not formats:
+        return None
+
+    format_ = next((
+        format_ for format_ in formats
+        if reference.mime_type and format_.mime_type == reference.mime_type
+    ), formats[0])
+    if format_.maxmimum_megabytes is None:
+        return None
+    return int(format_.maxmimum_megabytes * MEGABYTE)
+
+
+def redirect_location(url: str, location: str) -> str:
+    """ The absolute URL of a redirect. Raises a
+        :class:`DataNotAccessibleException` for redirects to other schemes
+        than HTTP(S) and from HTTPS to HTTP.
+    """
+    location = urljoin(url, location)
+    scheme = urlsplit(location).scheme
+    if scheme not in SCHEMES or (
+        urlsplit(url).scheme == 'https' and scheme != 'https'
+    ):
+        raise DataNotAccessibleException(
+            f"Refusing to follow the redirect from '{url}' to '{location}'"
+        )
+    return location
+
+
+class _FileSink:
+    """ Streams a response body to a temporary file, hashing it on the way.
+    """
+
+    def __init__(self, directory: str, max_size: Optional[int]):
+        fd, self.path = tempfile.mkstemp(dir=directory, suffix='.part')
+        self.directory = directory
+        self.max_size = max_size
+        self.size = 0
+        self._file = os.fdopen(fd, 'wb')
+        self._hash = sha256()
+
+    def __call__(self, chunk: bytes):
+        self.size += len(chunk)
+        if self.max_size is not None and self.size > self.max_size:
+            raise SizeExceededException(
+                f"Data exceeds the maximum size of {self.max_size} bytes"
+            )
+        self._hash.update(chunk)
+        self._file.write(chunk)
+
+    def commit(self) -> Tuple[str, str]:
+        self._file.close()
+        digest = self._hash.hexdigest()
+        path = os.path.join(self.directory, digest)
+        if os.path.exists(path):
+            os.remove(self.path)
+        else:
+            os.replace(self.path, path)
+        return path, digest
+
+    def discard(self):
+        self._file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class _MemorySink:
+    def __init__(self, max_size: Optional[int]):
+        self.max_size = max_size
+        self.size = 0
+        self.chunks = []
+
+    def __call__(self, chunk: bytes):
+        self.size += len(chunk)
+        if self.max_size is not None and self.size > self.max_size:
+            raise SizeExceededException(
+                f"Data exceeds the maximum size of {self.max_size} bytes"
+            )
+        self.chunks.append(chunk)
+
+
+class ReferenceResolver:
+    """ Fetches the inputs passed by reference of Execute requests. All
+        references of a request are fetched concurrently, and identical
+        references only once. Data is streamed to files in ``directory``,
+        named after the digest of their content. Requires ``aiohttp``.
+
+        References with a ``body`` or ``body_reference_href`` are fetched
+        with a POST request of the (referenced) body. Redirects are
+        followed, but not from HTTPS to HTTP. Proxies are taken from the
+        environment (``HTTP_PROXY``, ``HTTPS_PROXY`` and ``NO_PROXY``).
+
+        :param directory: where the data is stored
+        :param per_host_limit: the maximum number of concurrent
+                               connections per host
+        :param timeout: the timeout in seconds to fetch a single reference
+        :param max_redirects: the maximum number of redirects to follow
+        :param max_body_size: the maximum size of referenced bodies
+        :param ssl_context: the SSL context for HTTPS connections
+        :param body_content_type: the content type of POSTed ``body``
+                                  values. Referenced bodies are sent with
+                                  the content type they were served with.
+        :param max_header_size: the maximum size of the status line and of
+                                each header of responses
+        :param chunk_size: the size of the chunks the data is read in
+    """
+
+    def __init__(self, directory: str, per_host_limit: int = 4,
+                 timeout: float = 300.0, max_redirects: int = 5,
+                 max_body_size: int = 16 * MEGABYTE,
+                 ssl_context: ssl.SSLContext = None,
+                 body_content_type: str = 'application/xml',
+                 max_header_size: int = 8190, chunk_size: int = 65536):
+        if aiohttp is None:
+            raise ImportError('aiohttp is required to fetch references')
+
+        self.directory = directory
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.max_body_size = max_body_size
+        self.ssl_context = ssl_context
+        self.body_content_type = body_content_type
+        self.max_header_size = max_header_size
+        self.chunk_size = chunk_size
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    @property
+    def session(self) -> 'aiohttp.ClientSession':
+        # the session is bound to the running event loop
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.per_host_limit,
+                    ssl=self.ssl_context if self.ssl_context else True,
+                ),
+                headers={'User-Agent': 'pyows'},
+                trust_env=True,
+                max_line_size=self.max_header_size,
+                max_field_size=self.max_header_size,
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request(self, url: str, body: Optional[bytes], sink,
+                       content_type: str = None) -> Mapping[str, str]:
+        """ Perform a request, following redirects, and pass the body of
+            the successful response to ``sink``. Returns the headers of the
+            response.
+        """
+        method = 'GET' if body is None else 'POST'
+        if urlsplit(url).scheme not in SCHEMES:
+            raise ValueError(f"Unsupported URL '{url}'")
+
+        for _ in range(self.max_redirects + 1):
+            headers = {}
+            if body is not None:
+                headers['Content-Type'] = \
+                    content_type or self.body_content_type
+            async with self.session.request(
+                method, url, data=body, headers=headers,
+                allow_redirects=False,
+            ) as response:
+                status = response.status
+                if status in REDIRECT_STATUSES \
+                        and 'Location' in response.headers:
+                    url = redirect_location(url, response.headers['Location'])
+                    if status == 303 or (status in (301, 302) and body):
+                        method, body = 'GET', None
+                    continue
+                elif not 200 <= status < 300:
+                    raise DataNotAccessibleException(
+                        f"Request to '{url}' failed with status {status}"
+                    )
+
+                length = response.content_length
+                if sink.max_size is not None and length is not None \
+                        and length > sink.max_size:
+                    raise SizeExceededException(
+                        f"Data of {length} bytes exceeds the maximum size "
+                        f"of {sink.max_size} bytes"
+                    )
+                async for chunk in response.content.iter_chunked(
+                    self.chunk_size
+                ):
+                    sink(chunk)
+                return response.headers.copy()
+        raise DataNotAccessibleException(f"Too many redirects for '{url}'")
+
+    async def fetch(self, reference: Reference, max_size: int = None) \
+            -> Tuple[str, str, int, Optional[str]]:
+        """ Fetch the referenced data to a file. Returns the path and digest
+            of the file, the size of the data and its content type.
+        """
+        body = body_content_type = None
+        if reference.body is not None:
+            body = reference.body.encode('utf-8')
+        elif reference.body_reference_href:
+            body_sink = _MemorySink(self.max_body_size)
+            body_headers = await self._request(
+                reference.body_reference_href, None, body_sink
+            )
+            body = b''.join(body_sink.chunks)
+            body_content_type = body_headers.get('Content-Type')
+
+        sink = _FileSink(self.directory, max_size)
+        try:
+            headers = await self._request(
+                reference.href, body, sink, body_content_type
+            )
+            path, digest = sink.commit()
+        except BaseException:
+            sink.discard()
+            raise
+        content_type = headers.get('Content-Type') or reference.mime_type
+        return path, digest, sink.size, content_type
+
+    async def _fetch_input(self, identifier: str, reference: Reference,
+                           max_size: Optional[int]):
+        try:
+            return await asyncio.wait_for(
+                self.fetch(reference, max_size), self.timeout
+            )
+        except (DataNotAccessibleException, SizeExceededException) as exc:
+            exc.locator = identifier
+            raise
+        except (OSError, EOFError, ValueError, asyncio.TimeoutError,
+                aiohttp.ClientError) as exc:
+            raise DataNotAccessibleException(
+                f"Failed to retrieve '{reference.href}': {exc}", identifier
+            ) from exc
+
+    async def resolve(self, request: ExecuteRequest,
+                      process_description: ProcessDescription = None) \
+            -> List[FetchedReference]:
+        """ Fetch all inputs of the request passed by reference. The size
+            of each input is limited by the ``maxmimum_megabytes`` of its
+            format in the ``process_description``. Raises the first error
+            in document order, after cancelling the remaining fetches.
+        """
+        descriptions = _input_descriptions(process_description)
+        tasks = {}
+        fetches = []
+        for input_, reference in iter_references(request.inputs):
+            max_size = _max_size(descriptions.get(input_.identifier), reference)
+            key = (
+                reference.href, reference.body, reference.body_reference_href,
+                max_size,
+            )
+            if key not in tasks:
+                tasks[key] = asyncio.ensure_future(self._fetch_input(
+                    input_.identifier, reference, max_size
+                ))
+            fetches.append((input_.identifier, reference, tasks[key]))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            for _, _, task in fetches:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception() from None
+            raise
+
+        return [
+            FetchedReference(identifier, reference, *task.result())
+            for identifier, reference, task in fetches
+        ]
+
+
+def resolve_references(request: ExecuteRequest, directory: str,
+                       process_description: ProcessDescription = None,
+                       **kwargs) -> List[FetchedReference]:
+    """ Fetch the inputs of the request passed by reference, see
+        :class:`ReferenceResolver`. Runs its own event loop and is thus
+        intended to be called from synchronous code, like a job.
+    """
+    async def run():
+        async with ReferenceResolver(directory, **kwargs) as resolver:
+            return await resolver.resolve(request, process_description)
+
+    return asyncio.run(run())
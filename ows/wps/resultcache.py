@@ -0,0 +1,115 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" A content-addressed cache for the outputs of WPS Execute requests.
+
+    Requests are identified by :func:`ows.wps.canonical.execute_cache_key`,
+    so that requests only differing in the order of their inputs, in the
+    notation of their literal values or the serialization of their XML
+    inputs share their results. Only the processes that were enabled on the
+    cache are considered, as only deterministic processes may be cached.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, Optional
+
+from ows.cache import ResultCache
+from .canonical import execute_cache_key
+from .types import ProcessDescription
+from .v20.types import ExecuteRequest
+
+
+def outputs_size(outputs: Any) -> int:
+    """ An estimate of the memory used by the outputs of a process,
+        counting the bytes of binary and text values.
+    """
+    if isinstance(outputs, dict):
+        return sum(outputs_size(value) for value in outputs.values())
+    elif isinstance(outputs, (list, tuple)):
+        return sum(outputs_size(value) for value in outputs)
+    elif isinstance(outputs, (bytes, bytearray, str)):
+        return len(outputs)
+    return sys.getsizeof(outputs)
+
+
+class ExecuteResultCache:
+    """ Caches the outputs of successful Execute requests of the processes
+        it is enabled for.
+
+        :param max_size: the budget for the sizes of all cached outputs
+        :param ttl: the number of seconds the outputs are kept, if any
+        :param sizeof: a function to calculate the size of the outputs,
+                       :func:`outputs_size` by default
+    """
+
+    def __init__(self, max_size: int, ttl: float = None, sizeof=None):
+        self._cache = ResultCache(max_size, sizeof or outputs_size, ttl)
+        # the process versions by identifier of the enabled processes
+        self._versions: Dict[str, Any] = {}
+
+    def enable(self, process_description: ProcessDescription):
+        """ Enable caching for the described process. The version of the
+            process is part of the keys, so that the results of earlier
+            versions are not reused.
+        """
+        self._versions[process_description.identifier] = \
+            process_description.version
+
+    def disable(self, process_id: str):
+        self._versions.pop(process_id, None)
+
+    def is_enabled(self, process_id: str) -> bool:
+        return process_id in self._versions
+
+    def key(self, request: ExecuteRequest,
+            fetched: Iterable = None) -> Optional[bytes]:
+        """ The cache key of the request, or ``None`` when caching is not
+            enabled for its process. ``fetched`` are the
+            :class:`ows.wps.references.FetchedReference` objects of the
+            referenced inputs, if they were resolved already.
+        """
+        if request.process_id not in self._versions:
+            return None
+        return execute_cache_key(
+            request, self._versions[request.process_id], fetched
+        )
+
+    def get(self, key: bytes, default=None) -> Any:
+        return self._cache.get(key, default)
+
+    def put(self, key: bytes, outputs: Any) -> bool:
+        """ Store the outputs for the key. Returns whether they fit in the
+            cache.
+        """
+        return self._cache.put(key, outputs)
+
+    def clear(self):
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -0,0 +1,167 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" Scheduling of status polls for WPS jobs.
+
+    :class:`PollScheduler` suggests the ``NextPoll`` of a job from its
+    observed progress, its position in the queue and the typical duration
+    of its process, so that clients poll rarely for long jobs and close to
+    the expected completion. :class:`StatusWaiters` lets ``asyncio``
+    handlers of GetStatus requests wait for a status change (long polling)
+    instead of answering right away.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+import threading
+from typing import Dict, Optional, Set, Tuple
+
+from .types import JobStatus, StatusInfo
+
+
+class PollScheduler:
+    """ Computes the next poll of unfinished jobs. Clients are asked to
+        poll after half of the time the job is expected to still take
+        (running jobs) or to wait before it starts (queued jobs), so that the
+        number of polls grows only logarithmically with the duration of a
+        job. The intervals are clamped to ``min_interval`` and
+        ``max_interval``.
+
+        :param min_interval: the shortest suggested interval
+        :param max_interval: the longest suggested interval
+        :param default_interval: the interval when nothing is known about
+                                 the duration of a job
+        :param smoothing: the weight of the latest duration in the moving
+                          average of the durations of a process
+    """
+
+    def __init__(self, min_interval: timedelta = timedelta(seconds=1),
+                 max_interval: timedelta = timedelta(minutes=10),
+                 default_interval: timedelta = timedelta(seconds=5),
+                 smoothing: float = 0.2):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = default_interval
+        self.smoothing = smoothing
+        self._durations: Dict[str, timedelta] = {}
+        self._lock = threading.Lock()
+
+    def record_duration(self, process_id: str, duration: timedelta):
+        """ Record the duration of a finished job of the process.
+        """
+        with self._lock:
+            average = self._durations.get(process_id)
+            if average is None:
+                self._durations[process_id] = duration
+            else:
+                self._durations[process_id] = \
+                    average + (duration - average) * self.smoothing
+
+    def expected_duration(self, process_id: str) -> Optional[timedelta]:
+        return self._durations.get(process_id)
+
+    def _clamp(self, interval: timedelta) -> timedelta:
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def next_poll(self, status_info: StatusInfo, now: datetime,
+                  process_id: str = None, started: datetime = None,
+                  queue_position: int = None, workers: int = 1) \
+            -> Optional[datetime]:
+        """ The suggested next poll of a job, ``None`` for finished jobs.
+
+            :param status_info: the current status of the job, including
+                                its estimated completion, if any
+            :param now: the current time
+            :param process_id: the process of the job
+            :param started: when the job started running
+            :param queue_position: the number of jobs queued before it
+            :param workers: the number of jobs of the process that can run
+                            concurrently
+        """
+        expected = self.expected_duration(process_id)
+        if status_info.status == JobStatus.running:
+            if status_info.estimated_completion is not None:
+                remaining = status_info.estimated_completion - now
+            elif expected is not None and started is not None:
+                remaining = started + expected - now
+            elif started is not None:
+                # back off the longer the job runs without progress
+                remaining = max(now - started, self.default_interval)
+            else:
+                return now + self.default_interval
+        elif status_info.status == JobStatus.accepted:
+            if expected is None or queue_position is None:
+                return now + self.default_interval
+            # the queued jobs run in batches of the available workers
+            remaining = expected * (queue_position // max(workers, 1) + 1)
+        else:
+            return None
+
+        return now + self._clamp(remaining / 2)
+
+
+class StatusWaiters:
+    """ Coroutines waiting for status changes of jobs. Changes are reported
+        with :meth:`notify` from any thread.
+    """
+
+    def __init__(self):
+        self._waiters: Dict[
+            str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def notify(self, job_id: str):
+        with self._lock:
+            waiters = self._waiters.pop(job_id, ())
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # the loop of the waiter was closed in the meantime
+                pass
+
+    async def wait(self, job_id: str, timeout: float) -> bool:
+        """ Wait until the status of the job changes. Returns ``False`` when
+            the timeout expired before.
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._waiters.setdefault(job_id, set()).add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(job_id)
+                if waiters is not None:
+                    waiters.discard(waiter)
+                    if not waiters:
+                        del self._waiters[job_id]
@@ -0,0 +1,156 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+from base64 import b64encode
+from hashlib import sha256
+import os
+
+from lxml import etree
+import pytest
+
+from .v20.types import (
+    ExecuteRequest, ExecutionMode, ResponseType, Input, Data, LiteralValue
+)
+from .jobs import JobManager
+from .inputstore import InputStore, SpooledInput, open_input
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = InputStore(
+        str(tmp_path), threshold=1000, memory_budget=3000, min_size=10,
+        chunk_size=16,
+    )
+    yield store
+    store.close()
+
+
+def make_document(count):
+    root = etree.fromstring(
+        '<wps:Data xmlns:wps="http://www.opengis.net/wps/2.0">'
+        '<a>%s</a></wps:Data>' % ''.join('<b>%d</b>' % i for i in range(count))
+    )
+    return root, root[0]
+
+
+def test_spool_element(store):
+    root, element = make_document(200)
+    expected = etree.tostring(element)
+    data = store.spool_data(Data(element, 'text/xml'), 'job')
+    spooled = data.value
+    assert isinstance(spooled, SpooledInput)
+    assert spooled.path is not None and os.path.exists(spooled.path)
+    assert spooled.size == len(expected)
+    assert spooled.digest == sha256(expected).hexdigest()
+    assert etree.fromstring(spooled.read()).tag == 'a'
+    with spooled.map() as view:
+        assert view == expected
+    # detached from the decoded document
+    assert len(root) == 0
+
+    store.release('job')
+    assert not os.path.exists(spooled.path)
+
+
+def test_memory_budget(store):
+    values = [
+        store.spool_data(Data('x' * 800, 'text/plain'), 'job').value
+        for _ in range(4)
+    ]
+    assert [value.content is not None for value in values] == [
+        True, True, True, False
+    ]
+    assert store.memory_used == 2400
+    assert values[3].read() == b'x' * 800
+
+    # small and unformatted values are left as they are
+    data = Data('short', 'text/plain')
+    assert store.spool_data(data, 'job') is data
+    data = Data(LiteralValue('x' * 800))
+    assert store.spool_data(data, 'job') is data
+
+    store.release('job')
+    assert store.memory_used == 0
+    assert not os.path.exists(values[3].path)
+
+
+def test_base64(store):
+    content = bytes(range(256)) * 8
+    encoded = b64encode(content).decode('ascii')
+    # line breaks at arbitrary positions
+    encoded = '\n'.join(
+        encoded[i:i + 70] for i in range(0, len(encoded), 70)
+    )
+    data = store.spool_data(
+        Data(encoded, 'application/octet-stream', 'base64'), 'job'
+    )
+    assert data.encoding is None
+    assert data.value.path is not None
+    with open_input(data) as f:
+        assert f.read() == content
+
+    with pytest.raises(ValueError):
+        store.spool_data(
+            Data('QUJD' * 10 + 'QQ', 'application/octet-stream', 'base64'),
+            'job'
+        )
+
+
+def test_open_input():
+    _, element = make_document(1)
+    assert open_input(Data(element)).read() == etree.tostring(element)
+    assert open_input(Data(LiteralValue('abc'))).read() == b'abc'
+    assert open_input(Data('abc')).read() == b'abc'
+    assert open_input(b'abc').read() == b'abc'
+    assert open_input(SpooledInput(3, '', content=b'abc')).read() == b'abc'
+
+
+def test_job_manager(tmp_path):
+    store = InputStore(str(tmp_path), threshold=10, min_size=10)
+    seen = []
+
+    def process(request, context):
+        value = request.inputs[0].inputs[0].data.value
+        seen.append(value)
+        return {'result': value.read()}
+
+    manager = JobManager({'process': process}, input_store=store)
+    try:
+        request = ExecuteRequest(
+            'process', ExecutionMode.sync, ResponseType.document, inputs=[
+                Input('nested', inputs=[
+                    Input('value', Data('y' * 100, 'text/plain'))
+                ])
+            ]
+        )
+        result = manager.execute(request)
+        assert result.outputs == {'result': b'y' * 100}
+        assert not os.path.exists(seen[0].path)
+        assert os.listdir(str(tmp_path)) == []
+    finally:
+        manager.shutdown(cancel=True)
+        store.close()
@@ -0,0 +1,191 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+from datetime import timedelta
+import threading
+
+import pytest
+
+from .types import JobStatus
+from .v20.types import (
+    ExecuteRequest, ExecutionMode, ResponseType, Input, Data,
+    GetStatusRequest, GetResultRequest, DismissRequest
+)
+from .exceptions import (
+    NoSuchProcessException, NoSuchJobException, ResultNotReadyException,
+    ServerBusyException, JobFailedException
+)
+from .jobs import JobManager, ThreadJobExecutor, ProcessJobExecutor
+
+
+def make_request(process_id, mode=ExecutionMode.async_, value='1'):
+    return ExecuteRequest(
+        process_id, mode, ResponseType.document,
+        inputs=[Input('value', Data(value))]
+    )
+
+
+def double(request, context):
+    context.progress(50)
+    return {'result': 2 * int(request.inputs[0].data.value)}
+
+
+def fail(request, context):
+    raise ValueError('Invalid value')
+
+
+class Blocking:
+    """ A process that runs until it is released or cancelled.
+    """
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Semaphore(0)
+        self.cancelled = []
+        self.stopped = threading.Event()
+
+    def __call__(self, request, context):
+        self.started.release()
+        context.progress(25)
+        while not self.release.wait(0.01):
+            if context.cancelled:
+                self.cancelled.append(context.job_id)
+                self.stopped.set()
+                context.check_cancelled()
+        return {'result': request.inputs[0].data.value}
+
+
+@pytest.fixture
+def blocking():
+    process = Blocking()
+    yield process
+    process.release.set()
+
+
+def test_execute():
+    manager = JobManager({'double': double, 'fail': fail})
+    try:
+        result = manager.execute(make_request('double', ExecutionMode.sync))
+        assert result.outputs == {'result': 2}
+        with pytest.raises(NoSuchJobException):
+            manager.get_status(GetStatusRequest(result.job_id))
+
+        status_info = manager.execute(make_request('double'))
+        assert status_info.status in (JobStatus.accepted, JobStatus.running)
+        assert manager.wait(status_info.job_id, 5)
+        status_info = manager.get_status(GetStatusRequest(status_info.job_id))
+        assert status_info.status == JobStatus.succeded
+        assert status_info.percent_completed == 100
+        assert status_info.expiration_date is not None
+        result = manager.get_result(GetResultRequest(status_info.job_id))
+        assert result.outputs == {'result': 2}
+
+        job_id = manager.execute(make_request('fail')).job_id
+        manager.wait(job_id, 5)
+        with pytest.raises(JobFailedException, match='Invalid value'):
+            manager.get_result(GetResultRequest(job_id))
+
+        with pytest.raises(NoSuchProcessException):
+            manager.execute(make_request('unknown'))
+
+        # expiry
+        manager.sweep(status_info.expiration_date)
+        with pytest.raises(NoSuchJobException):
+            manager.get_status(GetStatusRequest(status_info.job_id))
+    finally:
+        manager.shutdown(cancel=True)
+
+
+def test_status_and_dismiss(blocking):
+    manager = JobManager({'blocking': blocking}, ThreadJobExecutor(1))
+    try:
+        running = manager.execute(make_request('blocking')).job_id
+        queued = manager.execute(make_request('blocking')).job_id
+        assert blocking.started.acquire(timeout=5)
+
+        status_info = manager.get_status(GetStatusRequest(running))
+        assert status_info.status == JobStatus.running
+        assert status_info.percent_completed == 25
+        assert status_info.estimated_completion is not None
+        assert status_info.next_poll is not None
+        assert manager.get_status(GetStatusRequest(queued)).status == \
+            JobStatus.accepted
+        with pytest.raises(ResultNotReadyException):
+            manager.get_result(GetResultRequest(running))
+
+        # dismiss the queued job, then cancel the running one
+        assert manager.dismiss(DismissRequest(queued)).status == \
+            JobStatus.dismissed
+        manager.dismiss(DismissRequest(running))
+        assert blocking.stopped.wait(5)
+        assert blocking.cancelled == [running]
+        for job_id in (queued, running):
+            with pytest.raises(NoSuchJobException):
+                manager.get_status(GetStatusRequest(job_id))
+    finally:
+        manager.shutdown(cancel=True)
+
+
+def test_limits(blocking):
+    manager = JobManager(
+        {'blocking': blocking, 'double': double}, ThreadJobExecutor(2),
+        max_queued=2, concurrency_limits={'blocking': 1}
+    )
+    try:
+        first = manager.execute(make_request('blocking')).job_id
+        second = manager.execute(make_request('blocking')).job_id
+        assert blocking.started.acquire(timeout=5)
+        # the second worker is free for other processes
+        job_id = manager.execute(make_request('double')).job_id
+        assert manager.wait(job_id, 5)
+        assert manager.get_status(GetStatusRequest(second)).status == \
+            JobStatus.accepted
+
+        manager.execute(make_request('blocking'))
+        with pytest.raises(ServerBusyException):
+            manager.execute(make_request('blocking'))
+
+        blocking.release.set()
+        assert manager.wait(first, 5) and manager.wait(second, 5)
+        result = manager.get_result(GetResultRequest(second))
+        assert result.outputs == {'result': '1'}
+    finally:
+        manager.shutdown(cancel=True)
+
+
+def test_process_executor():
+    manager = JobManager(
+        {'double': double}, ProcessJobExecutor(1),
+        poll_interval=timedelta(seconds=1)
+    )
+    try:
+        result = manager.execute(
+            make_request('double', ExecutionMode.sync, '21')
+        )
+        assert result.outputs == {'result': 42}
+    finally:
+        manager.shutdown(cancel=True)
@@ -0,0 +1,299 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+from datetime import datetime, timedelta
+import multiprocessing
+import os
+import sqlite3
+import time
+
+from lxml import etree
+import pytest
+
+from ows.util import UTC
+from .types import JobStatus, StatusInfo
+from ows.common.types import BoundingBox
+from .v20.types import (
+    ExecuteRequest, ExecutionMode, ResponseType, Input, Data, Reference,
+    LiteralValue, GetStatusRequest, GetResultRequest
+)
+from .v20.decoders import xml_decode_execute
+from .jobs import JobManager
+from .jobstore import (
+    SQLiteJobStore, inputs_digest, dump_request, load_request
+)
+from .inputstore import InputStore, open_input
+from .payloads import FilePayload, IteratorPayload
+
+
+def make_request(value='1'):
+    return ExecuteRequest(
+        'double', ExecutionMode.async_, ResponseType.document,
+        inputs=[Input('value', Data(value))]
+    )
+
+
+EXECUTE = b'''<wps:Execute
+    xmlns:wps="http://www.opengis.net/wps/2.0"
+    xmlns:ows="http://www.opengis.net/ows/2.0"
+    xmlns:gml="http://www.opengis.net/gml/3.2"
+    service="WPS" version="2.0.0" response="document" mode="async">
+    <ows:Identifier>point</ows:Identifier>
+    <wps:Input id="geometry">
+        <wps:Data mimeType="application/gml+xml">
+            <gml:Point gml:id="p1" srsName="EPSG:4326">
+                <gml:pos>21 42</gml:pos>
+            </gml:Point>
+        </wps:Data>
+    </wps:Input>
+    <wps:Input id="buffer">
+        <wps:Data><wps:LiteralValue uom="m">10</wps:LiteralValue></wps:Data>
+    </wps:Input>
+    <wps:Output id="result" transmission="value"/>
+</wps:Execute>'''
+
+GML = '{http://www.opengis.net/gml/3.2}'
+
+
+def point(request, context):
+    # inline, spooled or restored XML data
+    point = etree.parse(open_input(request.inputs[0].data)).getroot()
+    return {'result': point.findtext(f'{GML}pos')}
+
+
+def double(request, context):
+    value = 2 * int(request.inputs[0].data.value)
+    return {
+        'result': value,
+        'file': Reference(f'http://provider.org/results/{value}.txt'),
+    }
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'jobs.sqlite')
+
+
+def test_store(path):
+    store = SQLiteJobStore(path)
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    store.add('double', StatusInfo('a', JobStatus.accepted, next_poll=now))
+    assert store.get_status('a') == StatusInfo(
+        'a', JobStatus.accepted, next_poll=now
+    )
+    assert store.get_status('b') is None
+
+    store.finish(StatusInfo(
+        'a', JobStatus.succeded, expiration_date=now, percent_completed=100
+    ), {'result': 1, 'file': Reference('http://provider.org/a.txt')})
+    assert store.get_status('a').status == JobStatus.succeded
+    assert store.get_outputs('a')[0]['result'] == 1
+    assert store.get_output_locations('a') == {
+        'file': 'http://provider.org/a.txt'
+    }
+
+    assert store.expired(now - timedelta(seconds=1)) == []
+    assert store.expired(now) == ['a']
+    assert store.remove('a')
+    assert not store.remove('a')
+
+    # the status is a single lookup of the primary key index
+    plan = store._connection().execute(
+        'EXPLAIN QUERY PLAN SELECT status FROM jobs WHERE job_id = ?', ('a',)
+    ).fetchall()
+    assert len(plan) == 1 and 'USING INDEX' in plan[0][-1]
+
+
+def test_outputs(path):
+    store = SQLiteJobStore(path)
+    status_info = StatusInfo('a', JobStatus.succeded)
+    store.add('double', status_info)
+    store.finish(status_info, {
+        'number': 1.5,
+        'flag': True,
+        'literal': LiteralValue('10', 'integer', 'm'),
+        'bbox': BoundingBox('EPSG:4326', [0.0, 1.0, 2.0, 3.0]),
+        'data': Data(b'\x00\x01', mime_type='application/octet-stream'),
+        'xml': etree.fromstring('<a xmlns="http://example.com/a"><b/></a>'),
+        'file': FilePayload('/data/result.tif', mime_type='image/tiff'),
+        'chunks': IteratorPayload(iter([b'a', b'b']), mime_type='text/plain'),
+        'nested': {'text': 'value'},
+    })
+    outputs = store.get_outputs('a')[0]
+    assert outputs['number'] == 1.5 and outputs['flag'] is True
+    assert outputs['literal'] == LiteralValue('10', 'integer', 'm')
+    assert outputs['bbox'] == BoundingBox('EPSG:4326', [0.0, 1.0, 2.0, 3.0])
+    assert outputs['data'] == Data(
+        b'\x00\x01', mime_type='application/octet-stream'
+    )
+    assert outputs['xml'].tag == '{http://example.com/a}a'
+    assert outputs['file'] == FilePayload(
+        '/data/result.tif', mime_type='image/tiff'
+    )
+    # one-shot payloads are read
+    assert outputs['chunks'] == Data(b'ab', mime_type='text/plain')
+    assert outputs['nested'] == {'text': 'value'}
+
+    # values of other types are not stored
+    with pytest.raises(TypeError):
+        store.finish(status_info, {'result': object()})
+    with pytest.raises(TypeError):
+        dump_request(make_request(object()))
+
+
+def test_unstorable_outputs(path):
+    manager = JobManager(
+        {'object': lambda request, context: {'result': object()}},
+        store=SQLiteJobStore(path),
+    )
+    try:
+        request = make_request()
+        request.process_id = 'object'
+        status_info = manager.execute(request)
+        assert manager.wait(status_info.job_id, 5)
+        assert manager.get_status(GetStatusRequest(status_info.job_id)) \
+            .status == JobStatus.failed
+    finally:
+        manager.shutdown()
+
+
+def test_shared_status(path):
+    manager = JobManager({'double': double}, store=SQLiteJobStore(path))
+    try:
+        job_id = manager.execute(make_request('2')).job_id
+        assert manager.wait(job_id, 5)
+    finally:
+        manager.shutdown()
+
+    # another worker sees the status and results
+    other = JobManager({}, store=SQLiteJobStore(path))
+    assert other.get_status(GetStatusRequest(job_id)).status == \
+        JobStatus.succeded
+    assert other.get_result(GetResultRequest(job_id)).outputs['result'] == 4
+    assert other.store.get_output_locations(job_id) == {
+        'file': 'http://provider.org/results/4.txt'
+    }
+
+
+def test_xml_inputs(path):
+    request = xml_decode_execute(EXECUTE)
+    # the digest does not depend on the decoded objects
+    assert inputs_digest(request) == inputs_digest(xml_decode_execute(EXECUTE))
+
+    loaded = load_request(dump_request(request))
+    assert inputs_digest(loaded) == inputs_digest(request)
+    assert loaded.inputs[1] == request.inputs[1]
+    assert loaded.output_definitions == request.output_definitions
+    assert point(loaded, None) == {'result': '21 42'}
+
+    store = SQLiteJobStore(path)
+    input_store = InputStore(min_size=0, threshold=0)
+    manager = JobManager(
+        {'point': point}, store=store, input_store=input_store
+    )
+    try:
+        job_id = manager.execute(request).job_id
+        assert manager.wait(job_id, 5)
+    finally:
+        manager.shutdown()
+        input_store.close()
+
+    assert store.get_outputs(job_id)[0] == {'result': '21 42'}
+
+
+def test_leases(path):
+    # the stores of a single process are separate owners
+    first = SQLiteJobStore(path, lease=0.2)
+    second = SQLiteJobStore(path, lease=0.2)
+    first.add(
+        'point', StatusInfo('a', JobStatus.running),
+        xml_decode_execute(EXECUTE)
+    )
+    time.sleep(0.5)
+    # the lease is still renewed
+    assert second.claim_interrupted() == []
+
+    first.close()
+    time.sleep(0.5)
+    (job_id, request), = second.claim_interrupted()
+    assert job_id == 'a'
+    assert point(request, None) == {'result': '21 42'}
+    assert second.get_status('a').status == JobStatus.accepted
+    assert first.claim_interrupted() == []
+    second.close()
+
+
+def _submit_and_exit(path, queue):
+    # a worker that accepts a job, but exits before running it
+    store = SQLiteJobStore(path, lease=0.1)
+    request = xml_decode_execute(EXECUTE)
+    store.add('point', StatusInfo('interrupted', JobStatus.running), request)
+    queue.put('interrupted')
+
+
+def test_recover(path):
+    context = multiprocessing.get_context('fork')
+    queue = context.Queue()
+    process = context.Process(target=_submit_and_exit, args=(path, queue))
+    process.start()
+    job_id = queue.get(timeout=10)
+    process.join()
+
+    manager = JobManager({'point': point}, store=SQLiteJobStore(path))
+    try:
+        time.sleep(0.2)
+        assert manager.recover() == [job_id]
+        assert manager.wait(job_id, 5)
+        result = manager.get_result(GetResultRequest(job_id))
+        assert result.outputs['result'] == '21 42'
+        # the job is only recovered once
+        assert manager.recover() == []
+    finally:
+        manager.shutdown()
+
+
+def test_failing_store(path, tmp_path):
+    class FailingStore(SQLiteJobStore):
+        def add(self, *args):
+            raise sqlite3.OperationalError('database is locked')
+
+    directory = tmp_path / 'inputs'
+    directory.mkdir()
+    input_store = InputStore(str(directory), threshold=0, min_size=0)
+    manager = JobManager(
+        {'point': point}, store=FailingStore(path), input_store=input_store
+    )
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            manager.execute(xml_decode_execute(EXECUTE))
+        # the spooled inputs are released
+        assert os.listdir(input_store.directory) == []
+        assert manager._jobs == {}
+    finally:
+        manager.shutdown()
+        input_store.close()
@@ -0,0 +1,109 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+import mmap
+import os
+
+import pytest
+from lxml import etree
+
+from .v20.types import Data, LiteralValue, OutputDefinition, TransmissionType
+from .payloads import (
+    FilePayload, FileDescriptorPayload, MemoryMapPayload, IteratorPayload,
+    raw_output_result, select_raw_output
+)
+
+
+CONTENT = bytes(range(256)) * 400
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / 'output.bin'
+    path.write_bytes(CONTENT)
+    return str(path)
+
+
+@pytest.mark.parametrize('payload_type', [FilePayload, MemoryMapPayload])
+def test_file_payloads(path, payload_type):
+    chunks = [
+        bytes(chunk)
+        for chunk in payload_type(path).iter_chunks(30000)
+    ]
+    assert [len(chunk) for chunk in chunks] == [30000, 30000, 30000, 12400]
+    assert b''.join(chunks) == CONTENT
+
+    # offsets that are not aligned to the pages of the mapping
+    offset = mmap.ALLOCATIONGRANULARITY + 17
+    payload = payload_type(path, offset=offset, length=1000)
+    assert payload.size == 1000
+    assert b''.join(
+        bytes(chunk) for chunk in payload.iter_chunks(300)
+    ) == CONTENT[offset:offset + 1000]
+
+    payload = payload_type(path, offset=len(CONTENT))
+    assert payload.size == 0
+    assert list(payload.iter_chunks()) == []
+
+
+def test_file_descriptor_payload():
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b'abcdefg')
+    os.close(write_fd)
+    payload = FileDescriptorPayload(read_fd)
+    assert list(payload.iter_chunks(3)) == [b'abc', b'def', b'g']
+    # the descriptor was closed
+    with pytest.raises(OSError):
+        os.fstat(read_fd)
+
+
+def test_raw_output_result(path):
+    payload = FilePayload(path, mime_type='image/tiff')
+    result = raw_output_result(select_raw_output({'a': payload}))
+    assert result.content_type == 'image/tiff'
+    assert b''.join(result.value) == CONTENT
+
+    outputs = {
+        'a': Data(IteratorPayload([b'1', b'2'])),
+        'b': Data(b'png', mime_type='image/png'),
+        'c': LiteralValue('10.0'),
+        'd': etree.fromstring('<a/>'),
+    }
+    with pytest.raises(ValueError):
+        select_raw_output(outputs)
+
+    result = raw_output_result(
+        select_raw_output(outputs, [
+            OutputDefinition('a', TransmissionType.value, 'text/csv')
+        ]), 'text/csv'
+    )
+    assert (result.content_type, list(result.value)) == (
+        'text/csv', [b'1', b'2']
+    )
+    assert raw_output_result(outputs['b']).content_type == 'image/png'
+    assert raw_output_result(outputs['c']).value == b'10.0'
+    assert raw_output_result(outputs['d']).value == b'<a/>'
@@ -0,0 +1,218 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import threading
+
+import pytest
+
+from .types import (
+    ProcessDescription, InputDescription, ComplexDataDescription, Format
+)
+from .v20.types import (
+    ExecuteRequest, ExecutionMode, ResponseType, Input, Data, Reference
+)
+from .exceptions import DataNotAccessibleException, SizeExceededException
+from .references import resolve_references, redirect_location
+
+
+aiohttp = pytest.importorskip('aiohttp')
+
+
+CONTENTS = {
+    '/a': b'alpha',
+    '/b': b'beta',
+    '/copy-of-a': b'alpha',
+    '/large': b'x' * 3000000,
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def send(self, status, content=b'', headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        if self.path in CONTENTS:
+            self.send(
+                200, CONTENTS[self.path], [('Content-Type', 'text/plain')]
+            )
+        elif self.path == '/chunked':
+            self.send_response(200)
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for chunk in (b'chunked ', b'content'):
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+            self.wfile.write(b'0\r\n\r\n')
+        elif self.path == '/redirect':
+            self.send(302, headers=[('Location', '/b')])
+        elif self.path == '/redirect-ftp':
+            self.send(302, headers=[('Location', 'ftp://example.com/a')])
+        elif self.path == '/large-header':
+            self.send(200, b'a', [('X-Large', 'x' * 10000)])
+        elif self.path == '/body':
+            self.send(200, b'<query/>', [('Content-Type', 'text/xml')])
+        else:
+            self.send(404, b'Not found')
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.send(200, b'echo: ' + body, [
+            ('Content-Type', self.headers['Content-Type'])
+        ])
+
+
+@pytest.fixture(scope='module')
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    # clients close connections with oversized responses
+    server.handle_error = lambda request, address: None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def make_request(*references):
+    return ExecuteRequest(
+        'process', ExecutionMode.sync, ResponseType.document, inputs=[
+            Input(identifier, reference)
+            for identifier, reference in references
+        ]
+    )
+
+
+def test_resolve_references(server, tmp_path):
+    request = make_request(
+        ('a', Reference(f'{server}/a')),
+        ('b', Reference(f'{server}/b')),
+        ('same', Reference(f'{server}/copy-of-a')),
+        ('again', Reference(f'{server}/a')),
+        ('chunked', Reference(f'{server}/chunked')),
+        ('redirect', Reference(f'{server}/redirect')),
+        ('post', Reference(f'{server}/echo', body='<query/>')),
+        ('post2', Reference(
+            f'{server}/echo', body_reference_href=f'{server}/body'
+        )),
+    )
+    request.inputs.append(Input('nested', inputs=[
+        Input('literal', Data('1')),
+        Input('c', Reference(f'{server}/b')),
+    ]))
+
+    Handler.connections = 0
+    fetched = resolve_references(request, str(tmp_path), per_host_limit=2)
+    assert [item.identifier for item in fetched] == [
+        'a', 'b', 'same', 'again', 'chunked', 'redirect', 'post', 'post2', 'c'
+    ]
+
+    def read(item):
+        with open(item.path, 'rb') as f:
+            return f.read()
+
+    contents = [read(item) for item in fetched]
+    assert contents == [
+        b'alpha', b'beta', b'alpha', b'alpha', b'chunked content', b'beta',
+        b'echo: <query/>', b'echo: <query/>', b'beta',
+    ]
+    assert fetched[0].content_type == 'text/plain'
+    assert fetched[6].content_type == 'application/xml'
+    # referenced bodies are sent with their own content type
+    assert fetched[7].content_type == 'text/xml'
+    assert fetched[0].size == 5
+
+    # stored by content
+    assert fetched[0].path == fetched[2].path
+    assert len(os.listdir(tmp_path)) == 4
+
+    # connections are reused: the redirect closes one
+    assert Handler.connections <= 4
+
+
+def test_resolve_references_errors(server, tmp_path):
+    with pytest.raises(DataNotAccessibleException) as excinfo:
+        resolve_references(make_request(
+            ('a', Reference(f'{server}/a')),
+            ('missing', Reference(f'{server}/missing')),
+        ), str(tmp_path))
+    assert excinfo.value.locator == 'missing'
+
+    description = ProcessDescription('process', inputs=[
+        InputDescription('large', ComplexDataDescription([
+            Format('text/plain', maxmimum_megabytes=1),
+        ])),
+    ])
+    with pytest.raises(SizeExceededException) as excinfo:
+        resolve_references(make_request(
+            ('large', Reference(f'{server}/large')),
+        ), str(tmp_path), description)
+    assert excinfo.value.locator == 'large'
+
+    with pytest.raises(DataNotAccessibleException):
+        resolve_references(make_request(
+            ('invalid', Reference('ftp://example.com/a')),
+        ), str(tmp_path))
+
+    # no partial files are left behind
+    assert not any(name.endswith('.part') for name in os.listdir(tmp_path))
+
+
+def test_redirects_and_limits(server, tmp_path):
+    assert redirect_location('http://a.org/x/y', '../z') == 'http://a.org/z'
+    assert redirect_location('http://a.org/', 'https://b.org/') == \
+        'https://b.org/'
+    for url, location in [
+        ('https://a.org/', 'http://a.org/'),
+        ('https://a.org/', 'http://b.org/'),
+        ('http://a.org/', 'file:///etc/passwd'),
+    ]:
+        with pytest.raises(DataNotAccessibleException):
+            redirect_location(url, location)
+
+    for path in ('redirect-ftp', 'large-header'):
+        with pytest.raises(DataNotAccessibleException) as excinfo:
+            resolve_references(make_request(
+                (path, Reference(f'{server}/{path}')),
+            ), str(tmp_path))
+        assert excinfo.value.locator == path
@@ -0,0 +1,194 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+import pytest
+
+from ows.util import Version
+from ows.common.types import BoundingBox
+from .types import JobStatus, ProcessDescription
+from .v20.types import (
+    ExecuteRequest, ExecutionMode, ResponseType, Input, Data, Reference,
+    LiteralValue, OutputDefinition, TransmissionType
+)
+from .v20.decoders import xml_decode_execute
+from .canonical import canonical_form
+from .references import FetchedReference
+from .jobs import JobManager, JobResult
+from .resultcache import ExecuteResultCache, outputs_size
+
+
+def make_request(inputs, outputs=(), process_id='p', mode=ExecutionMode.sync):
+    return ExecuteRequest(
+        process_id, mode, ResponseType.document, inputs=list(inputs),
+        output_definitions=list(outputs),
+    )
+
+
+def literal(value, data_type='xs:double'):
+    return Data(LiteralValue(value, data_type))
+
+
+def decode_inputs(inputs, namespaces=''):
+    return xml_decode_execute(f'''<wps:Execute
+        xmlns:wps="http://www.opengis.net/wps/2.0"
+        xmlns:ows="http://www.opengis.net/ows/2.0" {namespaces}
+        service="WPS" version="2.0.0" response="document" mode="sync">
+        <ows:Identifier>p</ows:Identifier>
+        {inputs}
+        <wps:Output id="result" transmission="value"/>
+    </wps:Execute>''').inputs
+
+
+@pytest.fixture
+def cache():
+    cache = ExecuteResultCache(1024)
+    cache.enable(ProcessDescription('p', version=Version(1, 0)))
+    return cache
+
+
+def test_equivalent_requests(cache):
+    a = make_request([
+        Input('a', literal('1')),
+        Input('b', Data(BoundingBox('EPSG:4326', [0, 0, 10, 10]))),
+    ] + decode_inputs('''
+        <wps:Input id="c">
+            <wps:Data mimeType="text/xml"><x b="1"  a="2"/><!-- x --></wps:Data>
+        </wps:Input>
+    '''))
+    b = make_request(decode_inputs('''
+        <wps:Input id="c">
+            <wps:Data mimeType="text/xml">
+                <x a="2" b="1"></x>
+            </wps:Data>
+        </wps:Input>
+    ''', 'xmlns:gml="http://www.opengis.net/gml/3.2"') + [
+        Input('b', Data(BoundingBox('epsg:4326', [0.0, 0, 1e1, 10.0]))),
+        Input('a', literal(' 1.0 ')),
+    ])
+    assert cache.key(a) == cache.key(b)
+    # the execution mode does not matter
+    a.mode = ExecutionMode.async_
+    assert cache.key(a) == cache.key(b)
+
+
+@pytest.mark.parametrize('inputs, outputs', [
+    ([Input('a', literal('2'))], []),
+    ([Input('a', literal('1', 'xs:string'))], []),
+    ([Input('a', Data(LiteralValue('1', 'xs:double', 'm')))], []),
+    ([Input('b', literal('1'))], []),
+    ([Input('a', literal('1')), Input('a', literal('2'))], []),
+    ([Input('a', literal('1'))], [
+        OutputDefinition('result', TransmissionType.value)
+    ]),
+    ([Input('a', inputs=[Input('a', literal('1'))])], []),
+])
+def test_different_requests(cache, inputs, outputs):
+    key = cache.key(make_request([Input('a', literal('1'))]))
+    assert cache.key(make_request(inputs, outputs)) != key
+
+
+def test_xml_inputs(cache):
+    inputs = '''
+        <wps:Input id="geometry">
+            <wps:Data mimeType="application/gml+xml">
+                <gml:Point gml:id="p" srsName="EPSG:4326">
+                    <gml:pos>1 2</gml:pos>
+                </gml:Point>
+            </wps:Data>
+        </wps:Input>
+    '''
+    namespaces = 'xmlns:gml="http://www.opengis.net/gml/3.2"'
+    # separately decoded documents share the key
+    a = make_request(decode_inputs(inputs, namespaces))
+    b = make_request(decode_inputs(inputs, namespaces))
+    assert cache.key(a) == cache.key(b)
+    assert b'<gml:pos>1 2</gml:pos>' in canonical_form(a)
+
+    c = make_request(decode_inputs(
+        inputs.replace('1 2', '1 3'), namespaces
+    ))
+    assert cache.key(a) != cache.key(c)
+
+
+def test_references(cache):
+    a = make_request([Input('a', Reference('http://a.example/data'))])
+    b = make_request([Input('a', Reference('http://b.example/data'))])
+    assert cache.key(a) != cache.key(b)
+    # the same content is referenced from different locations
+    assert cache.key(a, [
+        FetchedReference('a', a.inputs[0].data, None, 'abc', 3)
+    ]) == cache.key(b, [
+        FetchedReference('a', b.inputs[0].data, None, 'abc', 3)
+    ])
+
+
+def test_process_version(cache):
+    request = make_request([Input('a', literal('1'))])
+    key = cache.key(request)
+    cache.enable(ProcessDescription('p', version=Version(1, 1)))
+    assert cache.key(request) != key
+    cache.disable('p')
+    assert cache.key(request) is None
+    assert outputs_size({'a': b'123', 'b': ['12', '3']}) == 6
+
+
+def test_job_manager(cache):
+    calls = []
+
+    def process(request, context):
+        calls.append(request)
+        return {'result': request.inputs[0].data.value.value * 2}
+
+    manager = JobManager({'p': process, 'q': process}, result_cache=cache)
+    try:
+        result = manager.execute(make_request([Input('a', literal('1'))]))
+        assert result.outputs == {'result': '11'}
+        assert len(cache) == 1
+
+        result = manager.execute(make_request([Input('a', literal('1.0'))]))
+        assert isinstance(result, JobResult)
+        assert result.outputs == {'result': '11'}
+        assert len(calls) == 1
+
+        # a cached result in asynchronous mode is a finished job
+        status_info = manager.execute(make_request(
+            [Input('a', literal('1e0'))], mode=ExecutionMode.async_
+        ))
+        assert status_info.status == JobStatus.succeded
+        assert manager.store.get_outputs(status_info.job_id)[0] == {
+            'result': '11'
+        }
+        assert len(calls) == 1
+
+        # processes are only cached when enabled
+        for _ in range(2):
+            manager.execute(make_request(
+                [Input('a', literal('1'))], process_id='q'
+            ))
+        assert len(calls) == 3
+    finally:
+        manager.shutdown()
@@ -0,0 +1,147 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+import asyncio
+from datetime import datetime, timedelta
+import threading
+
+from ows.util import UTC
+from .types import JobStatus, StatusInfo
+from .v20.types import (
+    ExecuteRequest, ExecutionMode, ResponseType, Input, Data,
+    GetStatusRequest
+)
+from .jobs import JobManager, ThreadJobExecutor
+from .status import PollScheduler
+
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def test_poll_scheduler():
+    scheduler = PollScheduler(
+        min_interval=timedelta(seconds=1), max_interval=timedelta(hours=1),
+        default_interval=timedelta(seconds=5),
+    )
+    running = StatusInfo('a', JobStatus.running)
+    accepted = StatusInfo('a', JobStatus.accepted)
+
+    # nothing known yet
+    assert scheduler.next_poll(accepted, NOW, 'p') == \
+        NOW + timedelta(seconds=5)
+    assert scheduler.next_poll(
+        running, NOW, 'p', NOW - timedelta(minutes=10)
+    ) == NOW + timedelta(minutes=5)
+
+    # half of the estimated remaining time, clamped
+    running.estimated_completion = NOW + timedelta(minutes=30)
+    assert scheduler.next_poll(running, NOW) == NOW + timedelta(minutes=15)
+    running.estimated_completion = NOW + timedelta(days=1)
+    assert scheduler.next_poll(running, NOW) == NOW + timedelta(hours=1)
+    running.estimated_completion = NOW
+    assert scheduler.next_poll(running, NOW) == NOW + timedelta(seconds=1)
+
+    scheduler.record_duration('p', timedelta(minutes=10))
+    scheduler.record_duration('p', timedelta(minutes=20))
+    assert scheduler.expected_duration('p') == timedelta(minutes=12)
+    # the fourth queued job of two workers runs in the second batch
+    assert scheduler.next_poll(
+        accepted, NOW, 'p', queue_position=3, workers=2
+    ) == NOW + timedelta(minutes=12)
+
+    assert scheduler.next_poll(
+        StatusInfo('a', JobStatus.succeded), NOW
+    ) is None
+
+
+def make_request(value='1'):
+    return ExecuteRequest(
+        'p', ExecutionMode.async_, ResponseType.document,
+        inputs=[Input('value', Data(value))]
+    )
+
+
+def test_wait_status():
+    release = threading.Event()
+    progressed = threading.Event()
+
+    def process(request, context):
+        if request.inputs[0].data.value == 'queued':
+            return {'result': 2}
+        release.wait(5)
+        context.progress(50)
+        progressed.set()
+        release.clear()
+        release.wait(5)
+        return {'result': 1}
+
+    manager = JobManager(
+        {'p': process}, ThreadJobExecutor(1),
+        poll_interval=timedelta(seconds=10),
+    )
+
+    async def poll():
+        first = manager.submit(make_request())
+        second = manager.submit(make_request('queued'))
+        status_info = manager.get_status(GetStatusRequest(second.job_id))
+        assert status_info.status == JobStatus.accepted
+        assert status_info.next_poll is not None
+
+        job_id = first.job_id
+        status_info = manager.get_status(GetStatusRequest(job_id))
+        assert status_info.status == JobStatus.running
+
+        # nothing changes until the timeout
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        assert (await manager.wait_status(
+            GetStatusRequest(job_id), 0.1, status_info
+        )).percent_completed == 0
+        assert loop.time() - started >= 0.1
+
+        # progress is noticed at the next check
+        release.set()
+        status_info = await manager.wait_status(
+            GetStatusRequest(job_id), 5, status_info, check_interval=0.01
+        )
+        assert status_info.percent_completed == 50
+
+        # status changes wake up the waiters right away
+        progressed.wait(5)
+        loop.call_later(0.05, release.set)
+        started = loop.time()
+        status_info = await manager.wait_status(
+            GetStatusRequest(job_id), 5, status_info, check_interval=5
+        )
+        assert status_info.status == JobStatus.succeded
+        assert loop.time() - started < 4
+
+    try:
+        asyncio.run(poll())
+    finally:
+        release.set()
+        manager.shutdown()
@@ -0,0 +1,240 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+from datetime import datetime
+
+import pytest
+
+from ows.common.types import BoundingBox
+from .types import (
+    ProcessDescription, InputDescription, OutputDescription, Domain, Format,
+    LiteralDataDescription, BoundingBoxDataDescription,
+    ComplexDataDescription
+)
+from .v20.types import (
+    ExecuteRequest, ExecutionMode, ResponseType, Input, Data, Reference,
+    LiteralValue, OutputDefinition, TransmissionType
+)
+from .exceptions import (
+    NoSuchInputException, NoSuchOutputException, NoSuchFormatException,
+    WrongInputDataException, SizeExceededException
+)
+from .v20.decoders import xml_decode_execute
+from .jobs import JobManager
+from .inputstore import SpooledInput
+from .validation import LiteralDomain, compile_validator, compile_validators
+
+
+TEXT = [Format('text/plain')]
+
+DESCRIPTION = ProcessDescription(
+    'p',
+    inputs=[
+        InputDescription('count', LiteralDataDescription([
+            Domain('integer', [1, 2, (10, 20), (15, 30), (100, None)]),
+        ], TEXT)),
+        InputDescription('distance', LiteralDataDescription([
+            Domain('xs:double', [(0, 1000)], uom='m'),
+            Domain('xs:double', [(0, 1)], uom='km'),
+        ], TEXT)),
+        InputDescription('bbox', BoundingBoxDataDescription(
+            ['EPSG:4326', 'EPSG:3857'], TEXT
+        )),
+        InputDescription('options', inputs=[
+            InputDescription('flag', LiteralDataDescription(
+                [Domain('boolean')], TEXT
+            )),
+            InputDescription('since', LiteralDataDescription(
+                [Domain('dateTime', [('2020-01-01T00:00:00Z', None)])], TEXT
+            )),
+        ]),
+        InputDescription('geometry', ComplexDataDescription([
+            Format('application/json', maxmimum_megabytes=1),
+            Format('application/xml', schema='http://example.com/a.xsd'),
+            Format('application/gml+xml', maxmimum_megabytes=1),
+        ])),
+    ],
+    outputs=[
+        OutputDescription('result', ComplexDataDescription([
+            Format('image/tiff'), Format('image/png'),
+        ])),
+    ],
+)
+
+
+def make_request(*inputs, outputs=()):
+    return ExecuteRequest(
+        'p', ExecutionMode.sync, ResponseType.document, inputs=list(inputs),
+        output_definitions=list(outputs),
+    )
+
+
+def literal(value, data_type=None, uom=None):
+    return Data(LiteralValue(value, data_type, uom))
+
+
+@pytest.fixture(scope='module')
+def validator():
+    return compile_validator(DESCRIPTION)
+
+
+def test_literal_domain():
+    domain = LiteralDomain(Domain('integer', [1, (10, 20), (15, 30), 50]))
+    assert [value in domain for value in (1, 2, 9, 10, 25, 30, 31, 50)] == [
+        True, False, False, True, True, True, False, True
+    ]
+    domain = LiteralDomain(Domain('double', [(None, 0), (1, None)]))
+    assert -1e9 in domain and 0.5 not in domain and 1e9 in domain
+    assert 'anything' in LiteralDomain(Domain('string'))
+
+
+def test_valid(validator):
+    validator.validate(make_request(
+        Input('count', literal('17')),
+        Input('count', Data('150')),
+        Input('distance', literal('0.5', uom='km')),
+        Input('distance', literal('750', 'xs:double', 'm')),
+        Input('bbox', Data(BoundingBox('epsg:4326', [0, 0, 10, 10]))),
+        Input('options', inputs=[
+            Input('flag', literal('TRUE')),
+            Input('since', literal('2021-06-01T12:00:00Z')),
+        ]),
+        Input('geometry', Data('{}', mime_type='application/json')),
+        Input('geometry', Reference('http://example.com/geometry.xml')),
+        outputs=[OutputDefinition(
+            'result', TransmissionType.value, mime_type='image/png'
+        )],
+    ))
+
+
+@pytest.mark.parametrize('input_, exception', [
+    (Input('unknown', literal('1')), NoSuchInputException),
+    (Input('options', inputs=[Input('unknown', literal('1'))]),
+     NoSuchInputException),
+    (Input('count', literal('3')), WrongInputDataException),
+    (Input('count', literal('1.5')), WrongInputDataException),
+    (Input('count', literal('abc')), WrongInputDataException),
+    (Input('count', literal('11', 'xs:string')), WrongInputDataException),
+    (Input('count', Data(BoundingBox(None, [0, 0, 1, 1]))),
+     WrongInputDataException),
+    (Input('distance', literal('2', uom='km')), WrongInputDataException),
+    (Input('distance', literal('2', uom='ft')), WrongInputDataException),
+    (Input('bbox', Data(BoundingBox('EPSG:32633', [0, 0, 1, 1]))),
+     WrongInputDataException),
+    (Input('bbox', Data(BoundingBox('EPSG:4326', [0, 10, 1, 1]))),
+     WrongInputDataException),
+    (Input('options', inputs=[Input('flag', literal('maybe'))]),
+     WrongInputDataException),
+    (Input('options', inputs=[Input('since', literal('2019-01-01'))]),
+     WrongInputDataException),
+    (Input('options', literal('1')), WrongInputDataException),
+    (Input('count', inputs=[Input('count', literal('1'))]),
+     WrongInputDataException),
+    (Input('geometry', Data('{}', mime_type='text/csv')),
+     NoSuchFormatException),
+    (Input('geometry', Reference(
+        'http://example.com/geometry.xml', mime_type='application/xml',
+        schema='http://example.com/b.xsd'
+    )), NoSuchFormatException),
+    (Input('geometry', Data(
+        'x' * (1024 * 1024 + 1), mime_type='application/json'
+    )), SizeExceededException),
+])
+def test_invalid_inputs(validator, input_, exception):
+    with pytest.raises(exception) as excinfo:
+        validator.validate(make_request(input_))
+    assert excinfo.value.locator in (input_.identifier, 'unknown', 'flag',
+                                     'since')
+
+
+@pytest.mark.parametrize('output, exception', [
+    (OutputDefinition('unknown', TransmissionType.value),
+     NoSuchOutputException),
+    (OutputDefinition('result', TransmissionType.value, 'image/jpeg'),
+     NoSuchFormatException),
+])
+def test_invalid_outputs(validator, output, exception):
+    with pytest.raises(exception):
+        validator.validate(make_request(outputs=[output]))
+
+
+def test_job_manager():
+    calls = []
+    manager = JobManager(
+        {'p': lambda request, context: calls.append(request)},
+        validators=compile_validators([DESCRIPTION]),
+    )
+    try:
+        with pytest.raises(WrongInputDataException):
+            manager.execute(make_request(Input('count', literal('0'))))
+        assert manager.execute(make_request(Input('count', literal('2'))))
+        assert len(calls) == 1
+    finally:
+        manager.shutdown()
+
+
+def test_datetime_domain():
+    domain = LiteralDomain(Domain('dateTime', [
+        (datetime(2020, 1, 1), datetime(2021, 1, 1))
+    ]))
+    # datetimes without a timezone are in UTC
+    assert domain.convert('2020-06-01T00:00:00') in domain
+    assert domain.convert('2020-12-31T23:00:00-01:00') in domain
+    assert domain.convert('2021-01-01T00:00:00-01:00') not in domain
+
+
+def decode_geometry(count):
+    points = '<gml:pos>12.5 48.25</gml:pos>' * count
+    return xml_decode_execute(f'''<wps:Execute
+        xmlns:wps="http://www.opengis.net/wps/2.0"
+        xmlns:ows="http://www.opengis.net/ows/2.0"
+        xmlns:gml="http://www.opengis.net/gml/3.2"
+        service="WPS" version="2.0.0" response="document" mode="sync">
+        <ows:Identifier>p</ows:Identifier>
+        <wps:Input id="geometry">
+            <wps:Data mimeType="application/gml+xml">
+                <gml:LineString>{points}</gml:LineString>
+            </wps:Data>
+        </wps:Input>
+        <wps:Output id="result" transmission="value"/>
+    </wps:Execute>''')
+
+
+def test_xml_size(validator):
+    validator.validate(decode_geometry(10))
+    with pytest.raises(SizeExceededException):
+        validator.validate(decode_geometry(40000))
+
+    # spooled inputs are checked by their size
+    validator.validate(make_request(Input('geometry', Data(
+        SpooledInput(1024, '', content=b''), 'application/gml+xml'
+    ))))
+    with pytest.raises(SizeExceededException):
+        validator.validate(make_request(Input('geometry', Data(
+            SpooledInput(1024 * 1024 + 1, '', path='/nonexistent'),
+            'application/gml+xml'
+        ))))
@@ -151,6 +151,7 @@ class JobStatus:
     failed = 'Failed'
     accepted = 'Accepted'
     running = 'Running'
+    dismissed = 'Dismissed'
 
 
 @dataclass
@@ -31,7 +31,7 @@ import re
 
 from ows import kvp, xml
 from ows.common.types import BoundingBox
-from ows.common.v20.namespaces import ns_ows
+from ows.common.v20.namespaces import ns_ows, ns_xlink
 from ows.decoder import typelist
 from ows.util import Version
 
@@ -76,25 +76,52 @@ def xml_decode_describe_process(xml) -> DescribeProcessRequest:
 # Execute
 # ------------------------------------------------------------------------------
 
+WPS_DATA = ns_wps('Data')
+WPS_REFERENCE = ns_wps('Reference')
+WPS_INPUT = ns_wps('Input')
+WPS_LITERAL_VALUE = ns_wps('LiteralValue')
+WPS_BODY = ns_wps('Body')
+WPS_BODY_REFERENCE = ns_wps('BodyReference')
+OWS_BOUNDING_BOX = ns_ows('BoundingBox')
+OWS_LOWER_CORNER = ns_ows('LowerCorner')
+OWS_UPPER_CORNER = ns_ows('UpperCorner')
+XLINK_HREF = ns_xlink('href')
+
+
 def parse_data_input(input_elem):
-    decoder = XMLInputDecoder(input_elem)
+    """ Decodes a wps:Input element by walking its children once. Elements
+        violating the multiplicities are passed to the
+        :class:`XMLInputDecoder` to raise the appropriate exception.
+    """
+    identifier = input_elem.get('id')
+    data = reference = None
+    inputs = []
+    valid = identifier is not None
+    for child in input_elem:
+        tag = child.tag
+        if tag == WPS_DATA:
+            valid = valid and data is None
+            data = parse_data(child)
+        elif tag == WPS_REFERENCE:
+            valid = valid and reference is None
+            reference = parse_reference(child)
+        elif tag == WPS_INPUT:
+            inputs.append(parse_data_input(child))
+
+    if not valid:
+        decoder = XMLInputDecoder(input_elem)
+        identifier = decoder.identifier
+        data = decoder.data or decoder.reference
+
     return Input(
-        identifier=decoder.identifier,
-        data=decoder.data or decoder.reference,
-        inputs=[
-            input_ for input_ in decoder.inputs
-        ] if decoder.inputs else None,
+        identifier=identifier,
+        data=data or reference,
+        inputs=inputs or None,
     )
 
 
-class XMLDataDecoder(xml.Decoder):
-    mime_type = xml.Parameter('@mimeType', num='?')
-    encoding = xml.Parameter('@encoding', num='?')
-    schema = xml.Parameter('@schema', num='?')
-
-
 RE_LITERAL_VALUE = re.compile(r'([^@]+)(?:@datatype=([^@]+))?(?:@uom=([^@]+))?')
-FLOAT_PATTERN = r'[0-9]+(?:.[0-9]*)?'
+FLOAT_PATTERN = r'[0-9]+(?:\.[0-9]*)?'
 RE_BBOX_VALUE = re.compile(
     f'({FLOAT_PATTERN})(?:,({FLOAT_PATTERN}))?,'
     f'({FLOAT_PATTERN})(?:,({FLOAT_PATTERN}))?'
@@ -102,44 +129,67 @@ RE_BBOX_VALUE = re.compile(
 )
 
 
-def parse_data(data_elem):
-    decoder = XMLDataDecoder(data_elem)
-    if len(data_elem) == 0:
-        text = data_elem.text
+def parse_text_value(text):
+    """ Classifies the text of a wps:Data element as a bounding box
+        (``1,2,3,4[,crs]``) or a literal value
+        (``value[@datatype=..][@uom=..]``). The regular expressions are only
+        applied when the first character and the separators allow a match.
+    """
+    if not text:
+        return text
+
+    if text[0].isdigit() and ',' in text:
         bbox_match = RE_BBOX_VALUE.match(text)
-        literal_match = RE_LITERAL_VALUE.match(text)
         if bbox_match:
             groups = bbox_match.groups()
-            bbox = [float(v) for v in groups[:4] if v is not None]
-            crs = groups[4]
-            value = BoundingBox(crs, bbox)
-        elif literal_match:
-            raw_value, data_type, uom = literal_match.groups()
-            value = LiteralValue(
-                raw_value.strip(),
-                data_type.strip() if data_type else None,
-                uom.strip() if uom else None
-            )
-        else:
-            value = text
-    elif len(data_elem) == 1:
+            return BoundingBox(groups[4], [
+                float(v) for v in groups[:4] if v is not None
+            ])
+
+    if '@' not in text:
+        return LiteralValue(text.strip(), None, None)
+
+    literal_match = RE_LITERAL_VALUE.match(text)
+    if literal_match:
+        raw_value, data_type, uom = literal_match.groups()
+        return LiteralValue(
+            raw_value.strip(),
+            data_type.strip() if data_type else None,
+            uom.strip() if uom else None
+        )
+    return text
+
+
+def _parse_bounding_box(bbox_elem):
+    lower_corner = upper_corner = None
+    for child in bbox_elem:
+        if child.tag == OWS_LOWER_CORNER:
+            lower_corner = child.text
+        elif child.tag == OWS_UPPER_CORNER:
+            upper_corner = child.text
+    return BoundingBox(
+        bbox_elem.get("crs"),
+        [
+            float(v)
+            for v in lower_corner.split() + upper_corner.split()
+        ]
+    )
+
+
+def parse_data(data_elem):
+    num_children = len(data_elem)
+    if num_children == 0:
+        value = parse_text_value(data_elem.text)
+    elif num_children == 1:
         child = data_elem[0]
-        if child.tag == ns_wps("LiteralValue"):
+        if child.tag == WPS_LITERAL_VALUE:
             value = LiteralValue(
                 child.text,
-                child.attrib.get("dataType"),
-                child.attrib.get("uom")
-            )
-        elif child.tag == ns_ows("BoundingBox"):
-            lower_corner = child.xpath("ows:LowerCorner", namespaces=nsmap)[0].text
-            upper_corner = child.xpath("ows:UpperCorner", namespaces=nsmap)[0].text
-            value = BoundingBox(
-                child.attrib.get("crs"),
-                [
-                    float(v)
-                    for v in lower_corner.split() + upper_corner.split()
-                ]
+                child.get("dataType"),
+                child.get("uom")
             )
+        elif child.tag == OWS_BOUNDING_BOX:
+            value = _parse_bounding_box(child)
         else:
             value = list(data_elem)
     else:
@@ -147,9 +197,9 @@ def parse_data(data_elem):
 
     return Data(
         value=value,
-        mime_type=decoder.mime_type,
-        encoding=decoder.encoding,
-        schema=decoder.schema,
+        mime_type=data_elem.get('mimeType'),
+        encoding=data_elem.get('encoding'),
+        schema=data_elem.get('schema'),
     )
 
 
@@ -173,7 +223,27 @@ class XMLReferenceDecoder(xml.Decoder):
 
 
 def parse_reference(reference_elem):
-    return XMLReferenceDecoder(reference_elem).decode()
+    body = body_reference_href = None
+    num_bodies = 0
+    for child in reference_elem:
+        if child.tag == WPS_BODY:
+            body = parse_reference_body(child)
+            num_bodies += 1
+        elif child.tag == WPS_BODY_REFERENCE:
+            body_reference_href = child.get(XLINK_HREF)
+            num_bodies += 1
+
+    if num_bodies > 1:
+        return XMLReferenceDecoder(reference_elem).decode()
+
+    return Reference(
+        href=reference_elem.get(XLINK_HREF),
+        body=body,
+        body_reference_href=body_reference_href,
+        mime_type=reference_elem.get('mimeType'),
+        encoding=reference_elem.get('encoding'),
+        schema=reference_elem.get('schema'),
+    )
 
 
 class XMLInputDecoder(xml.Decoder):
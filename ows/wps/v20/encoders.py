@@ -25,14 +25,21 @@
 # THE SOFTWARE.
 # ------------------------------------------------------------------------------
 
-from typing import List, Union
+import base64
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Union
+from uuid import uuid4
+
+from lxml import etree
 
 from ows.util import Result, isoformat
+from ows.xml import Element, encode_fragment, stream_element
+from ows.common.types import BoundingBox
 from .namespaces import WPS, ns_xlink
 from .types import (
     DescribeProcessRequest, ExecuteRequest, GetStatusRequest,
     GetResultRequest, DismissRequest, Input, OutputDefinition,
-    Data, Reference
+    Data, Reference, LiteralValue
 )
 from ..types import (
     ServiceCapabilities, ProcessSummary, ProcessDescription,
@@ -43,8 +50,9 @@ from ..types import (
 )
 from ows.common.v20.encoders import (
     OWS, encode_service_provider, encode_service_identification,
-    encode_operations_metadata
+    encode_operations_metadata, encode_bounding_box
 )
+from ..payloads import PAYLOAD_TYPES, DEFAULT_CHUNK_SIZE
 
 
 def kvp_encode_describe_process(request: DescribeProcessRequest, **kwargs):
@@ -268,7 +276,22 @@ def xml_encode_capabilities(capabilities: ServiceCapabilities,
                             include_operations_metadata=True,
                             include_contents=True,
                             **kwargs):
+    root = encode_capabilities(
+        capabilities, include_service_identification,
+        include_service_provider, include_operations_metadata,
+        include_contents,
+    )
+    return Result.from_etree(root, **kwargs)
+
 
+def encode_capabilities(capabilities: ServiceCapabilities,
+                        include_service_identification=True,
+                        include_service_provider=True,
+                        include_operations_metadata=True,
+                        include_contents=True, contents: Element = None):
+    """ Encodes the wps:Capabilities element. ``contents`` replaces the
+        encoded process summaries of the capabilities.
+    """
     sections = []
     if include_service_identification:
         sections.append(
@@ -284,18 +307,16 @@ def xml_encode_capabilities(capabilities: ServiceCapabilities,
         )
     if include_contents:
         sections.append(
-            encode_contents(capabilities)
+            encode_contents(capabilities) if contents is None else contents
         )
 
-    root = WPS('Capabilities',
+    return WPS('Capabilities',
         *sections,
         version="2.0.1",
         service="WPS",
         updateSequence=capabilities.update_sequence
     )
 
-    return Result.from_etree(root, **kwargs)
-
 
 def encode_format(format_: Format, default=False):
     return WPS('Format',
@@ -402,10 +423,14 @@ def encode_process(process_description: ProcessDescription):
     return elem
 
 
+def encode_process_offering(process_description: ProcessDescription):
+    return WPS('ProcessOffering', encode_process(process_description))
+
+
 def xml_encode_process_offerings(process_descriptions: List[ProcessDescription],
                                  **kwargs):
     root = WPS('ProcessOfferings', *[
-        WPS('ProcessOffering', encode_process(process_description))
+        encode_process_offering(process_description)
         for process_description in process_descriptions
     ])
     return Result.from_etree(root, **kwargs)
@@ -429,3 +454,184 @@ def xml_encode_status_info(status_info: StatusInfo, **kwargs):
         ) if status_info.percent_completed else None,
     )
     return Result.from_etree(root, **kwargs)
+
+
+# ------------------------------------------------------------------------------
+# Result
+# ------------------------------------------------------------------------------
+
+BASE64 = 'base64'
+
+
+def _transfer_mode(mime_type: str, encoding: str) -> str:
+    """ How binary output content is put into a wps:Data element: embedded
+        as XML, as escaped text or base64 encoded.
+    """
+    mime_type = (mime_type or '').split(';')[0].strip().lower()
+    if encoding and encoding.lower() == BASE64:
+        return BASE64
+    elif mime_type.endswith(('/xml', '+xml')):
+        return 'xml'
+    elif mime_type.startswith('text/') or mime_type.endswith(('/json', '+json')):
+        return 'text'
+    return BASE64
+
+
+def _iter_base64(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    rest = b''
+    for chunk in chunks:
+        data = rest + chunk if rest else bytes(chunk)
+        # only encode whole groups of three bytes, to not pad in between
+        cut = len(data) - len(data) % 3
+        if cut:
+            yield base64.b64encode(data[:cut])
+        rest = data[cut:]
+    if rest:
+        yield base64.b64encode(rest)
+
+
+def _iter_escaped(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    # the escaped characters are ASCII, so chunks can be split anywhere
+    for chunk in chunks:
+        yield bytes(chunk).replace(b'&', b'&amp;').replace(
+            b'<', b'&lt;'
+        ).replace(b'>', b'&gt;')
+
+
+def _iter_embedded(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    # strip the XML declaration of the embedded document
+    chunks = iter(chunks)
+    head = b''
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= 5 and not head.startswith(b'<?xml') \
+                or b'?>' in head:
+            break
+    if head.startswith(b'<?xml') and b'?>' in head:
+        head = head[head.index(b'?>') + 2:].lstrip()
+    yield head
+    for chunk in chunks:
+        yield chunk
+
+
+def _split_fragment(element: Element, placeholder: Element, nsmap: dict,
+                    encoding: str):
+    marker = uuid4().hex
+    placeholder.text = marker
+    head, tail = encode_fragment(
+        [element], nsmap, encoding
+    ).split(marker.encode(encoding), 1)
+    return head, tail
+
+
+def _encode_output_data(value) -> Element:
+    data = value if isinstance(value, Data) else Data(value)
+    value = data.value
+    if isinstance(value, LiteralValue):
+        content = [WPS('LiteralValue', str(value.value),
+            dataType=value.data_type,
+            uom=value.uom,
+        )]
+    elif isinstance(value, BoundingBox):
+        content = [encode_bounding_box(value)]
+    elif isinstance(value, etree._Element):
+        content = [value]
+    elif isinstance(value, list):
+        content = value
+    else:
+        content = [str(value)]
+    return WPS('Data', *content,
+        mimeType=data.mime_type,
+        encoding=data.encoding,
+        schema=data.schema,
+    )
+
+
+def _iter_encode_output(identifier: str, value: Any, nsmap: dict,
+                        encoding: str, chunk_size: int) -> Iterator[bytes]:
+    if isinstance(value, dict):
+        output = WPS('Output', id=identifier)
+        head, tail = _split_fragment(output, output, nsmap, encoding)
+        yield head
+        for sub_identifier, sub_value in value.items():
+            yield from _iter_encode_output(
+                sub_identifier, sub_value, nsmap, encoding, chunk_size
+            )
+        yield tail
+        return
+
+    if isinstance(value, Reference):
+        yield encode_fragment([
+            WPS('Output', encode_reference(value), id=identifier)
+        ], nsmap, encoding)
+        return
+
+    data = value if isinstance(value, Data) else Data(value)
+    content = data.value
+    if isinstance(content, PAYLOAD_TYPES):
+        mime_type = content.mime_type or data.mime_type
+        content_encoding = content.encoding or data.encoding
+        schema = content.schema or data.schema
+        chunks = content.iter_chunks(chunk_size)
+    elif isinstance(content, (bytes, bytearray, memoryview)):
+        mime_type = data.mime_type
+        content_encoding = data.encoding
+        schema = data.schema
+        chunks = [content]
+    else:
+        yield encode_fragment([
+            WPS('Output', _encode_output_data(data), id=identifier)
+        ], nsmap, encoding)
+        return
+
+    mode = _transfer_mode(mime_type, content_encoding)
+    data_elem = WPS('Data',
+        mimeType=mime_type,
+        encoding=BASE64 if mode == BASE64 else content_encoding,
+        schema=schema,
+    )
+    head, tail = _split_fragment(
+        WPS('Output', data_elem, id=identifier), data_elem, nsmap, encoding
+    )
+    yield head
+    if mode == BASE64:
+        yield from _iter_base64(chunks)
+    elif mode == 'xml':
+        yield from _iter_embedded(chunks)
+    else:
+        yield from _iter_escaped(chunks)
+    yield tail
+
+
+def xml_stream_result(job_id: str, outputs: Dict[str, Any],
+                      expiration_date: datetime = None, encoding='utf-8',
+                      chunk_size=DEFAULT_CHUNK_SIZE, **kwargs):
+    """ Encodes the outputs of a job as a wps:Result document, streaming
+        the binary contents and payloads (see :mod:`ows.wps.payloads`)
+        chunk by chunk. Depending on their mime type and encoding, those are
+        embedded as XML, as escaped text or base64 encoded. Embedded
+        contents must use the encoding of the document.
+
+        Output values may be :class:`Data` or :class:`Reference` objects,
+        literal values, bounding boxes, elements, bytes, payloads or
+        dictionaries of nested outputs.
+    """
+    root = WPS('Result')
+    nsmap = root.nsmap
+
+    def iter_chunks():
+        yield encode_fragment([
+            WPS('JobID', job_id),
+            WPS('ExpirationDate',
+                isoformat(expiration_date)
+            ) if expiration_date else None,
+        ], nsmap, encoding)
+        for identifier, value in outputs.items():
+            yield from _iter_encode_output(
+                identifier, value, nsmap, encoding, chunk_size
+            )
+
+    return Result.from_chunks(
+        stream_element(root, root, iter_chunks(), encoding, **kwargs),
+        content_type='application/xml'
+    )
@@ -0,0 +1,173 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" A cache of the serialized process offerings and summaries of a WPS 2.0
+    service. Process descriptions only change when processes are deployed,
+    so each wps:ProcessOffering and wps:ProcessSummary is encoded once, and
+    DescribeProcess and GetCapabilities responses are concatenations of
+    those fragments.
+"""
+
+import threading
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from ows.util import Result
+from ows.xml import encode_fragment, stream_element
+from ..types import ProcessDescription, ServiceCapabilities
+from ..exceptions import NoSuchProcessException
+from .namespaces import WPS, nsmap
+from .encoders import (
+    encode_capabilities, encode_process_offering, encode_process_summary
+)
+
+
+class ProcessOfferingCache:
+    """ Keeps the encoded offerings and summaries of the processes of a
+        registry. :meth:`update` replaces the registered processes and
+        increments the ``registry_version``. The fragments of processes whose
+        description did not change are kept, all others are encoded again
+        when they are requested. As the fragments are encoded up front,
+        the responses are not pretty printed.
+
+        :param process_descriptions: the initially registered processes
+        :param encoding: the encoding of the fragments and responses
+    """
+
+    def __init__(self, process_descriptions: Iterable[ProcessDescription] = (),
+                 encoding='utf-8'):
+        self.encoding = encoding
+        self.registry_version = 0
+        self._processes: Dict[str, ProcessDescription] = {}
+        # the fragments by process identifier, along with the description
+        # they were encoded from
+        self._offerings: Dict[str, Tuple[ProcessDescription, bytes]] = {}
+        self._summaries: Dict[str, Tuple[ProcessDescription, bytes]] = {}
+        self._lock = threading.Lock()
+        self.update(process_descriptions)
+
+    @property
+    def process_ids(self) -> List[str]:
+        return list(self._processes)
+
+    def update(self, process_descriptions: Iterable[ProcessDescription]):
+        """ Replace the registered processes.
+        """
+        processes = {
+            description.identifier: description
+            for description in process_descriptions
+        }
+        with self._lock:
+            for fragments in (self._offerings, self._summaries):
+                for process_id, (description, fragment) in list(
+                    fragments.items()
+                ):
+                    new_description = processes.get(process_id)
+                    if new_description == description:
+                        fragments[process_id] = (new_description, fragment)
+                    else:
+                        del fragments[process_id]
+            self._processes = processes
+            self.registry_version += 1
+
+    def _fragment(self, fragments: dict, process_id: str,
+                  encode: Callable) -> bytes:
+        try:
+            description = self._processes[process_id]
+        except KeyError:
+            raise NoSuchProcessException(process_id) from None
+
+        cached = fragments.get(process_id)
+        if cached is not None and cached[0] is description:
+            return cached[1]
+
+        fragment = encode_fragment(
+            [encode(description)], nsmap, self.encoding
+        )
+        with self._lock:
+            # the registry may have been updated in the meantime
+            if self._processes.get(process_id) is description:
+                fragments[process_id] = (description, fragment)
+        return fragment
+
+    def offering(self, process_id: str) -> bytes:
+        """ The encoded wps:ProcessOffering of the process.
+        """
+        return self._fragment(
+            self._offerings, process_id, encode_process_offering
+        )
+
+    def summary(self, process_id: str) -> bytes:
+        """ The encoded wps:ProcessSummary of the process.
+        """
+        return self._fragment(
+            self._summaries, process_id, encode_process_summary
+        )
+
+    def xml_encode_process_offerings(self, process_ids: List[str] = None,
+                                     **kwargs) -> Result:
+        """ The DescribeProcess response for the given processes, all
+            registered processes by default. Raises a
+            :class:`NoSuchProcessException` for unknown processes.
+        """
+        if process_ids is None:
+            process_ids = self.process_ids
+        fragments = [self.offering(process_id) for process_id in process_ids]
+        root = WPS('ProcessOfferings')
+        return Result(
+            b''.join(stream_element(
+                root, root, fragments, self.encoding, **kwargs
+            )),
+            content_type='application/xml'
+        )
+
+    def xml_encode_capabilities(self, capabilities: ServiceCapabilities,
+                                include_service_identification=True,
+                                include_service_provider=True,
+                                include_operations_metadata=True,
+                                include_contents=True,
+                                **kwargs) -> Result:
+        """ The GetCapabilities response, with the summaries of the
+            registered processes as contents, instead of the
+            ``process_summaries`` of the capabilities.
+        """
+        contents = WPS('Contents')
+        root = encode_capabilities(
+            capabilities, include_service_identification,
+            include_service_provider, include_operations_metadata,
+            include_contents, contents,
+        )
+        if not include_contents:
+            return Result.from_etree(root, encoding=self.encoding, **kwargs)
+
+        chunks = [self.summary(process_id) for process_id in self.process_ids]
+        return Result(
+            b''.join(stream_element(
+                root, contents, chunks, self.encoding, **kwargs
+            )),
+            content_type='application/xml'
+        )
@@ -25,8 +25,11 @@
 # THE SOFTWARE.
 # -------------------------------------------------------------------------------
 
+import pytest
+
 from ows.common.types import BoundingBox
-from .decoders import xml_decode_execute
+from ows.decoder import DecodingException
+from .decoders import xml_decode_execute, parse_text_value
 from .types import (
     ExecuteRequest, Input, Data, LiteralValue, Reference, OutputDefinition,
     ExecutionMode, ResponseType, TransmissionType
@@ -253,4 +256,73 @@ def test_execute_inputs():
                 transmission=TransmissionType.reference,
             )
         ]
-    )
\ No newline at end of file
+    )
+
+
+@pytest.mark.parametrize('text, expected', [
+    (None, None),
+    ('', ''),
+    ('10.0', LiteralValue('10.0')),
+    ('  abc ', LiteralValue('abc')),
+    ('-1,2', LiteralValue('-1,2')),
+    ('a,b', LiteralValue('a,b')),
+    ('1,2', BoundingBox(None, [1.0, 2.0])),
+    ('1.5,2,3,4,urn:ogc:def:crs:EPSG::4326',
+     BoundingBox('urn:ogc:def:crs:EPSG::4326', [1.5, 2.0, 3.0, 4.0])),
+    ('10@uom=m', LiteralValue('10', None, 'm')),
+    ('@uom=m', '@uom=m'),
+])
+def test_parse_text_value(text, expected):
+    assert parse_text_value(text) == expected
+
+
+xml_execute_nested = b'''<?xml version="1.0" encoding="UTF-8"?>
+<wps:Execute
+    xmlns:wps="http://www.opengis.net/wps/2.0"
+    xmlns:ows="http://www.opengis.net/ows/2.0"
+    xmlns:xlink="http://www.w3.org/1999/xlink"
+    service="WPS" version="2.0.0" response="document" mode="sync">
+    <ows:Identifier>test</ows:Identifier>
+    <wps:Input id="GROUP">
+        <!-- a comment -->
+        <wps:Input id="QUERY">
+            <wps:Reference xlink:href="http://some.data.server/query" mimeType="application/json">
+                <wps:Body>{"a": 1}</wps:Body>
+            </wps:Reference>
+        </wps:Input>
+        <wps:Input id="DATA">
+            <wps:Reference xlink:href="http://some.data.server/data">
+                <wps:BodyReference xlink:href="http://some.data.server/body"/>
+            </wps:Reference>
+        </wps:Input>
+    </wps:Input>
+    <wps:Output id="OUTPUT" transmission="value"/>
+</wps:Execute>'''
+
+
+def test_execute_nested_inputs():
+    request = xml_decode_execute(xml_execute_nested)
+    assert request.inputs == [
+        Input('GROUP', inputs=[
+            Input('QUERY', Reference(
+                'http://some.data.server/query', body='{"a": 1}',
+                mime_type='application/json',
+            )),
+            Input('DATA', Reference(
+                'http://some.data.server/data',
+                body_reference_href='http://some.data.server/body',
+            )),
+        ])
+    ]
+
+
+def test_execute_invalid_input():
+    with pytest.raises(DecodingException):
+        xml_decode_execute(xml_execute_nested.replace(
+            b'<wps:Input id="DATA">', b'<wps:Input>'
+        ))
+    with pytest.raises(DecodingException):
+        xml_decode_execute(xml_execute.replace(
+            b'<wps:Data>10.0</wps:Data>',
+            b'<wps:Data>10.0</wps:Data><wps:Data>11.0</wps:Data>'
+        ))
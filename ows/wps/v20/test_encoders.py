@@ -29,10 +29,18 @@
 
 from textwrap import dedent
 
-from .encoders import xml_encode_execute
+from base64 import b64decode
+from datetime import datetime
+
+from lxml import etree
+
+from ows.util import UTC
+from ows.common.types import BoundingBox
+from ..payloads import IteratorPayload
+from .encoders import xml_encode_execute, xml_stream_result
 from .types import (
     ExecuteRequest, Input, Data, Reference, OutputDefinition,
-    ExecutionMode, ResponseType, TransmissionType
+    ExecutionMode, ResponseType, TransmissionType, LiteralValue
 )
 from ows.test import assert_xml_equal
 
@@ -85,4 +93,73 @@ def test_encode_get_coverage_xml():
             <wps:Output id="BUFFERED_GEOMETRY" transmission="reference"/>
 
         </wps:Execute>'''
-    ))
\ No newline at end of file
+    ))
+
+
+def test_stream_result():
+    binary = bytes(range(256)) * 5
+    outputs = {
+        'DISTANCE': LiteralValue('10.0', uom='m'),
+        'EXTENT': BoundingBox('EPSG:4326', [0.0, 1.0, 2.0, 3.0]),
+        'REPORT': Reference('http://my.wps.server/report.pdf'),
+        'IMAGE': Data(binary, mime_type='image/png'),
+        'GROUP': {
+            'TEXT': IteratorPayload(
+                [b'a < b ', b'&& c > d'], mime_type='text/plain'
+            ),
+            'GEOMETRY': IteratorPayload([
+                b'<?xml version="1.0"?>\n<gml:Point xmlns:gml="http://',
+                b'www.opengis.net/gml"/>',
+            ], mime_type='application/gml+xml'),
+        },
+    }
+    result = xml_stream_result(
+        'abc', outputs, datetime(2026, 1, 1, tzinfo=UTC), chunk_size=100
+    )
+    assert result.content_type == 'application/xml'
+    chunks = list(result.value)
+    assert len(chunks) > 10
+    encoded = b''.join(chunks)
+
+    image = etree.fromstring(encoded).xpath(
+        'wps:Output[@id="IMAGE"]/wps:Data',
+        namespaces={'wps': 'http://www.opengis.net/wps/2.0'}
+    )[0]
+    assert image.attrib['encoding'] == 'base64'
+    assert b64decode(image.text) == binary
+    image.text = None
+
+    assert_xml_equal(etree.tostring(image.getparent().getparent()).decode(), dedent('''\
+        <wps:Result
+            xmlns:wps="http://www.opengis.net/wps/2.0"
+            xmlns:ows="http://www.opengis.net/ows/2.0"
+            xmlns:xlink="http://www.w3.org/1999/xlink">
+            <wps:JobID>abc</wps:JobID>
+            <wps:ExpirationDate>2026-01-01T00:00:00Z</wps:ExpirationDate>
+            <wps:Output id="DISTANCE">
+                <wps:Data><wps:LiteralValue uom="m">10.0</wps:LiteralValue></wps:Data>
+            </wps:Output>
+            <wps:Output id="EXTENT">
+                <wps:Data>
+                    <ows:BoundingBox crs="EPSG:4326" dimension="2">
+                        <ows:LowerCorner>0.0 1.0</ows:LowerCorner>
+                        <ows:UpperCorner>2.0 3.0</ows:UpperCorner>
+                    </ows:BoundingBox>
+                </wps:Data>
+            </wps:Output>
+            <wps:Output id="REPORT">
+                <wps:Reference xlink:href="http://my.wps.server/report.pdf"/>
+            </wps:Output>
+            <wps:Output id="IMAGE">
+                <wps:Data mimeType="image/png" encoding="base64"/>
+            </wps:Output>
+            <wps:Output id="GROUP">
+                <wps:Output id="TEXT">
+                    <wps:Data mimeType="text/plain">a &lt; b &amp;&amp; c &gt; d</wps:Data>
+                </wps:Output>
+                <wps:Output id="GEOMETRY">
+                    <wps:Data mimeType="application/gml+xml"><gml:Point xmlns:gml="http://www.opengis.net/gml"/></wps:Data>
+                </wps:Output>
+            </wps:Output>
+        </wps:Result>'''
+    ))
@@ -0,0 +1,113 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+from dataclasses import replace
+
+import pytest
+
+from ows.util import Version
+from ..types import (
+    ProcessDescription, InputDescription, OutputDescription, Domain, Format,
+    LiteralDataDescription, ComplexDataDescription, ServiceCapabilities
+)
+from ..exceptions import NoSuchProcessException
+from .encoders import xml_encode_process_offerings, xml_encode_capabilities
+from .offerings import ProcessOfferingCache
+
+
+def make_description(identifier, version=Version(1, 0)):
+    return ProcessDescription(
+        identifier, title=f'Process {identifier}', version=version,
+        sync_execute=True, async_execute=True, by_value=True,
+        inputs=[
+            InputDescription('DISTANCE', LiteralDataDescription(
+                [Domain('double', [(0, 100)], uom='m')],
+                [Format('text/plain')]
+            )),
+        ],
+        outputs=[
+            OutputDescription('RESULT', ComplexDataDescription(
+                [Format('application/json')]
+            )),
+        ],
+    )
+
+
+DESCRIPTIONS = [make_description(identifier) for identifier in 'abc']
+
+
+def test_process_offerings():
+    cache = ProcessOfferingCache(DESCRIPTIONS)
+    result = cache.xml_encode_process_offerings(['c', 'a'])
+    assert result.content_type == 'application/xml'
+    assert result.value == xml_encode_process_offerings(
+        [DESCRIPTIONS[2], DESCRIPTIONS[0]], encoding='utf-8'
+    ).value
+    assert cache.xml_encode_process_offerings().value == \
+        xml_encode_process_offerings(DESCRIPTIONS, encoding='utf-8').value
+
+    with pytest.raises(NoSuchProcessException):
+        cache.xml_encode_process_offerings(['a', 'd'])
+
+
+def test_update():
+    cache = ProcessOfferingCache(DESCRIPTIONS)
+    offering_a = cache.offering('a')
+    offering_b = cache.offering('b')
+    assert cache.offering('a') is offering_a
+
+    # a redeployed, equal description keeps its fragment
+    b = make_description('b', Version(1, 1))
+    cache.update([make_description('a'), b])
+    assert cache.registry_version == 2
+    assert cache.process_ids == ['a', 'b']
+    assert cache.offering('a') is offering_a
+    assert cache.offering('b') is not offering_b
+    assert b'processVersion="1.1"' in cache.summary('b')
+    with pytest.raises(NoSuchProcessException):
+        cache.offering('c')
+
+
+def test_capabilities():
+    capabilities = ServiceCapabilities(
+        title='WPS', process_summaries=DESCRIPTIONS
+    )
+    cache = ProcessOfferingCache(DESCRIPTIONS)
+    assert cache.xml_encode_capabilities(capabilities).value == \
+        xml_encode_capabilities(capabilities, encoding='utf-8').value
+
+    # the contents are the registered processes
+    cache.update(DESCRIPTIONS[:1])
+    assert cache.xml_encode_capabilities(capabilities).value == \
+        xml_encode_capabilities(replace(
+            capabilities, process_summaries=DESCRIPTIONS[:1]
+        ), encoding='utf-8').value
+    assert cache.xml_encode_capabilities(
+        capabilities, include_contents=False
+    ).value == xml_encode_capabilities(
+        capabilities, include_contents=False, encoding='utf-8'
+    ).value
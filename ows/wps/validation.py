@@ -0,0 +1,467 @@
+# -------------------------------------------------------------------------------
+#
+# Project: pyows <http://eoxserver.org>
+# Authors: Fabian Schindler <fabian.schindler@eox.at>
+#
+# -------------------------------------------------------------------------------
+# Copyright (C) 2026 EOX IT Services GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies of this Software or works derived from this Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# -------------------------------------------------------------------------------
+
+
+""" Validation of Execute requests against the description of their
+    process. :func:`compile_validator` prepares the checks of a
+    :class:`ProcessDescription` once: allowed literal values are converted
+    to their data type and kept in a set, allowed ranges are merged to
+    sorted, disjoint intervals and the supported CRSs and formats are
+    indexed. Checking a request then raises the appropriate OWS exception
+    before a job is created for it.
+"""
+
+from bisect import bisect_right
+from datetime import date, datetime, time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import iso8601
+from lxml import etree
+
+from ows.util import UTC
+from ows.crs import normalize_crs
+from ows.common.types import BoundingBox
+from .types import (
+    ProcessDescription, InputDescription, OutputDescription, Domain, Format,
+    LiteralDataDescription, BoundingBoxDataDescription
+)
+from .v20.types import (
+    ExecuteRequest, Input, OutputDefinition, Data, LiteralValue
+)
+from .references import MEGABYTE
+from .inputstore import SpooledInput
+from .exceptions import (
+    NoSuchInputException, NoSuchOutputException, NoSuchFormatException,
+    WrongInputDataException, SizeExceededException
+)
+
+
+def data_type_name(data_type: Optional[str]) -> str:
+    """ The local name of a data type, e.g. ``double`` for ``xs:double`` or
+        ``http://www.w3.org/2001/XMLSchema#double``. Literals without a
+        data type are strings.
+    """
+    if not data_type:
+        return 'string'
+    return data_type.rsplit('#', 1)[-1].rsplit(':', 1)[-1]
+
+
+def _integer(low: int = None, high: int = None) -> Callable[[Any], int]:
+    def convert(value) -> int:
+        if isinstance(value, float) and not value.is_integer():
+            raise ValueError(f'{value} is not an integer')
+        converted = int(value)
+        if low is not None and converted < low \
+                or high is not None and converted > high:
+            raise ValueError(f'{value} is out of range')
+        return converted
+    return convert
+
+
+def _boolean(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ('true', '1'):
+        return True
+    elif text in ('false', '0'):
+        return False
+    raise ValueError(f'{value} is not a boolean')
+
+
+def _datetime(value) -> datetime:
+    if not isinstance(value, datetime):
+        value = iso8601.parse_date(str(value).strip())
+    # datetimes without a timezone are assumed to be in UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value
+
+
+def _parsed(type_: type, parse: Callable[[str], Any]) -> Callable[[Any], Any]:
+    def convert(value):
+        if isinstance(value, type_):
+            return value
+        return parse(str(value).strip())
+    return convert
+
+
+# converters of literal values by lower case data type name
+CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    'string': str,
+    'anyuri': str,
+    'double': float,
+    'float': float,
+    'decimal': float,
+    'integer': _integer(),
+    'int': _integer(-2 ** 31, 2 ** 31 - 1),
+    'long': _integer(-2 ** 63, 2 ** 63 - 1),
+    'short': _integer(-2 ** 15, 2 ** 15 - 1),
+    'byte': _integer(-2 ** 7, 2 ** 7 - 1),
+    'nonnegativeinteger': _integer(0),
+    'positiveinteger': _integer(1),
+    'nonpositiveinteger': _integer(None, 0),
+    'negativeinteger': _integer(None, -1),
+    'unsignedint': _integer(0, 2 ** 32 - 1),
+    'boolean': _boolean,
+    'datetime': _datetime,
+    'date': _parsed(date, date.fromisoformat),
+    'time': _parsed(time, time.fromisoformat),
+}
+
+# bounds of the allowed ranges, comparable regardless of open ends
+_UNBOUNDED_LOW = (0,)
+_UNBOUNDED_HIGH = (2,)
+
+
+def _bound(value) -> tuple:
+    return (1, value)
+
+
+class LiteralDomain:
+    """ The compiled allowed values of a :class:`Domain`.
+    """
+
+    def __init__(self, domain: Domain):
+        self.domain = domain
+        self.data_type = data_type_name(domain.data_type)
+        self.convert = CONVERTERS.get(self.data_type.lower(), str)
+        self.any_value = not domain.allowed_values
+
+        values = []
+        ranges = []
+        for allowed in domain.allowed_values or ():
+            if isinstance(allowed, tuple):
+                low, high = allowed
+                ranges.append((
+                    _UNBOUNDED_LOW if low is None
+                    else _bound(self.convert(low)),
+                    _UNBOUNDED_HIGH if high is None
+                    else _bound(self.convert(high)),
+                ))
+            else:
+                values.append(self.convert(allowed))
+        self.values = frozenset(values)
+
+        # merge overlapping ranges, so that a value can only fall into the
+        # interval starting right before it
+        merged = []
+        for low, high in sorted(ranges):
+            if merged and low <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], high)
+            else:
+                merged.append([low, high])
+        self._starts = [low for low, _ in merged]
+        self._stops = [high for _, high in merged]
+
+    def __contains__(self, value) -> bool:
+        """ Whether the (converted) value is allowed.
+        """
+        if self.any_value or value in self.values:
+            return True
+        key = _bound(value)
+        try:
+            index = bisect_right(self._starts, key) - 1
+            return index >= 0 and key <= self._stops[index]
+        except TypeError:
+            return False
+
+
+class _Formats:
+    def __init__(self, formats: List[Format]):
+        self.default = formats[0] if formats else None
+        self.by_mime_type: Dict[str, List[Format]] = {}
+        for format_ in formats:
+            self.by_mime_type.setdefault(
+                (format_.mime_type or '').lower(), []
+            ).append(format_)
+
+    def match(self, identifier: str, data) -> Optional[Format]:
+        """ The format matching the mime type, encoding and schema of the
+            data (or output definition).
+        """
+        if self.default is None or data.mime_type is None:
+            return self.default
+
+        for format_ in self.by_mime_type.get(data.mime_type.lower(), ()):
+            if data.encoding in (None, format_.encoding) \
+                    and data.schema in (None, format_.schema):
+                return format_
+
+        raise NoSuchFormatException(
+            f"Format '{data.mime_type}' is not supported for '{identifier}'",
+            identifier
+        )
+
+
+def _literal_value(identifier: str, value):
+    if isinstance(value, LiteralValue):
+        return value.value, value.data_type, value.uom
+    elif isinstance(value, (str, int, float, bool, date, time)):
+        return value, None, None
+    raise WrongInputDataException(
+        f"Input '{identifier}' is not a literal value", identifier
+    )
+
+
+class _LiteralChecker:
+    def __init__(self, description: LiteralDataDescription):
+        self.domains = [LiteralDomain(domain) for domain in description.domains]
+        self.by_uom = {
+            domain.domain.uom: domain
+            for domain in reversed(self.domains) if domain.domain.uom
+        }
+
+    def __call__(self, identifier: str, value):
+        if not self.domains:
+            return
+
+        raw, data_type, uom = _literal_value(identifier, value)
+        if uom is None:
+            domain = self.domains[0]
+        else:
+            try:
+                domain = self.by_uom[uom]
+            except KeyError:
+                raise WrongInputDataException(
+                    f"Unit '{uom}' is not supported for '{identifier}'",
+                    identifier
+                ) from None
+
+        if data_type is not None and \
+                data_type_name(data_type).lower() != domain.data_type.lower():
+            raise WrongInputDataException(
+                f"Input '{identifier}' must be of type '{domain.data_type}'",
+                identifier
+            )
+
+        try:
+            converted = domain.convert(raw)
+        except (TypeError, ValueError) as exc:
+            raise WrongInputDataException(
+                f"Invalid {domain.data_type} value {raw!r} for "
+                f"'{identifier}'", identifier
+            ) from exc
+
+        if converted not in domain:
+            raise WrongInputDataException(
+                f"Value {raw!r} is not allowed for '{identifier}'", identifier
+            )
+
+
+class _BoundingBoxChecker:
+    def __init__(self, description: BoundingBoxDataDescription):
+        self.crss = frozenset(
+            normalize_crs(crs) or crs for crs in description.supported_crss
+        )
+
+    def __call__(self, identifier: str, value):
+        if not isinstance(value, BoundingBox):
+            raise WrongInputDataException(
+                f"Input '{identifier}' is not a bounding box", identifier
+            )
+
+        crs = value.crs
+        if crs is not None and self.crss \
+                and (normalize_crs(crs) or crs) not in self.crss:
+            raise WrongInputDataException(
+                f"CRS '{crs}' is not supported for '{identifier}'", identifier
+            )
+
+        bbox = value.bbox
+        half = len(bbox) // 2
+        if not bbox or len(bbox) % 2 or any(
+            low > high for low, high in zip(bbox[:half], bbox[half:])
+        ):
+            raise WrongInputDataException(
+                f"Invalid bounding box for '{identifier}'", identifier
+            )
+
+
+def _xml_size(value, limit: float) -> int:
+    """ The size of the serialized elements, as far as necessary to exceed
+        the limit.
+    """
+    elements = value if isinstance(value, list) else [value]
+    size = 0
+    for element in elements:
+        if isinstance(element, etree._Element):
+            size += len(etree.tostring(
+                element, encoding='utf-8', xml_declaration=False,
+                with_tail=False,
+            ))
+            if size > limit:
+                break
+    return size
+
+
+def _check_size(identifier: str, value, format_: Optional[Format]):
+    if format_ is None or not format_.maxmimum_megabytes:
+        return
+    limit = format_.maxmimum_megabytes * MEGABYTE
+    if isinstance(value, str):
+        # only encode the value when its encoded size may differ
+        size = len(value) if value.isascii() else len(value.encode('utf-8'))
+    elif isinstance(value, (bytes, bytearray)):
+        size = len(value)
+    elif isinstance(value, SpooledInput):
+        size = value.size
+    elif isinstance(value, (etree._Element, list)):
+        # inline XML data, decoded as a list of elements
+        size = _xml_size(value, limit)
+    else:
+        return
+
+    if size > limit:
+        raise SizeExceededException(
+            f"Input '{identifier}' exceeds the maximum size of "
+            f"{format_.maxmimum_megabytes} MB", identifier
+        )
+
+
+class _InputChecker:
+    def __init__(self, description: InputDescription):
+        self.identifier = description.identifier
+        data_description = description.data_description
+        self.formats = _Formats(
+            data_description.formats if data_description else []
+        )
+        if isinstance(data_description, LiteralDataDescription):
+            self.check_value = _LiteralChecker(data_description)
+        elif isinstance(data_description, BoundingBoxDataDescription):
+            self.check_value = _BoundingBoxChecker(data_description)
+        else:
+            self.check_value = None
+        self.inputs = _compile_inputs(
+            description.inputs
+        ) if description.inputs else None
+        self.has_data = data_description is not None
+
+    def __call__(self, input_: Input):
+        identifier = self.identifier
+        if input_.inputs:
+            if self.inputs is None:
+                raise WrongInputDataException(
+                    f"Input '{identifier}' has no nested inputs", identifier
+                )
+            _check_inputs(self.inputs, input_.inputs)
+            return
+
+        if not self.has_data:
+            raise WrongInputDataException(
+                f"Input '{identifier}' requires nested inputs", identifier
+            )
+
+        data = input_.data
+        format_ = self.formats.match(identifier, data)
+        # the content of references is only checked when it is retrieved
+        if isinstance(data, Data):
+            _check_size(identifier, data.value, format_)
+            if self.check_value is not None:
+                self.check_value(identifier, data.value)
+
+
+def _compile_inputs(descriptions: List[InputDescription]) \
+        -> Dict[str, _InputChecker]:
+    return {
+        description.identifier: _InputChecker(description)
+        for description in descriptions
+    }
+
+
+def _check_inputs(checkers: Dict[str, _InputChecker], inputs: List[Input]):
+    for input_ in inputs or ():
+        try:
+            checker = checkers[input_.identifier]
+        except KeyError:
+            raise NoSuchInputException(input_.identifier) from None
+        checker(input_)
+
+
+class _OutputChecker:
+    def __init__(self, description: OutputDescription):
+        data_description = description.data_description
+        self.formats = _Formats(
+            data_description.formats if data_description else []
+        )
+        self.outputs = _compile_outputs(description.outputs)
+
+
+def _compile_outputs(descriptions: List[OutputDescription]) \
+        -> Dict[str, _OutputChecker]:
+    return {
+        description.identifier: _OutputChecker(description)
+        for description in descriptions
+    }
+
+
+def _check_outputs(checkers: Dict[str, _OutputChecker],
+                   output_definitions: List[OutputDefinition]):
+    for output in output_definitions or ():
+        try:
+            checker = checkers[output.identifier]
+        except KeyError:
+            raise NoSuchOutputException(output.identifier) from None
+        checker.formats.match(output.identifier, output)
+        _check_outputs(checker.outputs, output.output_definitions)
+
+
+class ProcessValidator:
+    """ Checks the inputs and output definitions of Execute requests
+        against a :class:`ProcessDescription`: the identifiers, formats and
+        sizes of the inputs, literal values against the allowed values of
+        their domain (selected by the unit of measure) and the CRS of
+        bounding boxes.
+    """
+
+    def __init__(self, process_description: ProcessDescription):
+        self.process_id = process_description.identifier
+        self._inputs = _compile_inputs(process_description.inputs)
+        self._outputs = _compile_outputs(process_description.outputs)
+
+    def validate(self, request: ExecuteRequest):
+        """ Raises the OWS exception for the first invalid input or output
+            definition of the request.
+        """
+        _check_inputs(self._inputs, request.inputs)
+        _check_outputs(self._outputs, request.output_definitions)
+
+
+def compile_validator(process_description: ProcessDescription) \
+        -> ProcessValidator:
+    return ProcessValidator(process_description)
+
+
+def compile_validators(process_descriptions: Iterable[ProcessDescription]) \
+        -> Dict[str, ProcessValidator]:
+    """ Compiles the validators of the processes by their identifier, for
+        example to pass them to the :class:`ows.wps.jobs.JobManager`.
+    """
+    return {
+        description.identifier: ProcessValidator(description)
+        for description in process_descriptions
+    }
@@ -28,7 +28,8 @@
 """ This module contains facilities to help decoding XML structures.
 """
 
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Union, Iterable, Iterator
+from uuid import uuid4
 
 from lxml import etree
 from lxml.builder import ElementMaker as _ElementMaker
@@ -131,6 +132,62 @@ class NameSpaceMap(dict):
 ns_xsi = NameSpace("http://www.w3.org/2001/XMLSchema-instance", "xsi")
 
 
+def stream_element(root: Element, placeholder: Element,
+                   chunks: Iterable[bytes], encoding='utf-8',
+                   **kwargs) -> Iterator[bytes]:
+    ''' Serializes the given element tree, but streams the already encoded
+        chunks as the contents of the ``placeholder`` element. This allows to
+        produce large documents without building them completely in memory.
+        The chunks must only use namespace prefixes that are declared on the
+        ``root`` element.
+
+        :param root: the root element to serialize
+        :param placeholder: an empty descendant element of ``root`` which
+                            receives the chunks as content
+        :param chunks: an iterable of encoded XML fragments
+        :param encoding: the encoding of the output and the chunks
+        :param kwargs: additional arguments passed to
+                       :func:`lxml.etree.tostring`
+        :returns: an iterator of encoded byte strings
+    '''
+    marker = uuid4().hex
+    placeholder.text = marker
+    try:
+        head, tail = etree.tostring(
+            root, encoding=encoding, **kwargs
+        ).split(marker.encode(encoding), 1)
+    finally:
+        placeholder.text = None
+
+    yield head
+    yield from chunks
+    yield tail
+
+
+def encode_fragment(elements: Iterable[Optional[Element]], nsmap: dict,
+                    encoding='utf-8') -> bytes:
+    ''' Serializes the given elements as a sequence of sibling elements,
+        without re-declaring the namespaces of ``nsmap``. The result can
+        be used as a chunk for :func:`stream_element`, when ``nsmap`` is
+        declared on its root. None values are skipped.
+
+        :param elements: the elements to serialize. They are moved to a
+                         temporary parent element.
+        :param nsmap: the namespaces in scope of the fragment
+        :param encoding: the encoding of the output, which must be ASCII
+                         compatible
+        :returns: the encoded fragment
+    '''
+    holder = etree.Element('fragment', nsmap=nsmap)
+    holder.extend(element for element in elements if element is not None)
+    if not len(holder):
+        return b''
+
+    encoded = etree.tostring(holder, encoding=encoding, xml_declaration=False)
+    # the namespace URIs in the start tag have any '>' escaped
+    return encoded[encoded.index(b'>') + 1:-len(b'</fragment>')]
+
+
 class Parameter(BaseParameter):
     """ Parameter for XML values.
 
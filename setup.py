@@ -71,6 +71,10 @@ setup(
     packages=find_packages(),
     package_dir={'static': 'static'},
     install_requires=install_requires,
+    extras_require={
+        'numpy': ['numpy'],
+        'aiohttp': ['aiohttp'],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',